@@ -24,6 +24,8 @@ from ...model import (
     Fingerprint,
     FullFingerprint,
     IRI,
+    Item,
+    Lexeme,
     NoValueSnak,
     OrFingerprint,
     PathFingerprint,
@@ -422,20 +424,23 @@ class SPARQL_FilterCompiler(SPARQL_Compiler):
             self,
             patterns: Sequence[SPARQL_Mapping.EntryPattern]
     ) -> None:
-        it_match_funcs = (
-            (entry, functools.partial(
-                entry.match_and_preprocess, self.mapping, self,
-                term2arg=self._term2arg)) for entry in sorted(
-                    self.mapping,
-                    key=SPARQL_Mapping._mk_entry.get_priority,
-                    reverse=True))
-        it_patterns = (
-            pat.generalize(rename=self._fresh_name_generator())
-            for pat in patterns)
+        ###
+        # Collect, for each entry, the patterns that may match it as given
+        # by the entry index.  Only these (entry, pattern) pairs are tried;
+        # entries are tried in order of priority.
+        ###
+        index = self.mapping.entry_index
+        candidates: dict[int, list[SPARQL_Mapping.EntryPattern]] = {}
+        for pat in patterns:
+            pat = pat.generalize(rename=self._fresh_name_generator())
+            for i in index.lookup(pat):
+                candidates.setdefault(i, []).append(pat)
+        entries = index.entries
         matches = filter(
             lambda t: t[1] and t[1][0], (  # filter out empty targets
-                (e, f(p)) for (e, f), p in itertools.product(
-                    it_match_funcs, it_patterns)))
+                (entries[i], entries[i].match_and_preprocess(
+                    self.mapping, self, pat, term2arg=self._term2arg))
+                for i in sorted(candidates) for pat in candidates[i]))
         for batch in filter(bool, itertools.divide(self.omega, matches)):
             query = self.push_query()
             query_entries = cast(
@@ -710,7 +715,18 @@ class SPARQL_FilterCompiler(SPARQL_Compiler):
         snaks, values = map(list, itertools.partition(
             ValueFingerprint.test, atoms))
         if isinstance(fp, AndFingerprint):
-            for child in itertools.chain(snaks, comps):
+            if isinstance(value, (Entity, EntityTemplate, EntityVariable)):
+                for group in self._group_snak_fps(snaks):
+                    if len(group) == 1:
+                        self._push_fp(entry, group[0], value)
+                    else:
+                        with self.q.group():
+                            self._push_snak_fps(
+                                entry, group, value, conjunctive=True)
+            else:
+                for child in snaks:
+                    self._push_fp(entry, child, value)
+            for child in comps:
                 self._push_fp(entry, child, value)
             if values:
                 try:
@@ -721,13 +737,13 @@ class SPARQL_FilterCompiler(SPARQL_Compiler):
         elif isinstance(fp, OrFingerprint):
             with self.q.union() as cup:
                 if isinstance(value, (Entity, EntityTemplate, EntityVariable)):
-                    for snak_fp in snaks:
-                        ###
-                        # TODO: Aggregate snaks with the same property.
-                        ###
+                    for group in self._group_snak_fps(snaks):
                         try:
                             with self.q.group():
-                                self._push_snak_fp(entry, snak_fp, value)
+                                if len(group) == 1:
+                                    self._push_snak_fp(entry, group[0], value)
+                                else:
+                                    self._push_snak_fps(entry, group, value)
                         except SPARQL_Mapping.Skip:
                             continue
                 for child in comps:
@@ -747,6 +763,70 @@ class SPARQL_FilterCompiler(SPARQL_Compiler):
         else:
             raise self._should_not_get_here()
 
+    def _group_snak_fps(
+            self,
+            fps: Iterable[SnakFingerprint]
+    ) -> Iterator[Sequence[SnakFingerprint]]:
+        ###
+        # Groups the (non-converse) snak fingerprints whose snaks have the
+        # same property and whose values are items or lexemes, i.e., those
+        # that can be aggregated into a single graph pattern.
+        ###
+        groups: dict[Any, list[SnakFingerprint]] = {}
+        for fp in fps:
+            key: Any
+            if (not isinstance(fp, ConverseSnakFingerprint)
+                    and isinstance(fp.snak, ValueSnak)
+                    and isinstance(fp.snak.value, (Item, Lexeme))):
+                key = (fp.snak.property, type(fp.snak.value))
+            else:
+                key = object()  # cannot be aggregated
+            groups.setdefault(key, []).append(fp)
+        return iter(groups.values())
+
+    def _push_snak_fps(
+            self,
+            entry: SPARQL_Mapping.Entry,
+            fps: Sequence[SnakFingerprint],
+            entity: VEntity,
+            conjunctive: bool = False
+    ) -> None:
+        ###
+        # Pushes `p(v1) | ... | p(vn)` as a single graph pattern `p(x)`
+        # followed by the clause `VALUES x {v1 ... vn}`.
+        #
+        # If `conjunctive` is true, pushes `p(v1) & ... & p(vn)` as the
+        # graph pattern `p(v1)` followed by the clause
+        #
+        #   FILTER NOT EXISTS {
+        #     VALUES ?k {0 ... n-2}
+        #     FILTER NOT EXISTS {p(x) VALUES (x ?k) {(v2 0) ... (vn n-2)}}}
+        #
+        # i.e., there is no vi (i > 1) such that p(vi) does not hold.  The
+        # two VALUES clauses are linked by the index ?k, not by x, as each
+        # target entry may encode the values differently.  The pattern
+        # `p(v1)` binds the entity in the scope of the filter.
+        ###
+        assert len(fps) > 1
+        snaks = [cast(ValueSnak, fp.snak) for fp in fps]
+        values = list(dict.fromkeys(snak.value for snak in snaks))
+        var = self.fresh_var(type(values[0]).variable_class)
+        assert isinstance(var, EntityVariable), var
+        stmt = snaks[0].property(entity, var)
+        if not conjunctive:
+            return self._push_snak_fp_tail(entry, entity, stmt, values)
+        self._push_snak_fp_tail(
+            entry, entity, snaks[0].property(entity, values[0]))
+        if len(values) == 1:
+            return              # nothing else to do
+        index = self.fresh_qvar()
+        with self.q.filter_not_exists():
+            self.q.values(index)(*(
+                (self.literal(i),) for i in range(len(values) - 1)))
+            with self.q.filter_not_exists():
+                self._push_snak_fp_tail(
+                    entry, entity, stmt, values[1:], index)
+
     def _push_path_fp(
             self,
             entry: SPARQL_Mapping.Entry,
@@ -793,7 +873,9 @@ class SPARQL_FilterCompiler(SPARQL_Compiler):
             self,
             entry: SPARQL_Mapping.Entry,
             entity: VEntity,
-            stmt: Statement | StatementTemplate
+            stmt: Statement | StatementTemplate,
+            values: Sequence[Value] | None = None,
+            index: Query.Variable | None = None
     ) -> None:
         stmt = stmt.generalize(rename=self._fresh_name_generator())
         with self.q.union() as cup:
@@ -820,8 +902,21 @@ class SPARQL_FilterCompiler(SPARQL_Compiler):
                     assert isinstance(kwargs[src], Query.Variable)
                     tgt = next(entity._iterate_variables()).name
                     kwargs[src] = Query.Variable(tgt)  # type: ignore
+                fixed = False
+                if values is not None:
+                    target = targets[0]
+                    assert isinstance(target, (Statement, StatementTemplate))
+                    if isinstance(target.snak, ValueSnak):
+                        ###
+                        # The entry fixes the value, so there is nothing to
+                        # aggregate.
+                        ###
+                        if target.snak.value not in values:
+                            continue
+                        fixed = True
                 if (isinstance(stmt.snak, ValueSnakTemplate)
-                        and isinstance(stmt.snak.value, EntityVariable)):
+                        and isinstance(stmt.snak.value, EntityVariable)
+                        and not fixed):
                     ###
                     # HACK: Here we monkey-patch `kwargs` so that the
                     # source/target variables of property chains are matched
@@ -842,6 +937,18 @@ class SPARQL_FilterCompiler(SPARQL_Compiler):
                 try:
                     with self.q.group():
                         target_entry.callback(self.mapping, self, **kwargs)
+                        if values is not None and not fixed:
+                            self._push_snak_fp_tail_values(
+                                target_entry, targets[0], kwargs, values,
+                                index)
+                        elif fixed and index is not None:
+                            assert values is not None
+                            target = targets[0]
+                            assert isinstance(
+                                target, (Statement, StatementTemplate))
+                            assert isinstance(target.snak, ValueSnak)
+                            self.q.values(index)((self.literal(
+                                values.index(target.snak.value)),))
                 except self.mapping.Skip:
                     continue
                 finally:
@@ -849,6 +956,42 @@ class SPARQL_FilterCompiler(SPARQL_Compiler):
             if not cup.children:
                 raise self.mapping.Skip
 
+    def _push_snak_fp_tail_values(
+            self,
+            entry: SPARQL_Mapping.Entry,
+            target: VStatement,
+            kwargs: Mapping[str, SPARQL_Mapping.EntryCallbackArg],
+            values: Sequence[Value],
+            index: Query.Variable | None = None
+    ) -> None:
+        assert isinstance(target, StatementTemplate)
+        assert isinstance(target.snak, ValueSnakTemplate)
+        (var,) = target.snak.value.variables
+        qvar = kwargs[var.name]
+        assert isinstance(qvar, Query.Variable)
+        rows: list[tuple[Query.URI | Query.Literal, ...]] = []
+        for i, value in enumerate(values):
+            theta = target.snak.value.match(value)
+            if theta is None or theta.get(var) is None:
+                continue
+            try:
+                qval = entry.preprocess(
+                    self.mapping, self, var,
+                    self._term2arg(cast(Term, theta[var])))
+            except SPARQL_Mapping.Skip:
+                continue
+            assert isinstance(qval, (Query.URI, Query.Literal))
+            if index is None:
+                rows.append((qval,))
+            else:
+                rows.append((qval, self.literal(i)))
+        if not rows:
+            raise SPARQL_Mapping.Skip
+        if index is None:
+            self.q.values(qvar)(*rows)
+        else:
+            self.q.values(qvar, index)(*rows)
+
     def _push_value_fps(
             self,
             entry: SPARQL_Mapping.Entry,
@@ -38,6 +38,10 @@ class FactGridMapping(WikidataMapping):
 
     _default_subtype = FactGrid.WDT.P420 * '+'  # type: ignore
 
+    _default_type_edge = FactGrid.WDT.P2
+
+    _default_subtype_edge = FactGrid.WDT.P420
+
     _re_item_uri = re.compile(
         f'^{re.escape(FactGrid.WD)}Q[1-9][0-9]*$')
 
@@ -434,6 +434,153 @@ class _Entry:
                 SPARQL_Mapping.EntryCallback, callback))
 
 
+class _EntryIndex:
+    """Index of SPARQL mapping entries.
+
+    Summarizes each entry pattern by the class of its statement, subject,
+    snak, property, and value, and by the IRI of its property (if fixed).
+    A pattern can only match an entry pattern whose summary agrees with its
+    own, so the index can be used to skip entries whose match is bound to
+    fail.
+
+    Parameters:
+       entries: Entries.
+    """
+
+    #: The type of the summary of a node: a triple "(is-variable,
+    #: object-class, closed-term)" or ``None`` (unknown).
+    Node: TypeAlias = Optional[tuple[bool, type[KIF_Object], Optional[Term]]]
+
+    #: The type of the summary of a pattern.
+    Signature: TypeAlias = tuple[Node, ...]
+
+    #: Paths of the summarized nodes: statement, subject, snak, property,
+    #: property IRI, and value.
+    _paths: ClassVar[Sequence[Sequence[int]]] = (
+        (), (0,), (1,), (1, 0), (1, 0, 0), (1, 1))
+
+    #: Index of the property IRI in signatures.
+    _iri: ClassVar[int] = 4
+
+    __slots__ = (
+        '_by_iri',
+        '_entries',
+        '_signatures',
+        '_unknown_iri',
+    )
+
+    #: Entries sorted by priority (highest first).
+    _entries: Sequence[_Entry]
+
+    #: Signatures of the patterns of each entry.
+    _signatures: Sequence[Sequence[Signature]]
+
+    #: Positions of the entries indexed by the IRI of their properties.
+    _by_iri: Mapping[Term, Sequence[int]]
+
+    #: Positions of the entries whose property IRIs are not fixed.
+    _unknown_iri: Sequence[int]
+
+    def __init__(self, entries: Iterable[_Entry]) -> None:
+        self._entries = tuple(sorted(
+            entries, key=_Entry.get_priority, reverse=True))
+        self._signatures = tuple(
+            tuple(map(self._get_signature, entry.patterns))
+            for entry in self._entries)
+        by_iri: dict[Term, list[int]] = {}
+        unknown_iri: list[int] = []
+        for i, sigs in enumerate(self._signatures):
+            iris = {node[2] if node is not None else None
+                    for node in (sig[self._iri] for sig in sigs)}
+            if None in iris:
+                unknown_iri.append(i)
+            else:
+                for iri in iris:
+                    by_iri.setdefault(cast(Term, iri), []).append(i)
+        self._by_iri = by_iri
+        self._unknown_iri = unknown_iri
+
+    @property
+    def entries(self) -> Sequence[_Entry]:
+        """The indexed entries sorted by priority (highest first)."""
+        return self.get_entries()
+
+    def get_entries(self) -> Sequence[_Entry]:
+        """Gets the indexed entries sorted by priority (highest first).
+
+        Returns:
+           Entries.
+        """
+        return self._entries
+
+    def lookup(self, pattern: SPARQL_Mapping.EntryPattern) -> Set[int]:
+        """Gets the positions in :attr:`entries` of the entries which
+        `pattern` may match.
+
+        Parameters:
+           pattern: Statement, statement template, or statement variable.
+
+        Returns:
+           Set of entry positions.
+        """
+        sig = self._get_signature(pattern)
+        iri = sig[self._iri]
+        it: Iterable[int]
+        if iri is not None and iri[2] is not None:
+            it = itertools.chain(
+                self._by_iri.get(iri[2], ()), self._unknown_iri)
+        else:
+            it = range(len(self._entries))
+        return frozenset(filter(lambda i: any(
+            map(functools.partial(self._check_signatures, sig),
+                self._signatures[i])), it))
+
+    @classmethod
+    def _get_signature(cls, pattern: SPARQL_Mapping.EntryPattern) -> Signature:
+        return tuple(cls._get_node(pattern, path) for path in cls._paths)
+
+    @classmethod
+    def _get_node(cls, term: Any, path: Sequence[int]) -> Node:
+        for i in path:
+            if (not isinstance(term, Term) or isinstance(term, Variable)
+                    or i >= len(term.args)):
+                return None     # unknown
+            term = term.args[i]
+        if isinstance(term, Variable):
+            return (True, term.object_class, None)
+        elif isinstance(term, Template):
+            return (False, term.object_class, None)
+        elif isinstance(term, Term):
+            return (False, type(term), term)
+        else:
+            return None         # unknown
+
+    @classmethod
+    def _check_signatures(cls, sig1: Signature, sig2: Signature) -> bool:
+        return all(map(cls._check_nodes, sig1, sig2))
+
+    @classmethod
+    def _check_nodes(cls, node1: Node, node2: Node) -> bool:
+        ###
+        # IMPORTANT: This must be a necessary condition for the unification
+        # of the corresponding (sub)terms.
+        ###
+        if node1 is None or node2 is None:
+            return True
+        var1, cls1, term1 = node1
+        var2, cls2, term2 = node2
+        if var1 and var2:
+            return issubclass(cls1, cls2) or issubclass(cls2, cls1)
+        elif var1:
+            return issubclass(cls2, cls1)
+        elif var2:
+            return issubclass(cls1, cls2)
+        elif cls1 is not cls2:
+            return False
+        else:
+            return term1 is None or term2 is None or term1 == term2
+
+
 class SPARQL_Mapping(Sequence[_Entry]):
     """SPARQL mapping."""
 
@@ -443,6 +590,9 @@ class SPARQL_Mapping(Sequence[_Entry]):
     #: The type of SPARQL mapping entries.
     Entry: TypeAlias = _Entry
 
+    #: The type of SPARQL mapping entry indexes.
+    EntryIndex: TypeAlias = _EntryIndex
+
     #: The type of entry ids.
     EntryId: TypeAlias = int
 
@@ -996,6 +1146,24 @@ class SPARQL_Mapping(Sequence[_Entry]):
     def __len__(self) -> int:
         return len(self._entries)
 
+    @property
+    def entry_index(self) -> EntryIndex:
+        """The index of the entries of SPARQL mapping."""
+        return self.get_entry_index()
+
+    def get_entry_index(self) -> EntryIndex:
+        """Gets the index of the entries of SPARQL mapping.
+
+        Returns:
+           Entry index.
+        """
+        return self._get_entry_index_cached(len(self._entries))
+
+    @classmethod
+    @functools.cache
+    def _get_entry_index_cached(cls, n: int) -> EntryIndex:
+        return cls.EntryIndex(cls._entries[:n])
+
     def frame_pushed(
             self,
             compiler: Compiler,
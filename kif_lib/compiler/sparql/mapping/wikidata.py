@@ -3,9 +3,13 @@
 
 from __future__ import annotations
 
+import collections
 import re
+import threading
+import time
+from typing import TYPE_CHECKING
 
-from .... import functools
+from .... import functools, itertools
 from ....context import Context
 from ....model import (
     AliasProperty,
@@ -28,6 +32,7 @@ from ....model import (
     LexicalCategoryProperty,
     Normal,
     NoValueSnak,
+    OrFingerprint,
     Property,
     PropertyDatatype,
     QualifierRecord,
@@ -66,12 +71,14 @@ from ....namespace import (
 )
 from ....typing import (
     Any,
+    Callable,
     cast,
     ClassVar,
     Iterable,
     Iterator,
     Optional,
     override,
+    Sequence,
     TypeAlias,
     TypedDict,
     Union,
@@ -81,6 +88,9 @@ from ..results import SPARQL_ResultsBinding
 from .mapping import SPARQL_Mapping as M
 from .wikidata_options import WikidataMappingOptions
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ....store import Store
+
 __all__ = (
     'WikidataMapping',
 )
@@ -118,6 +128,8 @@ class WikidataMapping(M):
        use_schema: Whether to use the registered property schemas.
        type: Expression for matching :class:`TypeProperty`.
        subtype: Expression for matching from :class:`SubtypeProperty`.
+       class_hierarchy: Class hierarchy cache to be used for matching
+          :class:`TypeProperty` and :class:`SubtypeProperty`.
     """
 
     _default_type: ClassVar[Path] =\
@@ -125,6 +137,22 @@ class WikidataMapping(M):
 
     _default_subtype: ClassVar[Path] = Wikidata.WDT.P279 * '+'  # type: ignore
 
+    _default_type_edge: ClassVar[URI] = Wikidata.WDT.P31
+
+    _default_subtype_edge: ClassVar[URI] = Wikidata.WDT.P279
+
+    #: Datatype masks of the property types whose truthy (wdt) values
+    #: coincide with their statement (ps) values.
+    _truthy_datatype_mask: ClassVar[dict[URI, Filter.DatatypeMask]] = {
+        WIKIBASE.WikibaseItem: Filter.ITEM,
+        WIKIBASE.WikibaseProperty: Filter.PROPERTY,
+        WIKIBASE.WikibaseLexeme: Filter.LEXEME,
+        WIKIBASE.Url: Filter.IRI,
+        WIKIBASE.Monolingualtext: Filter.TEXT,
+        WIKIBASE.String: Filter.STRING,
+        WIKIBASE.ExternalId: Filter.EXTERNAL_ID,
+    }
+
     _re_item_uri: ClassVar[re.Pattern] = re.compile(
         f'^{re.escape(Wikidata.WD)}Q[1-9][0-9]*$')
 
@@ -191,6 +219,198 @@ class WikidataMapping(M):
         def __call__(self, m: M, c: C, arg: Arg) -> Arg:
             return URI(str(super().__call__(m, c, arg)))
 
+    class ClassHierarchy:
+        """Class hierarchy cache.
+
+        Maps classes to their closures, i.e., to the set consisting of the
+        class itself plus its direct and indirect subclasses.  Closures are
+        computed on demand, breadth-first, by calling `subclasses` on
+        batches of classes, and are kept until they expire (see `ttl`) or
+        are evicted to make room for others (see `max_size`).
+
+        Parameters:
+           subclasses: Function that given a batch of class URIs returns
+              the URIs of their direct subclasses.
+           batch_size: Maximum number of classes per call to `subclasses`.
+           max_closure_size: Maximum number of classes in a closure (larger
+              closures are not used).
+           max_size: Maximum number of classes kept in cache.
+           ttl: Time-to-live of closures (in seconds).
+        """
+
+        #: The default batch size.
+        DEFAULT_BATCH_SIZE: ClassVar[int] = 256
+
+        #: The default maximum closure size.
+        DEFAULT_MAX_CLOSURE_SIZE: ClassVar[int] = 4096
+
+        #: The default maximum cache size.
+        DEFAULT_MAX_SIZE: ClassVar[int] = 1000000
+
+        #: Type alias for cache entries (timestamp and closure).
+        Entry: TypeAlias = tuple[float, Optional[frozenset[URI]]]
+
+        __slots__ = (
+            '_batch_size',
+            '_cache',
+            '_lock',
+            '_max_closure_size',
+            '_max_size',
+            '_size',
+            '_subclasses',
+            '_ttl',
+        )
+
+        #: Function to get the direct subclasses of classes.
+        _subclasses: Callable[[Sequence[URI]], Iterable[URI]]
+
+        #: Maximum number of classes per call to subclasses.
+        _batch_size: int
+
+        #: Maximum number of classes in a closure.
+        _max_closure_size: int
+
+        #: Maximum number of classes in cache.
+        _max_size: int
+
+        #: Time-to-live of closures (in seconds).
+        _ttl: float | None
+
+        #: Cached closures (in least-recently used order).
+        _cache: collections.OrderedDict[URI, Entry]
+
+        #: Number of classes in cache.
+        _size: int
+
+        #: Lock to sync access to cache.
+        _lock: threading.Lock
+
+        @classmethod
+        def from_edges(
+                cls,
+                edges: Iterable[tuple[URI | str, URI | str]],
+                **kwargs: Any
+        ) -> WikidataMapping.ClassHierarchy:
+            """Creates class hierarchy cache from subclass-of edges.
+
+            Parameters:
+               edges: Pairs (subclass, class), e.g., from a local dump.
+               kwargs: Other keyword arguments.
+
+            Returns:
+               Class hierarchy cache.
+            """
+            index: dict[URI, list[URI]] = {}
+            for sub, sup in edges:
+                index.setdefault(URI(sup), []).append(URI(sub))
+            return cls(lambda batch: itertools.chain.from_iterable(
+                map(lambda uri: index.get(uri, ()), batch)), **kwargs)
+
+        @classmethod
+        def from_store(
+                cls,
+                store: Store,
+                property: Property | None = None,
+                **kwargs: Any
+        ) -> WikidataMapping.ClassHierarchy:
+            """Creates class hierarchy cache from store.
+
+            The subclasses of each batch of classes are obtained by a
+            single filter call over `store`.
+
+            Parameters:
+               store: Store.
+               property: Subclass-of property (defaults to P279).
+               kwargs: Other keyword arguments.
+
+            Returns:
+               Class hierarchy cache.
+            """
+            if property is None:
+                property = Property(Wikidata.WD.P279)
+
+            def subclasses(batch: Sequence[URI]) -> Iterator[URI]:
+                for sub in store.filter_s(
+                        property=property,
+                        value=OrFingerprint(*map(Item, batch))):
+                    yield URI(cast(Item, sub).iri.content)
+            return cls(subclasses, **kwargs)
+
+        def __init__(
+                self,
+                subclasses: Callable[[Sequence[URI]], Iterable[URI]],
+                batch_size: int | None = None,
+                max_closure_size: int | None = None,
+                max_size: int | None = None,
+                ttl: float | None = None
+        ) -> None:
+            self._subclasses = subclasses
+            self._batch_size = batch_size\
+                if batch_size is not None else self.DEFAULT_BATCH_SIZE
+            self._max_closure_size = max_closure_size\
+                if max_closure_size is not None\
+                else self.DEFAULT_MAX_CLOSURE_SIZE
+            self._max_size = max_size\
+                if max_size is not None else self.DEFAULT_MAX_SIZE
+            self._ttl = ttl
+            self._cache = collections.OrderedDict()
+            self._size = 0
+            self._lock = threading.Lock()
+
+        def __len__(self) -> int:
+            return self._size
+
+        def get(self, uri: URI) -> frozenset[URI] | None:
+            """Gets the closure of class.
+
+            Parameters:
+               uri: Class URI.
+
+            Returns:
+               Closure or ``None`` (closure is too large).
+            """
+            now = time.monotonic()
+            with self._lock:
+                entry = self._cache.get(uri)
+                if entry is not None:
+                    if self._ttl is None or now - entry[0] < self._ttl:
+                        self._cache.move_to_end(uri)
+                        return entry[1]
+                    self._evict(uri)  # expired
+            closure = self._get_closure(uri)
+            with self._lock:
+                if uri in self._cache:
+                    self._evict(uri)
+                self._cache[uri] = (now, closure)
+                self._size += len(closure) if closure is not None else 1
+                while self._size > self._max_size and len(self._cache) > 1:
+                    self._evict(next(iter(self._cache)))
+            return closure
+
+        def _get_closure(self, uri: URI) -> frozenset[URI] | None:
+            closure, frontier = {uri}, [uri]
+            while frontier:
+                next_frontier: list[URI] = []
+                for batch in itertools.batched(frontier, self._batch_size):
+                    for sub in self._subclasses(batch):
+                        if sub not in closure:
+                            if len(closure) >= self._max_closure_size:
+                                return None
+                            closure.add(sub)
+                            next_frontier.append(sub)
+                frontier = next_frontier
+            return frozenset(closure)
+
+        def _evict(self, uri: URI) -> None:
+            _, closure = self._cache.pop(uri)
+            self._size -= len(closure) if closure is not None else 1
+
+        def clear(self) -> None:
+            """Removes all closures from cache."""
+            with self._lock:
+                self._cache.clear()
+                self._size = 0
+
     class URI_Schema(TypedDict):
         """Resolved property schema with URI values."""
 
@@ -205,6 +425,7 @@ class WikidataMapping(M):
         wdt: URI
 
     __slots__ = (
+        '_class_hierarchy',
         '_context',
         '_options',
         '_subtype',
@@ -222,6 +443,9 @@ class WikidataMapping(M):
     #: The subclass-of property.
     _subtype: Union[URI, Path]
 
+    #: Class hierarchy cache.
+    _class_hierarchy: ClassHierarchy | None
+
     #: Resolved property URI schema indexed by property URI.
     _uri_schema: dict[URI, URI_Schema]
 
@@ -236,6 +460,7 @@ class WikidataMapping(M):
             use_schema: bool | None = None,
             type: URI | Path | None = None,
             subtype: URI | Path | None = None,
+            class_hierarchy: ClassHierarchy | None = None,
             context: Context | None = None
     ) -> None:
         super().__init__(context)
@@ -250,6 +475,7 @@ class WikidataMapping(M):
             self.options.set_use_schema(use_schema)
         self._type = type or self._default_type
         self._subtype = subtype or self._default_subtype
+        self._class_hierarchy = class_hierarchy
         self._uri_schema = {}
         self._wds = []
 
@@ -269,6 +495,19 @@ class WikidataMapping(M):
         """
         return self._options
 
+    @property
+    def class_hierarchy(self) -> ClassHierarchy | None:
+        """The class hierarchy cache of Wikidata SPARQL mapping."""
+        return self.get_class_hierarchy()
+
+    def get_class_hierarchy(self) -> ClassHierarchy | None:
+        """Gets the class hierarchy cache of Wikidata SPARQL mapping.
+
+        Returns:
+           Class hierarchy cache or ``None``.
+        """
+        return self._class_hierarchy
+
     def get_uri_schema(
             self,
             target: Any
@@ -705,8 +944,15 @@ class WikidataMapping(M):
             theta[pat.variable] = stmt.instantiate(theta)
             return theta
 
-    def _start_Q(self, c: C, e: V_URI, p: V_URI, dt: V_URI) -> V_URI3:
-        t = self._start_any(c, e, p, dt)
+    def _start_Q(
+            self,
+            c: C,
+            e: V_URI,
+            p: V_URI,
+            dt: V_URI,
+            truthy: bool = True
+    ) -> V_URI3:
+        t = self._start_any(c, e, p, dt, truthy)
         self._start_Q_tail(c, e)
         return t
 
@@ -714,8 +960,15 @@ class WikidataMapping(M):
         if c.is_compiling_filter():
             c.q.triples()((e, WIKIBASE.sitelinks, c.q.bnode()))
 
-    def _start_L(self, c: C, e: V_URI, p: V_URI, dt: V_URI) -> V_URI3:
-        t = self._start_any(c, e, p, dt)
+    def _start_L(
+            self,
+            c: C,
+            e: V_URI,
+            p: V_URI,
+            dt: V_URI,
+            truthy: bool = True
+    ) -> V_URI3:
+        t = self._start_any(c, e, p, dt, truthy)
         self._start_L_tail(c, e)
         return t
 
@@ -729,9 +982,10 @@ class WikidataMapping(M):
             e: V_URI,
             edt: V_URI,
             p: V_URI,
-            pdt: V_URI
+            pdt: V_URI,
+            truthy: bool = True
     ) -> V_URI3:
-        t = self._start_any(c, e, p, pdt)
+        t = self._start_any(c, e, p, pdt, truthy)
         self._start_P_tail(c, e, edt)
         return t
 
@@ -741,7 +995,28 @@ class WikidataMapping(M):
                 (e, RDF.type, WIKIBASE.Property),
                 (e, WIKIBASE.propertyType, edt))
 
-    def _start_any(self, c: C, e: V_URI, p: V_URI, dt: V_URI) -> V_URI3:
+    def _start_any(
+            self,
+            c: C,
+            e: V_URI,
+            p: V_URI,
+            dt: V_URI,
+            truthy: bool = True
+    ) -> V_URI3:
+        if truthy and self._is_truthy(c, dt):
+            ###
+            # Truthy fast path: The (best-ranked) statement node is skipped
+            # and the value is read directly from the wdt triple, i.e., the
+            # returned "wds" is the subject itself and "p" and "ps" are the
+            # truthy (wdt) property.
+            ###
+            wdt: V_URI = self._get_schema_uri_or_fresh_qvar(c, p, 'wdt')
+            c.q.triples()(
+                (p, RDF.type, WIKIBASE.Property),
+                (p, WIKIBASE.propertyType, dt))
+            if isinstance(wdt, Var):
+                c.q.triples()((p, WIKIBASE.directClaim, wdt))
+            return wdt, wdt, e
         wds = cast(V_URI, self.wds)
         p_: V_URI = self._get_schema_uri_or_fresh_qvar(c, p, 'p')
         ps: V_URI = self._get_schema_uri_or_fresh_qvar(c, p, 'ps')
@@ -780,6 +1055,21 @@ class WikidataMapping(M):
             c.q.triples()((wds, RDF.type, WIKIBASE.BestRank))
         return p_, ps, wds
 
+    def _is_truthy(
+            self,
+            c: C,
+            dt: V_URI,
+            _ranks: Filter.RankMask = (
+                Filter.RankMask.PREFERRED | Filter.RankMask.NORMAL)
+    ) -> bool:
+        if (not c.filter.best_ranked
+                or c.filter.annotated
+                or c.filter.rank_mask & _ranks != _ranks
+                or isinstance(dt, Var)):
+            return False
+        mask = self._truthy_datatype_mask.get(dt)
+        return mask is not None and bool(self.options.truthy & mask)
+
     def _get_schema_uri_or_fresh_qvar(
             self,
             c: C,
@@ -812,7 +1102,8 @@ class WikidataMapping(M):
         rank=Normal)
     def p_item_type(self, c: C, s: V_URI, v: V_URI, **kwargs) -> None:
         self._start_Q_tail(c, s)
-        self._p_item_tail(c, self._type, s, v)  # type: ignore
+        self._p_type_tail(
+            c, self._type, self._default_type, self._default_type_edge, s, v)
         self._ensure_wds_is_bound_fix(c)
 
     @M.register(
@@ -831,7 +1122,8 @@ class WikidataMapping(M):
             **kwargs
     ) -> None:
         self._start_P_tail(c, s, s0)
-        self._p_item_tail(c, self._type, s, v)  # type: ignore
+        self._p_type_tail(
+            c, self._type, self._default_type, self._default_type_edge, s, v)
         self._ensure_wds_is_bound_fix(c)
 
     @M.register(
@@ -842,7 +1134,8 @@ class WikidataMapping(M):
         rank=Normal)
     def p_lexeme_type(self, c: C, s: V_URI, v: V_URI, **kwargs) -> None:
         self._start_L_tail(c, s)
-        self._p_item_tail(c, self._type, s, v)  # type: ignore
+        self._p_type_tail(
+            c, self._type, self._default_type, self._default_type_edge, s, v)
         self._ensure_wds_is_bound_fix(c)
 
     # -- subtype (pseudo-property) --
@@ -855,9 +1148,38 @@ class WikidataMapping(M):
         rank=Normal)
     def p_item_subtype(self, c: C, s: V_URI, v: V_URI, **kwargs) -> None:
         self._start_Q_tail(c, s)
-        self._p_item_tail(c, self._subtype, s, v)  # type: ignore
+        self._p_type_tail(
+            c, self._subtype, self._default_subtype,
+            self._default_subtype_edge, s, v)
         self._ensure_wds_is_bound_fix(c)
 
+    def _p_type_tail(
+            self,
+            c: C,
+            path: URI | Path,
+            default: Path,
+            edge: URI,
+            s: V_URI,
+            v: V_URI
+    ) -> None:
+        closure = None
+        if (self._class_hierarchy is not None
+                and path is default and isinstance(v, URI)):
+            closure = self._class_hierarchy.get(v)
+        if closure is None:
+            self._p_item_tail(c, path, s, v)  # type: ignore
+        else:
+            ###
+            # Here `path` is `edge` followed by zero or more subclass-of
+            # edges, and so we can match it by matching `edge` against the
+            # (precomputed) closure of `v`.
+            ###
+            x = c.fresh_qvar()
+            c.q.triples()(
+                (s, edge, x),
+                (v, WIKIBASE.sitelinks, c.q.bnode()))
+            c.q.values(x)(*map(lambda uri: (uri,), sorted(closure)))
+
     # -- label (pseudo-property) --
 
     @M.register(
@@ -1828,7 +2150,7 @@ class WikidataMapping(M):
             p0: V_URI,
             **kwargs
     ) -> None:
-        self._p_no_value(c, p, p0, self._start_Q(c, s, p, p0))
+        self._p_no_value(c, p, p0, self._start_Q(c, s, p, p0, False))
 
     @M.register(
         [Statement(Lexeme(s), Property(p, p0).no_value()),
@@ -1846,7 +2168,7 @@ class WikidataMapping(M):
             p0: V_URI,
             **kwargs
     ) -> None:
-        self._p_no_value(c, p, p0, self._start_L(c, s, p, p0))
+        self._p_no_value(c, p, p0, self._start_L(c, s, p, p0, False))
 
     @M.register(
         [Statement(Property(s, s0), Property(p, p0).no_value()),
@@ -1866,7 +2188,8 @@ class WikidataMapping(M):
             p0: V_URI,
             **kwargs
     ) -> None:
-        self._p_no_value(c, p, p0, self._start_P(c, s, s0, p, p0))
+        self._p_no_value(c, p, p0, self._start_P(
+            c, s, s0, p, p0, False))
 
     def _p_no_value(self, c: C, p: V_URI, p0: V_URI, t: V_URI3) -> None:
         _, _, wds = t
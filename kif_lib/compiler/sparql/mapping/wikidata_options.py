@@ -144,6 +144,11 @@ class WikidataMappingOptions(Section, name='wikidata'):
     def get_truthy(self) -> Filter.DatatypeMask:
         """Gets the truthy mask.
 
+        Best-ranked, non-annotated filters whose value datatype is in the
+        truthy mask are compiled to truthy (wdt) triples instead of
+        statement nodes.  Quantities and times are always compiled to
+        statement nodes.
+
         Returns:
            Datatype mask.
         """
@@ -10,8 +10,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
-from typing import Union
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, cast, Union
 
 from typing_extensions import Literal, NotRequired, TypeAlias, TypedDict
 
@@ -59,3 +60,180 @@ class SPARQL_Results(TypedDict):
 
 class SPARQL_ResultsAsk(TypedDict):
     boolean: NotRequired[Literal[True, False]]
+
+
+def iterparse_sparql_results(chunks: Iterable[str]) -> SPARQL_Results:
+    """Parses SPARQL JSON results incrementally.
+
+    The members preceding the bindings (usually, the head) are parsed
+    eagerly.  The bindings are parsed lazily, as they are consumed, and
+    can be traversed only once.  The members following the bindings are
+    added to the returned results after the bindings are exhausted.
+
+    If `chunks` has a ``close()`` method, it is called once `chunks` is no
+    longer needed: after parsing fails, after the results are fully
+    parsed, or when the bindings iterator is exhausted or closed.
+
+    Parameters:
+       chunks: Chunks of JSON text.
+
+    Returns:
+       SPARQL results.
+    """
+    reader = _JSON_Reader(chunks)
+    try:
+        results: dict[str, Any] = {}
+        reader.expect('{')
+        if reader.peek() == '}':
+            reader.expect('}')
+            reader.close()
+            return cast(SPARQL_Results, results)
+        while True:
+            key = reader.value()
+            reader.expect(':')
+            if key == 'results' and reader.peek() == '{':
+                reader.expect('{')
+                inner: dict[str, Any] = {}
+                results[key] = inner
+                if reader.peek() == '}':
+                    reader.expect('}')
+                else:
+                    while True:
+                        key = reader.value()
+                        reader.expect(':')
+                        if key == 'bindings' and reader.peek() == '[':
+                            reader.expect('[')
+                            inner[key] = _iterparse_sparql_results_bindings(
+                                reader, results, inner)
+                            return cast(SPARQL_Results, results)
+                        inner[key] = reader.value()
+                        if reader.next_member():
+                            break
+            else:
+                results[key] = reader.value()
+            if reader.next_member():
+                reader.close()
+                return cast(SPARQL_Results, results)
+    except BaseException:
+        reader.close()
+        raise
+
+
+def _iterparse_sparql_results_bindings(
+        reader: _JSON_Reader,
+        results: dict[str, Any],
+        inner: dict[str, Any]
+) -> Iterator[SPARQL_ResultsBinding]:
+    try:
+        if reader.peek() == ']':
+            reader.expect(']')
+        else:
+            while True:
+                yield reader.value()
+                if reader.next_element():
+                    break
+        for target in (inner, results):
+            while not reader.next_member():
+                key = reader.value()
+                reader.expect(':')
+                target[key] = reader.value()
+    finally:
+        reader.close()
+
+
+class _JSON_Reader:
+    """Reader of JSON values from chunks of JSON text."""
+
+    __slots__ = (
+        '_buf',
+        '_chunks',
+        '_decoder',
+        '_pos',
+    )
+
+    _buf: str
+    _chunks: Iterator[str]
+    _decoder: json.JSONDecoder
+    _pos: int
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        self._buf = ''
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._pos = 0
+
+    def close(self) -> None:
+        """Closes the underlying chunks (if they can be closed)."""
+        close = getattr(self._chunks, 'close', None)
+        if close is not None:
+            close()
+
+    def _fill(self) -> bool:
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skips whitespace and returns the next character."""
+        while True:
+            n = len(self._buf)
+            while self._pos < n and self._buf[self._pos] in ' \t\n\r':
+                self._pos += 1
+            if self._pos < n:
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError('unexpected end of JSON input')
+
+    def expect(self, c: str) -> None:
+        """Consumes character `c`."""
+        if self.peek() != c:
+            raise ValueError(
+                f'expected {c!r} at position {self._pos} of JSON input')
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Consumes and returns the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue    # value spans the next chunk
+                raise
+            ###
+            # A value ending at the end of the buffer might be a prefix of
+            # a longer value (e.g., a number).
+            ###
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def next_member(self) -> bool:
+        """Consumes the next member separator.
+
+        Returns:
+           ``True`` if the object has ended; ``False`` otherwise.
+        """
+        return self._next(',', '}')
+
+    def next_element(self) -> bool:
+        """Consumes the next element separator.
+
+        Returns:
+           ``True`` if the array has ended; ``False`` otherwise.
+        """
+        return self._next(',', ']')
+
+    def _next(self, sep: str, end: str) -> bool:
+        c = self.peek()
+        if c not in (sep, end):
+            raise ValueError(
+                f'expected {sep!r} or {end!r} at position {self._pos} '
+                'of JSON input')
+        self._pos += 1
+        return c == end
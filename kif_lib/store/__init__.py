@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 from .abc import Store
+from .caching import CachingStore
 from .empty import EmptyStore
 from .memory import MemoryStore
 from .mixer import MixerStore
@@ -25,6 +26,7 @@ from .sparql import (
 )
 
 __all__ = (
+    'CachingStore',
     'CSV_Reader',
     'DBpediaRDF_Store',
     'DBpediaSPARQL_Store',
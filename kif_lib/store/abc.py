@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import dataclasses
 import sys
 
@@ -15,6 +17,7 @@ from ..model import (
     Filter,
     Fingerprint,
     KIF_Object,
+    OrFingerprint,
     Property,
     ReferenceRecordSet,
     Snak,
@@ -25,6 +28,7 @@ from ..model import (
     TReferenceRecordSet,
     TTextLanguage,
     Value,
+    ValueFingerprint,
     ValuePair,
     ValueSnak,
 )
@@ -40,8 +44,11 @@ from ..typing import (
     Iterator,
     Location,
     Mapping,
+    Optional,
     override,
+    Sequence,
     Set,
+    TypeAlias,
     TypeVar,
 )
 
@@ -1485,6 +1492,99 @@ class Store(Engine[TOptions]):
                     return True
             return False
 
+    def contains_many(self, stmts: Iterable[Statement]) -> list[bool]:
+        """Tests whether each of `stmts` occurs in store.
+
+        Statements with the same property are packed into filters whose
+        subject and value are disjunctions of those of the statements, so
+        that a single query checks a whole page of statements.
+
+        Parameters:
+           stmts: Statements.
+
+        Returns:
+           Whether each statement occurs in store (in the order of
+           `stmts`).
+        """
+        return self._contains_many_tail([
+            Statement.check(stmt, self.contains_many, 'stmts', 1)
+            for stmt in stmts])
+
+    def _contains_many_tail(self, stmts: Sequence[Statement]) -> list[bool]:
+        filters = list(map(self._xcontains_filter_from_statement, stmts))
+        with self(distinct=True, limit=self.max_limit) as options:
+            return self._contains_many(stmts, filters, options)
+
+    def _contains_many(
+            self,
+            stmts: Sequence[Statement],
+            filters: Sequence[Filter],
+            options: TOptions
+    ) -> list[bool]:
+        result = [False] * len(stmts)
+        for filter, indices in self._contains_many_batches(filters, options):
+            found = set(self._filter(filter, options.copy()))
+            for i in indices:
+                result[i] = stmts[i] in found
+        return result
+
+    def _contains_many_batches(
+            self,
+            filters: Sequence[Filter],
+            options: TOptions
+    ) -> Iterator[tuple[Filter, Sequence[int]]]:
+        groups: dict[Filter, list[int]] = {}
+        for i, filter in enumerate(filters):
+            if filter.is_nonempty():
+                groups.setdefault(filter.replace(
+                    subject=None, value=None), []).append(i)
+        for rest, indices in groups.items():
+            for batch in itertools.batched(indices, options.page_size):
+                if len(batch) == 1:
+                    yield filters[batch[0]], batch
+                else:
+                    subjects = dict.fromkeys(filters[i].subject for i in batch)
+                    values = dict.fromkeys(filters[i].value for i in batch)
+                    yield rest.replace(
+                        subject=OrFingerprint(*subjects),
+                        value=OrFingerprint(*values)).normalize(), batch
+
+    async def acontains_many(
+            self,
+            stmts: Iterable[Statement]
+    ) -> list[bool]:
+        """Async version of :meth:`Store.contains_many`."""
+        return await self._acontains_many_tail([
+            Statement.check(stmt, self.acontains_many, 'stmts', 1)
+            for stmt in stmts])
+
+    async def _acontains_many_tail(
+            self,
+            stmts: Sequence[Statement]
+    ) -> list[bool]:
+        filters = list(map(self._xcontains_filter_from_statement, stmts))
+        with self(distinct=True, limit=self.max_limit) as options:
+            return await self._acontains_many(stmts, filters, options)
+
+    async def _acontains_many(
+            self,
+            stmts: Sequence[Statement],
+            filters: Sequence[Filter],
+            options: TOptions
+    ) -> list[bool]:
+        result = [False] * len(stmts)
+
+        async def run(batch: tuple[Filter, Sequence[int]]) -> None:
+            filter, indices = batch
+            found = {stmt async for stmt in self._afilter(
+                filter, options.copy())}
+            for i in indices:
+                result[i] = stmts[i] in found
+        for batches in itertools.batched(self._contains_many_batches(
+                filters, options), max(options.lookahead, 1)):
+            await asyncio.gather(*map(run, batches))
+        return result
+
 # -- Count -----------------------------------------------------------------
 
     def count(
@@ -3340,6 +3440,682 @@ class Store(Engine[TOptions]):
         return filter.normalize().replace(
             snak_mask=filter.snak_mask & store_snak_mask)
 
+# -- Filter many -----------------------------------------------------------
+
+    #: Type alias for filter-many batches.
+    #:
+    #: A batch is a triple (filter, position, index) where filter is the
+    #: (possibly merged) filter to evaluate, position is the name of the
+    #: merged position (or ``None``), and index maps the keys of the
+    #: entities in the merged position to the indices of the originating
+    #: filters.
+    _FilterManyBatch: TypeAlias = tuple[
+        Filter, Optional[str], Mapping[Optional[str], Sequence[int]]]
+
+    def filter_many(
+            self,
+            filters: Iterable[Filter],
+            base_filter: Filter | None = None,
+            debug: bool | None = None,
+            distinct: bool | None = None,
+            distinct_window_size: int | None = None,
+            extra_references: TReferenceRecordSet | None = None,
+            limit: int | None = None,
+            lookahead: int | None = None,
+            omega: int | None = None,
+            page_size: int | None = None,
+            timeout: float | None = None,
+            **kwargs: Any
+    ) -> Iterator[tuple[Filter, Statement]]:
+        """Filters statements matching each of `filters`.
+
+        Filters that differ only in the entity in subject, property, or
+        value position are merged into a single filter (which SPARQL
+        stores compile into a ``VALUES`` block).  Merging is disabled if
+        `limit` is given, as the limit applies to each filter.  The max.
+        limit still applies to each merged filter on its own.
+
+        Parameters:
+           filters: Filters.
+           base_filter: Base filter.
+           debug: Whether to enable debugging mode.
+           distinct: Whether to suppress duplicates.
+           distinct_window_size: Size of distinct look-back window.
+           extra_references: Extra references to attach to statements.
+           limit: Limit (maximum number) of responses per filter.
+           lookahead: Number of batches to evaluate concurrently (async).
+           omega: Maximum number of disjoint subqueries.
+           page_size: Page size of paginated responses.
+           timeout: Timeout of responses (in seconds).
+           kwargs: Other keyword arguments.
+
+        Returns:
+           An iterator of pairs (filter, statement) where filter is the
+           originating filter in `filters`.
+        """
+        filters = list(filters)
+        return map(
+            lambda t: (filters[t[0]], t[1]),
+            self._check_filters_with_options_and_run(
+                self._filter_many_tail, filters,
+                base_filter, debug, distinct, distinct_window_size,
+                extra_references, limit, lookahead, omega, page_size,
+                timeout, self.filter_many, **kwargs))
+
+    class _FilterManyCap:
+        """Per-filter cap of a merged filter-many batch.
+
+        Each filter merged into a batch is capped at the max. limit on its
+        own.  The merged filter is evaluated with the sum of the caps as
+        limit, and the statements of keys that reached their cap are
+        dropped.  If the merged evaluation is cut short by its limit, the
+        keys that did not reach their cap are evaluated again separately,
+        skipping the statements already produced.
+        """
+
+        __slots__ = (
+            'cap',
+            'counts',
+            'limit',
+            'seen',
+            'total',
+        )
+
+        #: Max. number of statements per key.
+        cap: int
+
+        #: Limit of the merged evaluation.
+        limit: int
+
+        #: Number of statements produced by the merged evaluation.
+        total: int
+
+        #: Number of statements produced per key.
+        counts: dict[str | None, int]
+
+        #: Statements produced per key (if the limit can be reached).
+        seen: dict[str | None, set[Statement]] | None
+
+        def __init__(self, keys: Iterable[str | None], cap: int) -> None:
+            self.cap = cap
+            self.counts = dict.fromkeys(keys, 0)
+            self.limit = min(cap * len(self.counts), sys.maxsize)
+            self.total = 0
+            self.seen = (
+                {key: set() for key in self.counts}
+                if cap * len(self.counts) < sys.maxsize else None)
+
+        def push(self, key: str | None, stmt: Statement) -> bool:
+            """Pushes statement of merged evaluation.
+
+            Parameters:
+               key: Key of statement.
+               stmt: Statement.
+
+            Returns:
+               ``True`` if statement should be produced; ``False``
+               otherwise.
+            """
+            self.total += 1
+            count = self.counts.get(key)
+            if count is None or count >= self.cap:
+                return False
+            self.counts[key] = count + 1
+            if self.seen is not None:
+                self.seen[key].add(stmt)
+            return True
+
+        def pending(self) -> Iterator[str | None]:
+            """Gets the keys to evaluate separately.
+
+            Returns:
+               An iterator of keys.
+            """
+            if self.seen is not None and self.total >= self.limit:
+                for key, count in self.counts.items():
+                    if count < self.cap:
+                        yield key
+
+        def push_pending(self, key: str | None, stmt: Statement) -> bool:
+            """Pushes statement of separate evaluation of `key`.
+
+            Parameters:
+               key: Key.
+               stmt: Statement.
+
+            Returns:
+               ``True`` if statement should be produced; ``False``
+               otherwise.
+            """
+            assert self.seen is not None
+            if self.counts[key] >= self.cap or stmt in self.seen[key]:
+                return False
+            self.counts[key] += 1
+            return True
+
+    def _filter_many_tail(
+            self,
+            filters: Sequence[Filter],
+            options: TOptions
+    ) -> Iterator[tuple[int, Statement]]:
+        for batch in self._filter_many_batches(filters, options):
+            yield from self._filter_many_batch(
+                filters, batch, options.copy())
+
+    def _filter_many_batch(
+            self,
+            filters: Sequence[Filter],
+            batch: Store._FilterManyBatch,
+            options: TOptions
+    ) -> Iterator[tuple[int, Statement]]:
+        filter, position, index = batch
+        if position is None:
+            for stmt in self._filter_x_tail(self._filter, filter, options):
+                for i in index[None]:
+                    yield i, stmt
+            return              # done
+        cap = self._FilterManyCap(index.keys(), options.max_limit)
+        options.limit = cap.limit
+        for stmt in self._filter_x_tail(
+                self._filter, filter, options.copy()):
+            key = self._filter_many_key(position, stmt)
+            if cap.push(key, stmt):
+                for i in index[key]:
+                    yield i, stmt
+        for key in list(cap.pending()):
+            options.limit = cap.cap
+            for stmt in self._filter_x_tail(
+                    self._filter, filters[index[key][0]], options.copy()):
+                if cap.push_pending(key, stmt):
+                    for i in index[key]:
+                        yield i, stmt
+
+    def _filter_many_batches(
+            self,
+            filters: Sequence[Filter],
+            options: TOptions
+    ) -> Iterator[Store._FilterManyBatch]:
+        unique: dict[Filter, list[int]] = {}
+        for i, filter in enumerate(filters):
+            if filter.is_nonempty():
+                unique.setdefault(filter, []).append(i)
+        assigned: set[Filter] = set()
+        if options.limit is None:
+            groups: dict[tuple[str, Filter], list[Filter]] = {}
+            for filter in unique:
+                for position in ('subject', 'property', 'value'):
+                    fp = getattr(filter, position)
+                    if (isinstance(fp, ValueFingerprint)
+                            and isinstance(fp.value, Entity)):
+                        groups.setdefault((position, filter.replace(
+                            **{position: None})), []).append(filter)
+            for (position, rest), group in sorted(
+                    groups.items(), key=lambda t: -len(t[1])):
+                group = [f for f in group if f not in assigned]
+                if len(group) < 2:
+                    continue
+                assigned.update(group)
+                index: dict[str | None, list[int]] = {}
+                for filter in group:
+                    index.setdefault(cast(Entity, getattr(
+                        filter, position).value).iri.content, []).extend(
+                            unique[filter])
+                merged: dict[str, Any] = {position: OrFingerprint(*map(
+                    lambda f: getattr(f, position), group))}
+                yield rest.replace(**merged).normalize(), position, index
+        for filter, indices in unique.items():
+            if filter not in assigned:
+                yield filter, None, {None: indices}
+
+    def _filter_many_key(
+            self,
+            position: str | None,
+            stmt: Statement
+    ) -> str | None:
+        if position is None:
+            return None
+        elif position == 'subject':
+            return stmt.subject.iri.content
+        elif position == 'property':
+            return stmt.snak.property.iri.content
+        elif isinstance(stmt.snak, ValueSnak) and isinstance(
+                stmt.snak.value, Entity):
+            return stmt.snak.value.iri.content
+        else:
+            return None
+
+    def afilter_many(
+            self,
+            filters: Iterable[Filter],
+            base_filter: Filter | None = None,
+            debug: bool | None = None,
+            distinct: bool | None = None,
+            distinct_window_size: int | None = None,
+            extra_references: TReferenceRecordSet | None = None,
+            limit: int | None = None,
+            lookahead: int | None = None,
+            omega: int | None = None,
+            page_size: int | None = None,
+            timeout: float | None = None,
+            **kwargs: Any
+    ) -> AsyncIterator[tuple[Filter, Statement]]:
+        """Async version of :meth:`Store.filter_many`."""
+        filters = list(filters)
+        return itertools.amap(
+            lambda t: (filters[t[0]], t[1]),
+            self._check_filters_with_options_and_run(
+                self._afilter_many_tail, filters,
+                base_filter, debug, distinct, distinct_window_size,
+                extra_references, limit, lookahead, omega, page_size,
+                timeout, self.afilter_many, **kwargs))
+
+    async def _afilter_many_tail(
+            self,
+            filters: Sequence[Filter],
+            options: TOptions
+    ) -> AsyncIterator[tuple[int, Statement]]:
+        for batches in itertools.batched(self._filter_many_batches(
+                filters, options), max(options.lookahead, 1)):
+            async for t in itertools.amix(*(
+                    self._afilter_many_batch(filters, batch, options.copy())
+                    for batch in batches)):
+                yield t
+
+    async def _afilter_many_batch(
+            self,
+            filters: Sequence[Filter],
+            batch: Store._FilterManyBatch,
+            options: TOptions
+    ) -> AsyncIterator[tuple[int, Statement]]:
+        filter, position, index = batch
+        if position is None:
+            async for stmt in self._afilter_x_tail(
+                    self._afilter, filter, options):
+                for i in index[None]:
+                    yield i, stmt
+            return              # done
+        cap = self._FilterManyCap(index.keys(), options.max_limit)
+        options.limit = cap.limit
+        async for stmt in self._afilter_x_tail(
+                self._afilter, filter, options.copy()):
+            key = self._filter_many_key(position, stmt)
+            if cap.push(key, stmt):
+                for i in index[key]:
+                    yield i, stmt
+        for key in list(cap.pending()):
+            options.limit = cap.cap
+            async for stmt in self._afilter_x_tail(
+                    self._afilter, filters[index[key][0]], options.copy()):
+                if cap.push_pending(key, stmt):
+                    for i in index[key]:
+                        yield i, stmt
+
+    def count_many(
+            self,
+            filters: Iterable[Filter],
+            base_filter: Filter | None = None,
+            debug: bool | None = None,
+            distinct: bool | None = None,
+            distinct_window_size: int | None = None,
+            extra_references: TReferenceRecordSet | None = None,
+            limit: int | None = None,
+            lookahead: int | None = None,
+            omega: int | None = None,
+            page_size: int | None = None,
+            timeout: float | None = None,
+            **kwargs: Any
+    ) -> list[int]:
+        """Counts the statements matching each of `filters`.
+
+        Filters are merged as in :meth:`Store.filter_many`.  The counts of
+        a merged filter are obtained by grouping its statements by the
+        entity in the merged position, provided that they fit in
+        `page_size` statements per filter; otherwise, its filters are
+        counted separately.
+
+        Parameters:
+           filters: Filters.
+           base_filter: Base filter.
+           debug: Whether to enable debugging mode.
+           distinct: Whether to suppress duplicates.
+           distinct_window_size: Size of distinct look-back window.
+           extra_references: Extra references to attach to statements.
+           limit: Limit (maximum number) of responses.
+           lookahead: Number of batches to evaluate concurrently.
+           omega: Maximum number of disjoint subqueries.
+           page_size: Page size of paginated responses.
+           timeout: Timeout of responses (in seconds).
+           kwargs: Other keyword arguments.
+
+        Returns:
+           The number of statements matching each filter (in the order
+           of `filters`).
+        """
+        return self._check_filters_with_options_and_run(
+            self._count_many_tail, list(filters),
+            base_filter, debug, distinct, distinct_window_size,
+            extra_references, limit, lookahead, omega, page_size,
+            timeout, self.count_many, **kwargs)
+
+    def _count_many_tail(
+            self,
+            filters: Sequence[Filter],
+            options: TOptions
+    ) -> list[int]:
+        options.limit = None
+        result = [0] * len(filters)
+
+        def run(batch: Store._FilterManyBatch) -> None:
+            filter, position, index = batch
+            counts: Mapping[str | None, int] = {}
+            if position is not None:
+                counts = self._count_many_grouped(
+                    filter, position, index, options.copy())
+            for key, indices in index.items():
+                count = counts.get(key)
+                if count is None:
+                    count = self._count_x_tail(
+                        self._count, filters[indices[0]], options.copy())
+                for i in indices:
+                    result[i] = count
+        batches = list(self._filter_many_batches(filters, options))
+        workers = min(max(options.lookahead, 1), len(batches))
+        if workers <= 1:
+            for batch in batches:
+                run(batch)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+                for _ in executor.map(run, batches):
+                    pass
+        return result
+
+    def _count_many_grouped(
+            self,
+            filter: Filter,
+            position: str,
+            index: Mapping[str | None, Sequence[int]],
+            options: TOptions
+    ) -> Mapping[str | None, int]:
+        return self._count_many_grouped_tail(
+            (self._filter_many_key(position, stmt)
+             for stmt in self._filter_x_tail(
+                 self._filter, filter.replace(annotated=False),
+                 self._count_many_grouped_options(index, options))),
+            index, options)
+
+    def _count_many_grouped_options(
+            self,
+            index: Mapping[str | None, Sequence[int]],
+            options: TOptions
+    ) -> TOptions:
+        options.distinct = True
+        options.limit = options.page_size * len(index)
+        return options
+
+    def _count_many_grouped_tail(
+            self,
+            keys: Iterable[str | None],
+            index: Mapping[str | None, Sequence[int]],
+            options: TOptions
+    ) -> Mapping[str | None, int]:
+        ###
+        # The counts are grouped by the key of each statement in the
+        # merged position.  They are trusted only if the evaluation was
+        # not cut short by its limit, and only the counts below the max.
+        # limit (beyond which the counts of stores may be capped or not)
+        # are returned; the other keys are counted separately.
+        ###
+        assert options.limit is not None
+        counts = dict.fromkeys(index, 0)
+        total = 0
+        for key in keys:
+            total += 1
+            if key in counts:
+                counts[key] += 1
+        if total >= options.limit:
+            return {}
+        return {
+            key: count for key, count in counts.items()
+            if count < options.max_limit}
+
+    async def acount_many(
+            self,
+            filters: Iterable[Filter],
+            base_filter: Filter | None = None,
+            debug: bool | None = None,
+            distinct: bool | None = None,
+            distinct_window_size: int | None = None,
+            extra_references: TReferenceRecordSet | None = None,
+            limit: int | None = None,
+            lookahead: int | None = None,
+            omega: int | None = None,
+            page_size: int | None = None,
+            timeout: float | None = None,
+            **kwargs: Any
+    ) -> list[int]:
+        """Async version of :meth:`Store.count_many`."""
+        return await self._check_filters_with_options_and_run(
+            self._acount_many_tail, list(filters),
+            base_filter, debug, distinct, distinct_window_size,
+            extra_references, limit, lookahead, omega, page_size,
+            timeout, self.acount_many, **kwargs)
+
+    async def _acount_many_tail(
+            self,
+            filters: Sequence[Filter],
+            options: TOptions
+    ) -> list[int]:
+        options.limit = None
+        result = [0] * len(filters)
+
+        async def run(batch: Store._FilterManyBatch) -> None:
+            filter, position, index = batch
+            counts: Mapping[str | None, int] = {}
+            if position is not None:
+                counts = await self._acount_many_grouped(
+                    filter, position, index, options.copy())
+            for key, indices in index.items():
+                count = counts.get(key)
+                if count is None:
+                    count = await self._acount_x_tail(
+                        self._acount, filters[indices[0]], options.copy())
+                for i in indices:
+                    result[i] = count
+        for batches in itertools.batched(self._filter_many_batches(
+                filters, options), max(options.lookahead, 1)):
+            await asyncio.gather(*map(run, batches))
+        return result
+
+    async def _acount_many_grouped(
+            self,
+            filter: Filter,
+            position: str,
+            index: Mapping[str | None, Sequence[int]],
+            options: TOptions
+    ) -> Mapping[str | None, int]:
+        return self._count_many_grouped_tail(
+            [self._filter_many_key(position, stmt)
+             async for stmt in self._afilter_x_tail(
+                 self._afilter, filter.replace(annotated=False),
+                 self._count_many_grouped_options(index, options))],
+            index, options)
+
+    def ask_many(
+            self,
+            filters: Iterable[Filter],
+            base_filter: Filter | None = None,
+            debug: bool | None = None,
+            distinct: bool | None = None,
+            distinct_window_size: int | None = None,
+            extra_references: TReferenceRecordSet | None = None,
+            limit: int | None = None,
+            lookahead: int | None = None,
+            omega: int | None = None,
+            page_size: int | None = None,
+            timeout: float | None = None,
+            **kwargs: Any
+    ) -> list[bool]:
+        """Tests whether some statement matches each of `filters`.
+
+        Filters that differ only in the entity in subject, property, or
+        value position are merged into a single filter projected on that
+        position.
+
+        Parameters:
+           filters: Filters.
+           base_filter: Base filter.
+           debug: Whether to enable debugging mode.
+           distinct: Whether to suppress duplicates.
+           distinct_window_size: Size of distinct look-back window.
+           extra_references: Extra references to attach to statements.
+           limit: Limit (maximum number) of responses.
+           lookahead: Number of batches to evaluate concurrently (async).
+           omega: Maximum number of disjoint subqueries.
+           page_size: Page size of paginated responses.
+           timeout: Timeout of responses (in seconds).
+           kwargs: Other keyword arguments.
+
+        Returns:
+           Whether some statement matches each filter (in the order of
+           `filters`).
+        """
+        return self._check_filters_with_options_and_run(
+            self._ask_many_tail, list(filters),
+            base_filter, debug, distinct, distinct_window_size,
+            extra_references, limit, lookahead, omega, page_size,
+            timeout, self.ask_many, **kwargs)
+
+    def _ask_many_tail(
+            self,
+            filters: Sequence[Filter],
+            options: TOptions
+    ) -> list[bool]:
+        options.limit = None
+        result = [False] * len(filters)
+        for filter, position, index in self._filter_many_batches(
+                filters, options):
+            if position is None:
+                status = self._ask_tail(filter, options.copy())
+            else:
+                status = False
+                for value in self._filter_x_tail(
+                        self._ask_many_get_filter_x_fn(position),
+                        filter, options.copy()):
+                    for i in index.get(value.iri.content, ()):
+                        result[i] = True
+            for i in index.get(None, ()):
+                result[i] = status
+        return result
+
+    def _ask_many_get_filter_x_fn(
+            self,
+            position: str
+    ) -> Callable[[Filter, TOptions], Iterator[Entity]]:
+        if position == 'subject':
+            return self._filter_s
+        elif position == 'property':
+            return self._filter_p
+        else:
+            return cast(
+                Callable[[Filter, TOptions], Iterator[Entity]],
+                self._filter_v)
+
+    async def aask_many(
+            self,
+            filters: Iterable[Filter],
+            base_filter: Filter | None = None,
+            debug: bool | None = None,
+            distinct: bool | None = None,
+            distinct_window_size: int | None = None,
+            extra_references: TReferenceRecordSet | None = None,
+            limit: int | None = None,
+            lookahead: int | None = None,
+            omega: int | None = None,
+            page_size: int | None = None,
+            timeout: float | None = None,
+            **kwargs: Any
+    ) -> list[bool]:
+        """Async version of :meth:`Store.ask_many`."""
+        return await self._check_filters_with_options_and_run(
+            self._aask_many_tail, list(filters),
+            base_filter, debug, distinct, distinct_window_size,
+            extra_references, limit, lookahead, omega, page_size,
+            timeout, self.aask_many, **kwargs)
+
+    async def _aask_many_tail(
+            self,
+            filters: Sequence[Filter],
+            options: TOptions
+    ) -> list[bool]:
+        options.limit = None
+        result = [False] * len(filters)
+
+        async def run(batch: Store._FilterManyBatch) -> None:
+            filter, position, index = batch
+            if position is None:
+                status = await self._aask_tail(filter, options.copy())
+                for i in index[None]:
+                    result[i] = status
+            else:
+                async for value in self._afilter_x_tail(
+                        self._aask_many_get_afilter_x_fn(position),
+                        filter, options.copy()):
+                    for i in index.get(value.iri.content, ()):
+                        result[i] = True
+        for batches in itertools.batched(self._filter_many_batches(
+                filters, options), max(options.lookahead, 1)):
+            await asyncio.gather(*map(run, batches))
+        return result
+
+    def _aask_many_get_afilter_x_fn(
+            self,
+            position: str
+    ) -> Callable[[Filter, TOptions], AsyncIterator[Entity]]:
+        if position == 'subject':
+            return self._afilter_s
+        elif position == 'property':
+            return self._afilter_p
+        else:
+            return cast(
+                Callable[[Filter, TOptions], AsyncIterator[Entity]],
+                self._afilter_v)
+
+    def _check_filters_with_options_and_run(
+            self,
+            callback: Callable[[Sequence[Filter], TOptions], T],
+            filters: Sequence[Filter],
+            base_filter: Filter | None = None,
+            debug: bool | None = None,
+            distinct: bool | None = None,
+            distinct_window_size: int | None = None,
+            extra_references: TReferenceRecordSet | None = None,
+            limit: int | None = None,
+            lookahead: int | None = None,
+            omega: int | None = None,
+            page_size: int | None = None,
+            timeout: float | None = None,
+            function: Location | None = None,
+            **kwargs: Any
+    ) -> T:
+        for filter in filters:
+            Filter.check(filter, function, 'filters', 1)
+        with self(
+                base_filter=base_filter,
+                debug=debug,
+                distinct=distinct,
+                distinct_window_size=distinct_window_size,
+                extra_references=extra_references,
+                limit=limit,
+                lookahead=lookahead,
+                omega=omega,
+                page_size=page_size,
+                timeout=timeout,
+                **kwargs
+        ) as options:
+            return callback([
+                self._check_filter(filter=filter, function=function)
+                for filter in filters], options)
+
 # -- Mix -------------------------------------------------------------------
 
     def mix(
@@ -0,0 +1,666 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import threading
+import time
+
+from ..context import Context
+from ..model import (
+    Entity,
+    Filter,
+    KIF_Object,
+    Property,
+    Statement,
+    Value,
+    ValuePair,
+    ValueSnak,
+)
+from ..typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    cast,
+    ClassVar,
+    Hashable,
+    Iterable,
+    Iterator,
+    override,
+    Sequence,
+    TypeVar,
+)
+from .abc import Store, StoreOptions
+from .mixer import MixerStore, MixerStoreOptions
+
+T = TypeVar('T')
+
+
+@dataclasses.dataclass
+class CachingStoreOptions(MixerStoreOptions, name='caching'):
+    """Caching store options."""
+
+    _v_debug: ClassVar[tuple[Iterable[str], bool | None]] =\
+        (('KIF_CACHING_STORE_DEBUG',), None)
+
+    _v_distinct: ClassVar[tuple[Iterable[str], bool | None]] =\
+        (('KIF_CACHING_STORE_DISTINCT',), None)
+
+    _v_max_distinct_window_size: ClassVar[
+        tuple[Iterable[str], int | None]] = (
+            (('KIF_CACHING_STORE_MAX_DISTINCT_WINDOW_SIZE',), None))
+
+    _v_distinct_window_size: ClassVar[
+        tuple[Iterable[str], int | None]] = (
+            (('KIF_CACHING_STORE_DISTINCT_WINDOW_SIZE',), None))
+
+    _v_max_limit: ClassVar[tuple[Iterable[str], int | None]] =\
+        (('KIF_CACHING_STORE_MAX_LIMIT',), None)
+
+    _v_limit: ClassVar[tuple[Iterable[str], int | None]] =\
+        (('KIF_CACHING_STORE_LIMIT',), None)
+
+    _v_lookahead: ClassVar[tuple[Iterable[str], int | None]] =\
+        (('KIF_CACHING_STORE_LOOKAHEAD',), None)
+
+    _v_omega: ClassVar[tuple[Iterable[str], int | None]] =\
+        (('KIF_CACHING_STORE_OMEGA',), None)
+
+    _v_max_page_size: ClassVar[tuple[Iterable[str], int | None]] =\
+        (('KIF_CACHING_STORE_MAX_PAGE_SIZE',), None)
+
+    _v_page_size: ClassVar[tuple[Iterable[str], int | None]] =\
+        (('KIF_CACHING_STORE_PAGE_SIZE',), None)
+
+    _v_max_timeout: ClassVar[tuple[Iterable[str], float | None]] =\
+        (('KIF_CACHING_STORE_MAX_TIMEOUT',), None)
+
+    _v_timeout: ClassVar[tuple[Iterable[str], float | None]] =\
+        (('KIF_CACHING_STORE_TIMEOUT',), None)
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+
+    @override
+    def _get_parent_callback(self) -> MixerStoreOptions:
+        return self.get_context().options.store.mixer
+
+
+# == Caching store =========================================================
+
+TOptions = TypeVar(
+    'TOptions', bound=CachingStoreOptions, default=CachingStoreOptions)
+
+
+class CachingStore(
+        MixerStore[TOptions],
+        store_name='caching',
+        store_description='Caching store'
+):
+    """Caching store.
+
+    Caches the results of the ask, count, and filter calls issued against
+    `source`.  Entries are keyed by the normalized filter (which includes
+    the language and annotated criteria), the projection, and the options
+    that affect the result (distinct, distinct window-size, and limit).
+
+    Filter results are recorded while they are consumed and are stored
+    only if the underlying iterator is exhausted.  The cache is bounded by
+    the number of entries (`max_size`), not by memory, so a huge filter
+    result is kept whole.
+
+    Parameters:
+       store_name: Name of the store plugin to instantiate.
+       source: Source store.
+       max_size: Maximum number of cached entries.
+       ttl: Time-to-live of cached entries (in seconds).
+       kwargs: Other keyword arguments.
+    """
+
+    class Cache:
+        """LRU result cache with per-entry time-to-live.
+
+        The cache is bounded by the number of entries, not by memory: the
+        result of a single filter call is kept whole, however large.
+
+        Parameters:
+           max_size: Maximum number of entries.
+           ttl: Time-to-live of entries (in seconds).
+        """
+
+        #: Default value for the max size parameter.
+        DEFAULT_MAX_SIZE: ClassVar[int] = 1024
+
+        __slots__ = (
+            '_entries',
+            '_lock',
+            '_max_size',
+            '_ttl',
+            '_hits',
+            '_misses',
+            '_evictions',
+            '_expirations',
+        )
+
+        #: Cached entries (least-recently used first).
+        _entries: collections.OrderedDict[Hashable, tuple[float, Any]]
+
+        #: Lock protecting the entries and statistics.
+        _lock: threading.Lock
+
+        #: Maximum number of entries.
+        _max_size: int
+
+        #: Time-to-live of entries.
+        _ttl: float | None
+
+        #: Statistics.
+        _hits: int
+        _misses: int
+        _evictions: int
+        _expirations: int
+
+        def __init__(
+                self,
+                max_size: int | None = None,
+                ttl: float | None = None
+        ) -> None:
+            self._entries = collections.OrderedDict()
+            self._lock = threading.Lock()
+            self._max_size = KIF_Object._check_arg(
+                cast(int, KIF_Object._check_optional_arg_int(
+                    max_size, self.DEFAULT_MAX_SIZE,
+                    CachingStore, 'max_size', None)),
+                lambda x: x >= 0, 'expected a non-negative int',
+                CachingStore, 'max_size', None, ValueError)
+            ttl = KIF_Object._check_optional_arg_number(
+                ttl, None, CachingStore, 'ttl', None)
+            if ttl is not None:
+                ttl = float(KIF_Object._check_arg(
+                    ttl, lambda x: x > 0, 'expected a positive number',
+                    CachingStore, 'ttl', None, ValueError))
+            self._ttl = ttl
+            self._hits = self._misses = 0
+            self._evictions = self._expirations = 0
+
+        def __len__(self) -> int:
+            return len(self._entries)
+
+        @property
+        def max_size(self) -> int:
+            """The maximum number of entries."""
+            return self._max_size
+
+        @property
+        def ttl(self) -> float | None:
+            """The time-to-live of entries (in seconds)."""
+            return self._ttl
+
+        def get(self, key: Hashable) -> Any | None:
+            """Gets the value associated with `key`.
+
+            Parameters:
+               key: Key.
+
+            Returns:
+               Value or ``None`` (no entry or entry has expired).
+            """
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    if self._ttl is not None and (
+                            time.monotonic() - entry[0] > self._ttl):
+                        del self._entries[key]
+                        self._expirations += 1
+                    else:
+                        self._entries.move_to_end(key)
+                        self._hits += 1
+                        return entry[1]
+                self._misses += 1
+                return None
+
+        def set(self, key: Hashable, value: Any) -> None:
+            """Associates `value` with `key`.
+
+            Parameters:
+               key: Key.
+               value: Value.
+            """
+            if self._max_size == 0:
+                return
+            with self._lock:
+                self._entries[key] = (time.monotonic(), value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+
+        def clear(self) -> None:
+            """Removes all entries and resets the statistics."""
+            with self._lock:
+                self._entries.clear()
+                self._hits = self._misses = 0
+                self._evictions = self._expirations = 0
+
+        def get_statistics(self) -> CachingStore.Statistics:
+            """Gets the cache statistics.
+
+            Returns:
+               Cache statistics.
+            """
+            with self._lock:
+                return CachingStore.Statistics(
+                    hits=self._hits,
+                    misses=self._misses,
+                    evictions=self._evictions,
+                    expirations=self._expirations,
+                    size=len(self._entries))
+
+    @dataclasses.dataclass(frozen=True)
+    class Statistics:
+        """Cache statistics."""
+
+        #: Number of lookups answered by the cache.
+        hits: int
+
+        #: Number of lookups not answered by the cache.
+        misses: int
+
+        #: Number of entries evicted due to the size bound.
+        evictions: int
+
+        #: Number of entries dropped due to the time-to-live.
+        expirations: int
+
+        #: Number of entries currently cached.
+        size: int
+
+    __slots__ = (
+        '_cache',
+    )
+
+    #: Result cache.
+    _cache: CachingStore.Cache
+
+    def __init__(
+            self,
+            store_name: str,
+            source: Store,
+            max_size: int | None = None,
+            ttl: float | None = None,
+            **kwargs: Any
+    ) -> None:
+        KIF_Object._check_arg_isinstance(
+            source, Store, type(self), 'source', 2)
+        self._cache = self.Cache(max_size, ttl)
+        super().__init__(store_name, [source], **kwargs)
+
+    @override
+    @classmethod
+    def get_default_options(cls, context: Context | None = None) -> TOptions:
+        return cast(TOptions, cls.get_context(context).options.store.caching)
+
+    @property
+    def source(self) -> Store:
+        """The source store."""
+        return self.get_source()
+
+    def get_source(self) -> Store:
+        """Gets the source store.
+
+        Returns:
+           Source store.
+        """
+        return self._sources[0]
+
+    @property
+    def cache(self) -> CachingStore.Cache:
+        """The result cache."""
+        return self.get_cache()
+
+    def get_cache(self) -> CachingStore.Cache:
+        """Gets the result cache.
+
+        Returns:
+           Result cache.
+        """
+        return self._cache
+
+    @property
+    def statistics(self) -> CachingStore.Statistics:
+        """The cache statistics."""
+        return self.get_statistics()
+
+    def get_statistics(self) -> CachingStore.Statistics:
+        """Gets the cache statistics.
+
+        Returns:
+           Cache statistics.
+        """
+        return self._cache.get_statistics()
+
+    def clear_cache(self) -> None:
+        """Removes all entries from the result cache."""
+        self._cache.clear()
+
+    def _cache_key(
+            self,
+            name: str,
+            filter: Filter,
+            options: StoreOptions | None = None
+    ) -> Hashable:
+        if options is None:
+            return (name, filter)
+        else:
+            return (
+                name, filter, options.limit, options.distinct,
+                options.distinct_window_size if options.distinct else None)
+
+# -- Ask -------------------------------------------------------------------
+
+    @override
+    def _ask(self, filter: Filter, options: TOptions) -> bool:
+        key = self._cache_key('ask', filter)
+        value = self._cache.get(key)
+        if value is None:
+            value = super()._ask(filter, options)
+            self._cache.set(key, value)
+        return value
+
+    @override
+    async def _aask(self, filter: Filter, options: TOptions) -> bool:
+        key = self._cache_key('ask', filter)
+        value = self._cache.get(key)
+        if value is None:
+            value = await super()._aask(filter, options)
+            self._cache.set(key, value)
+        return value
+
+# -- Count -----------------------------------------------------------------
+
+    @override
+    def _count(self, filter: Filter, options: TOptions) -> int:
+        return self._count_x_cached('count', super()._count, filter, options)
+
+    @override
+    def _count_s(self, filter: Filter, options: TOptions) -> int:
+        return self._count_x_cached(
+            'count_s', super()._count_s, filter, options)
+
+    @override
+    def _count_p(self, filter: Filter, options: TOptions) -> int:
+        return self._count_x_cached(
+            'count_p', super()._count_p, filter, options)
+
+    @override
+    def _count_v(self, filter: Filter, options: TOptions) -> int:
+        return self._count_x_cached(
+            'count_v', super()._count_v, filter, options)
+
+    @override
+    def _count_sp(self, filter: Filter, options: TOptions) -> int:
+        return self._count_x_cached(
+            'count_sp', super()._count_sp, filter, options)
+
+    @override
+    def _count_sv(self, filter: Filter, options: TOptions) -> int:
+        return self._count_x_cached(
+            'count_sv', super()._count_sv, filter, options)
+
+    @override
+    def _count_pv(self, filter: Filter, options: TOptions) -> int:
+        return self._count_x_cached(
+            'count_pv', super()._count_pv, filter, options)
+
+    def _count_x_cached(
+            self,
+            name: str,
+            count_x_fn: Callable[[Filter, TOptions], int],
+            filter: Filter,
+            options: TOptions
+    ) -> int:
+        key = self._cache_key(name, filter)
+        value = self._cache.get(key)
+        if value is None:
+            value = count_x_fn(filter, options)
+            self._cache.set(key, value)
+        return value
+
+    @override
+    async def _acount(self, filter: Filter, options: TOptions) -> int:
+        return await self._acount_x_cached(
+            'count', super()._acount, filter, options)
+
+    @override
+    async def _acount_s(self, filter: Filter, options: TOptions) -> int:
+        return await self._acount_x_cached(
+            'count_s', super()._acount_s, filter, options)
+
+    @override
+    async def _acount_p(self, filter: Filter, options: TOptions) -> int:
+        return await self._acount_x_cached(
+            'count_p', super()._acount_p, filter, options)
+
+    @override
+    async def _acount_v(self, filter: Filter, options: TOptions) -> int:
+        return await self._acount_x_cached(
+            'count_v', super()._acount_v, filter, options)
+
+    @override
+    async def _acount_sp(self, filter: Filter, options: TOptions) -> int:
+        return await self._acount_x_cached(
+            'count_sp', super()._acount_sp, filter, options)
+
+    @override
+    async def _acount_sv(self, filter: Filter, options: TOptions) -> int:
+        return await self._acount_x_cached(
+            'count_sv', super()._acount_sv, filter, options)
+
+    @override
+    async def _acount_pv(self, filter: Filter, options: TOptions) -> int:
+        return await self._acount_x_cached(
+            'count_pv', super()._acount_pv, filter, options)
+
+    async def _acount_x_cached(
+            self,
+            name: str,
+            acount_x_fn: Callable[[Filter, TOptions], Awaitable[int]],
+            filter: Filter,
+            options: TOptions
+    ) -> int:
+        key = self._cache_key(name, filter)
+        value = self._cache.get(key)
+        if value is None:
+            value = await acount_x_fn(filter, options)
+            self._cache.set(key, value)
+        return value
+
+# -- Filter ----------------------------------------------------------------
+
+    @override
+    def _filter(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> Iterator[Statement]:
+        return self._filter_x_cached(
+            'filter', super()._filter, filter, options)
+
+    @override
+    def _filter_s(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> Iterator[Entity]:
+        return self._filter_x_cached(
+            'filter_s', super()._filter_s, filter, options)
+
+    @override
+    def _filter_p(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> Iterator[Property]:
+        return self._filter_x_cached(
+            'filter_p', super()._filter_p, filter, options)
+
+    @override
+    def _filter_v(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> Iterator[Value]:
+        return self._filter_x_cached(
+            'filter_v', super()._filter_v, filter, options)
+
+    @override
+    def _filter_sp(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> Iterator[ValuePair[Entity, Property]]:
+        return self._filter_x_cached(
+            'filter_sp', super()._filter_sp, filter, options)
+
+    @override
+    def _filter_sv(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> Iterator[ValuePair[Entity, Value]]:
+        return self._filter_x_cached(
+            'filter_sv', super()._filter_sv, filter, options)
+
+    @override
+    def _filter_pv(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> Iterator[ValueSnak]:
+        return self._filter_x_cached(
+            'filter_pv', super()._filter_pv, filter, options)
+
+    def _filter_x_cached(
+            self,
+            name: str,
+            filter_x_fn: Callable[[Filter, TOptions], Iterator[T]],
+            filter: Filter,
+            options: TOptions
+    ) -> Iterator[T]:
+        key = self._cache_key(name, filter, options)
+        values = self._cache.get(key)
+        if values is None:
+            return self._filter_x_cached_record(
+                key, filter_x_fn(filter, options))
+        else:
+            return iter(values)
+
+    def _filter_x_cached_record(
+            self,
+            key: Hashable,
+            it: Iterator[T]
+    ) -> Iterator[T]:
+        values: list[T] = []
+        for value in it:
+            values.append(value)
+            yield value
+        self._cache.set(key, tuple(values))
+
+    @override
+    def _afilter(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> AsyncIterator[Statement]:
+        return self._afilter_x_cached(
+            'filter', super()._afilter, filter, options)
+
+    @override
+    def _afilter_s(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> AsyncIterator[Entity]:
+        return self._afilter_x_cached(
+            'filter_s', super()._afilter_s, filter, options)
+
+    @override
+    def _afilter_p(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> AsyncIterator[Property]:
+        return self._afilter_x_cached(
+            'filter_p', super()._afilter_p, filter, options)
+
+    @override
+    def _afilter_v(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> AsyncIterator[Value]:
+        return self._afilter_x_cached(
+            'filter_v', super()._afilter_v, filter, options)
+
+    @override
+    def _afilter_sp(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> AsyncIterator[ValuePair[Entity, Property]]:
+        return self._afilter_x_cached(
+            'filter_sp', super()._afilter_sp, filter, options)
+
+    @override
+    def _afilter_sv(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> AsyncIterator[ValuePair[Entity, Value]]:
+        return self._afilter_x_cached(
+            'filter_sv', super()._afilter_sv, filter, options)
+
+    @override
+    def _afilter_pv(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> AsyncIterator[ValueSnak]:
+        return self._afilter_x_cached(
+            'filter_pv', super()._afilter_pv, filter, options)
+
+    def _afilter_x_cached(
+            self,
+            name: str,
+            afilter_x_fn: Callable[[Filter, TOptions], AsyncIterator[T]],
+            filter: Filter,
+            options: TOptions
+    ) -> AsyncIterator[T]:
+        key = self._cache_key(name, filter, options)
+        values = self._cache.get(key)
+        if values is None:
+            return self._afilter_x_cached_record(
+                key, afilter_x_fn(filter, options))
+        else:
+            return self._afilter_x_cached_replay(values)
+
+    async def _afilter_x_cached_record(
+            self,
+            key: Hashable,
+            it: AsyncIterator[T]
+    ) -> AsyncIterator[T]:
+        values: list[T] = []
+        async for value in it:
+            values.append(value)
+            yield value
+        self._cache.set(key, tuple(values))
+
+    async def _afilter_x_cached_replay(
+            self,
+            values: Sequence[T]
+    ) -> AsyncIterator[T]:
+        for value in values:
+            yield value
@@ -3,21 +3,72 @@
 
 from __future__ import annotations
 
+import abc
+import array
 import asyncio
+import bisect
+import builtins
+import concurrent.futures
 import dataclasses
+import hashlib
+import json
 import logging
+import mmap as mmaplib
+import os
+import pathlib
+import pickle
+import struct
+import sys
+import threading
 
 from .. import functools, itertools
-from ..model import Filter, Graph, Statement, TGraph
+from ..model import (
+    AndFingerprint,
+    AnnotatedStatement,
+    ConverseSnakFingerprint,
+    DeepDataValue,
+    EdgePath,
+    EmptyFingerprint,
+    Entity,
+    Filter,
+    Fingerprint,
+    Graph,
+    KIF_Object,
+    NoValueSnak,
+    OrFingerprint,
+    PathFingerprint,
+    Property,
+    PseudoProperty,
+    Quantity,
+    SequencePath,
+    Snak,
+    SnakFingerprint,
+    SomeValueSnak,
+    Statement,
+    String,
+    TGraph,
+    Time,
+    Value,
+    ValueFingerprint,
+    ValueSnak,
+)
 from ..typing import (
     Any,
+    AsyncGenerator,
     AsyncIterator,
+    BinaryIO,
+    Callable,
+    cast,
     ClassVar,
     Final,
+    Hashable,
     Iterable,
     Iterator,
+    Literal,
+    ModuleType,
     override,
     Sequence,
+    Set,
     TypeAlias,
 )
 from .abc import Store, StoreOptions
@@ -85,49 +136,1796 @@ class MemoryStore(
 
     Parameters:
        store_name: Name of the store plugin to instantiate.
+       args: Statements.
+       graph: KIF graph to be used as input source.
+       index: Whether to maintain subject, property, and value indexes
+          (and claim counts).
+       compact: Whether to use the compact (dictionary-encoded) storage.
+       executor: Executor of async filters (``'thread'`` or
+          ``'process'``).
+       workers: Number of worker processes (if `executor` is
+          ``'process'``).
+       kwargs: Other keyword arguments.
     """
 
+    #: Type alias for index keys.
+    IndexKey: TypeAlias = Hashable
+
+    #: Type alias for indexes.
+    Index: TypeAlias = dict[Hashable, set[Statement]]
+
+    #: Type alias for index names.
+    IndexName: TypeAlias = Literal['subject', 'property', 'value']
+
+    class Counts:
+        """Claim counts.
+
+        Keeps the number of distinct claims in storage and, for each
+        count key (see :meth:`MemoryStore._count_keys`), the number of
+        distinct claims whose subject, property, or value has that key.
+        """
+
+        __slots__ = (
+            'claims',
+            'subject',
+            'property',
+            'value',
+        )
+
+        #: Number of distinct claims.
+        claims: int
+
+        #: Number of distinct claims by subject key.
+        subject: dict[Hashable, int]
+
+        #: Number of distinct claims by property key.
+        property: dict[Hashable, int]
+
+        #: Number of distinct claims by value key.
+        value: dict[Hashable, int]
+
+        def __init__(self) -> None:
+            self.claims = 0
+            self.subject = {}
+            self.property = {}
+            self.value = {}
+
+        def update(self, claim: tuple[Entity, Snak], delta: int) -> None:
+            """Adds `delta` to the counts of claim.
+
+            Parameters:
+               claim: Claim (subject and snak).
+               delta: ``1`` or ``-1``.
+            """
+            subject, snak = claim
+            self.claims += delta
+            self._update(self.subject, subject, delta)
+            self._update(self.property, snak.property, delta)
+            if isinstance(snak, ValueSnak):
+                self._update(self.value, snak.value, delta)
+
+        def _update(
+                self,
+                counts: dict[Hashable, int],
+                value: Value,
+                delta: int
+        ) -> None:
+            for key in MemoryStore._count_keys(value):
+                n = counts.get(key, 0) + delta
+                if n > 0:
+                    counts[key] = n
+                else:
+                    del counts[key]  # drop zero counts
+
+        def get(
+                self,
+                by: MemoryStore.IndexName | None = None,
+                key: Hashable = None
+        ) -> int:
+            """Gets claim count.
+
+            Parameters:
+               by: Index name.
+               key: Count key.
+
+            Returns:
+               The number of distinct claims whose `by` component has count
+               key `key`, or of all distinct claims if `by` is ``None``.
+            """
+            if by is None:
+                return self.claims
+            else:
+                return cast(dict[Hashable, int], getattr(self, by)).get(
+                    key, 0)
+
+    class Storage(abc.ABC):
+        """Abstract base class for memory store storages."""
+
+        __slots__ = ()
+
+        @abc.abstractmethod
+        def __len__(self) -> int:
+            raise NotImplementedError
+
+        @abc.abstractmethod
+        def __iter__(self) -> Iterator[Statement]:
+            raise NotImplementedError
+
+        @abc.abstractmethod
+        def add(self, stmt: Statement) -> bool:
+            """Adds statement to storage.
+
+            Parameters:
+               stmt: Statement.
+
+            Returns:
+               ``True`` if `stmt` was added; ``False`` if it was already in
+               storage.
+            """
+            raise NotImplementedError
+
+        @abc.abstractmethod
+        def remove(self, stmt: Statement) -> bool:
+            """Removes statement from storage.
+
+            Parameters:
+               stmt: Statement.
+
+            Returns:
+               ``True`` if `stmt` was removed; ``False`` if it was not in
+               storage.
+            """
+            raise NotImplementedError
+
+        @abc.abstractmethod
+        def candidates(
+                self,
+                filter: Filter,
+                snapshot: bool = False
+        ) -> Iterable[Statement]:
+            """Gets the statements in storage that may match filter.
+
+            The statements are annotated if `filter` is annotated, and
+            unannotated otherwise.
+
+            Parameters:
+               filter: Filter.
+               snapshot: Whether the result must not be affected by
+                  subsequent additions or removals.
+
+            Returns:
+               A superset of the statements in storage matching `filter`.
+            """
+            raise NotImplementedError
+
+        @abc.abstractmethod
+        def partition(
+                self,
+                filter: Filter,
+                by: MemoryStore.IndexName
+        ) -> Iterable[Iterable[Statement]]:
+            """Gets the statements in storage that may match filter
+            partitioned by subject, property, or value.
+
+            Statements with the same `by` component are guaranteed to occur
+            in the same partition.
+
+            Parameters:
+               filter: Filter.
+               by: Index name.
+
+            Returns:
+               The candidate statements partitioned by `by`.
+            """
+            raise NotImplementedError
+
+        def count(
+                self,
+                by: MemoryStore.IndexName | None = None,
+                key: Hashable = None
+        ) -> int | None:
+            """Gets the number of distinct claims in storage whose `by`
+            component has count key `key`.
+
+            Parameters:
+               by: Index name (or ``None`` to count all distinct claims).
+               key: Count key (see :meth:`MemoryStore._count_keys`).
+
+            Returns:
+               Claim count, or ``None`` if storage does not keep counts.
+            """
+            return None
+
+    class SetStorage(Storage):
+        """Set storage (statements are stored as is).
+
+        The annotated (resp., unannotated) views of unannotated (resp.,
+        annotated) statements are built on demand and not kept.
+
+        Parameters:
+           stmts: Statements.
+           index: Whether to maintain subject, property, and value indexes
+              (and claim counts).
+        """
+
+        __slots__ = (
+            '_statements',
+            '_subject_index',
+            '_property_index',
+            '_value_index',
+            '_claims',
+            '_counts',
+        )
+
+        #: Statements.
+        _statements: set[Statement]
+
+        #: Subject index (maps subject keys to statements).
+        _subject_index: MemoryStore.Index | None
+
+        #: Property index (maps property keys to statements).
+        _property_index: MemoryStore.Index | None
+
+        #: Value index (maps value keys to value-snak statements).
+        _value_index: MemoryStore.Index | None
+
+        #: Claim multiplicities (maps claims to the number of statements
+        #: in storage with that claim).
+        _claims: dict[tuple[Entity, Snak], int] | None
+
+        #: Claim counts.
+        _counts: MemoryStore.Counts | None
+
+        def __init__(
+                self,
+                stmts: Iterable[Statement] = (),
+                index: bool = True
+        ) -> None:
+            self._statements = set(stmts)
+            self._subject_index = None
+            self._property_index = None
+            self._value_index = None
+            self._claims = None
+            self._counts = None
+            if index:
+                self._init_indexes()
+
+        def _init_indexes(self) -> None:
+            self._subject_index = {}
+            self._property_index = {}
+            self._value_index = {}
+            self._claims = {}
+            self._counts = MemoryStore.Counts()
+            for stmt in self._statements:
+                self._index_statement(stmt)
+
+        def _index_statement(self, stmt: Statement) -> None:
+            assert self._subject_index is not None
+            assert self._property_index is not None
+            assert self._value_index is not None
+            assert self._claims is not None
+            assert self._counts is not None
+            claim = stmt.claim
+            n = self._claims.get(claim, 0)
+            self._claims[claim] = n + 1
+            if n == 0:
+                self._counts.update(claim, 1)
+            key = MemoryStore._index_key
+            self._subject_index.setdefault(
+                key(stmt.subject), set()).add(stmt)
+            self._property_index.setdefault(
+                key(stmt.snak.property), set()).add(stmt)
+            if isinstance(stmt.snak, ValueSnak):
+                self._value_index.setdefault(
+                    key(stmt.snak.value), set()).add(stmt)
+
+        def _unindex_statement(self, stmt: Statement) -> None:
+            assert self._subject_index is not None
+            assert self._property_index is not None
+            assert self._value_index is not None
+            assert self._claims is not None
+            assert self._counts is not None
+            claim = stmt.claim
+            n = self._claims[claim]
+            if n == 1:
+                del self._claims[claim]
+                self._counts.update(claim, -1)
+            else:
+                self._claims[claim] = n - 1
+
+            def discard(index: MemoryStore.Index, value: Value) -> None:
+                key = MemoryStore._index_key(value)
+                group = index.get(key)
+                if group is not None:
+                    group.discard(stmt)
+                    if not group:
+                        del index[key]  # drop empty groups
+            discard(self._subject_index, stmt.subject)
+            discard(self._property_index, stmt.snak.property)
+            if isinstance(stmt.snak, ValueSnak):
+                discard(self._value_index, stmt.snak.value)
+
+        @override
+        def __len__(self) -> int:
+            return len(self._statements)
+
+        @override
+        def __iter__(self) -> Iterator[Statement]:
+            return iter(self._statements)
+
+        @override
+        def add(self, stmt: Statement) -> bool:
+            if stmt in self._statements:
+                return False
+            self._statements.add(stmt)
+            if self._subject_index is not None:
+                self._index_statement(stmt)
+            return True
+
+        @override
+        def remove(self, stmt: Statement) -> bool:
+            if stmt not in self._statements:
+                return False
+            self._statements.remove(stmt)
+            if self._subject_index is not None:
+                self._unindex_statement(stmt)
+            return True
+
+        @override
+        def candidates(
+                self,
+                filter: Filter,
+                snapshot: bool = False
+        ) -> Iterable[Statement]:
+            view = functools.partial(self._view, annotated=filter.annotated)
+            stmts = map(view, self._candidates(filter))
+            return tuple(stmts) if snapshot else stmts
+
+        @override
+        def count(
+                self,
+                by: MemoryStore.IndexName | None = None,
+                key: Hashable = None
+        ) -> int | None:
+            if self._counts is None:
+                return None
+            return self._counts.get(by, key)
+
+        def _view(self, stmt: Statement, annotated: bool) -> Statement:
+            if isinstance(stmt, AnnotatedStatement) == annotated:
+                return stmt     # nothing to do
+            return stmt.annotate() if annotated else stmt.unannotate()
+
+        @override
+        def partition(
+                self,
+                filter: Filter,
+                by: MemoryStore.IndexName
+        ) -> Iterable[Iterable[Statement]]:
+            stmts = self._candidates(filter)
+            index = getattr(self, f'_{by}_index')
+            if stmts is self._statements and index is not None:
+                return index.values()
+            else:
+                return (stmts,)
+
+        def _candidates(self, filter: Filter) -> Set[Statement]:
+            if self._subject_index is None:
+                return self._statements
+            assert self._property_index is not None
+            assert self._value_index is not None
+            filter = filter.normalize()
+            candidates: list[set[Statement]] = []
+            for fp, index in (
+                    (filter.subject, self._subject_index),
+                    (filter.property, self._property_index),
+                    (filter.value, self._value_index)):
+                keys = MemoryStore._index_keys(fp)
+                if keys is None:
+                    continue    # cannot use index
+                if len(keys) == 1:
+                    candidates.append(index.get(next(iter(keys)), set()))
+                else:
+                    candidates.append(set().union(
+                        *map(lambda k: index.get(k, ()), keys)))
+            if not candidates:
+                return self._statements
+            candidates.sort(key=len)
+            if len(candidates) == 1:
+                return candidates[0]
+            else:
+                return candidates[0].intersection(*candidates[1:])
+
+    class CompactStorage(Storage):
+        """Compact storage (statements are dictionary-encoded).
+
+        Values and annotations are encoded as integer ids and each
+        statement is stored as a row of integer columns.  Statement objects
+        are built only for the rows that are actually read.
+
+        Removed rows are marked as dead and dropped from the indexes.  When
+        the dead rows exceed :attr:`compaction_ratio` of all rows (and
+        there are at least :attr:`compaction_threshold` of them), the
+        storage is compacted, i.e., its live rows are copied into fresh
+        columns, indexes, and term dictionary.  The compact storage always
+        maintains subject, property, and value indexes and claim counts.
+
+        Parameters:
+           stmts: Statements.
+        """
+
+        #: Id of missing terms.
+        NIL: Final[int] = -1
+
+        #: Minimum number of rows to scan using NumPy (if available).
+        numpy_threshold: ClassVar[int] = 1024
+
+        #: Minimum number of dead rows to trigger compaction.
+        compaction_threshold: ClassVar[int] = 1024
+
+        #: Minimum fraction of dead rows to trigger compaction.
+        compaction_ratio: ClassVar[float] = .5
+
+        __slots__ = (
+            '_terms',
+            '_term_ids',
+            '_term_masks',
+            '_subject',
+            '_property',
+            '_value',
+            '_snak',
+            '_annotation',
+            '_alive',
+            '_size',
+            '_subject_index',
+            '_property_index',
+            '_value_index',
+            '_counts',
+        )
+
+        #: Term dictionary (maps ids to values and annotations).
+        _terms: list[Any]
+
+        #: Inverse term dictionary (maps values and annotations to ids).
+        _term_ids: dict[Hashable, int]
+
+        #: Datatype masks of terms (zero for annotations).
+        _term_masks: array.array[int]
+
+        #: Subject column.
+        _subject: array.array[int]
+
+        #: Property column.
+        _property: array.array[int]
+
+        #: Value column (:attr:`NIL` for non-value snaks).
+        _value: array.array[int]
+
+        #: Snak column (snak masks).
+        _snak: array.array[int]
+
+        #: Annotation column (:attr:`NIL` for unannotated statements).
+        _annotation: array.array[int]
+
+        #: Liveness column (zero for removed rows).
+        _alive: bytearray
+
+        #: Number of live rows.
+        _size: int
+
+        #: Subject index (maps subject keys to rows).
+        _subject_index: dict[Hashable, array.array[int]]
+
+        #: Property index (maps property keys to rows).
+        _property_index: dict[Hashable, array.array[int]]
+
+        #: Value index (maps value keys to value-snak rows).
+        _value_index: dict[Hashable, array.array[int]]
+
+        #: Claim counts.
+        _counts: MemoryStore.Counts
+
+        def __init__(self, stmts: Iterable[Statement] = ()) -> None:
+            self._init_columns()
+            for stmt in stmts:
+                self.add(stmt)
+
+        def _init_columns(self) -> None:
+            ###
+            # IMPORTANT: Compaction relies on this creating fresh objects,
+            # as the old ones may still be in use by snapshots.
+            ###
+            self._terms = []
+            self._term_ids = {}
+            self._term_masks = array.array('q')
+            self._subject = array.array('q')
+            self._property = array.array('q')
+            self._value = array.array('q')
+            self._snak = array.array('B')
+            self._annotation = array.array('q')
+            self._alive = bytearray()
+            self._size = 0
+            self._subject_index = {}
+            self._property_index = {}
+            self._value_index = {}
+            self._counts = MemoryStore.Counts()
+
+        def _init_counts(self) -> None:
+            self._counts = MemoryStore.Counts()
+            decode = self._decoder(False)
+            seen: set[tuple[int, int, int, int]] = set()
+            for row in self._scan(Filter(), None):
+                claim = (self._subject[row], self._property[row],
+                         self._value[row], self._snak[row])
+                if claim not in seen:
+                    seen.add(claim)
+                    self._counts.update(decode(row).claim, 1)
+
+        def _encode(self, term: Hashable, mask: int = 0) -> int:
+            id = self._term_ids.get(term)
+            if id is None:
+                id = len(self._terms)
+                self._terms.append(term)
+                self._term_ids[term] = id
+                self._term_masks.append(mask)
+            return id
+
+        def _encode_value(self, value: Value) -> int:
+            return self._encode(
+                value, Filter.DatatypeMask.check(type(value)).value)
+
+        def _decode(
+                self,
+                row: int,
+                annotated: bool | None = None
+        ) -> Statement:
+            return self._decoder(annotated)(row)
+
+        def _decoder(
+                self,
+                annotated: bool | None = None
+        ) -> Callable[[int], Statement]:
+            ###
+            # The returned function is bound to the current columns, which
+            # are never overwritten (compaction replaces them), and so keeps
+            # decoding the same statements.
+            ###
+            terms, subjects, properties, values, snaks, annotations = (
+                self._terms, self._subject, self._property, self._value,
+                self._snak, self._annotation)
+            nil = self.NIL
+            value_snak = Filter.VALUE_SNAK.value
+            some_value_snak = Filter.SOME_VALUE_SNAK.value
+
+            def decode(row: int) -> Statement:
+                property = terms[properties[row]]
+                snak_mask = snaks[row]
+                snak: Snak
+                if snak_mask == value_snak:
+                    snak = ValueSnak(property, terms[values[row]])
+                elif snak_mask == some_value_snak:
+                    snak = SomeValueSnak(property)
+                else:
+                    snak = NoValueSnak(property)
+                subject = terms[subjects[row]]
+                annotation = annotations[row]
+                if annotated is False:
+                    return Statement(subject, snak)
+                elif annotation != nil:
+                    return AnnotatedStatement(
+                        subject, snak, *terms[annotation])
+                elif annotated:
+                    return AnnotatedStatement(subject, snak)
+                else:
+                    return Statement(subject, snak)
+            return decode
+
+        def _find(self, stmt: Statement) -> int | None:
+            return self._lookup(stmt)[0]
+
+        def _lookup(self, stmt: Statement) -> tuple[int | None, int]:
+            ###
+            # Gets the row of `stmt` (if any) and the number of live rows
+            # with the same claim as `stmt`.
+            ###
+            ids = self._term_ids
+            snak = stmt.snak
+            subject = ids.get(stmt.subject)
+            property = ids.get(snak.property)
+            if isinstance(snak, ValueSnak):
+                value = ids.get(snak.value)
+            else:
+                value = self.NIL
+            if isinstance(stmt, AnnotatedStatement):
+                annotation = ids.get(
+                    (stmt.qualifiers, stmt.references, stmt.rank))
+            else:
+                annotation = self.NIL
+            if subject is None or property is None or value is None:
+                return None, 0  # some claim term is unknown
+            ###
+            # Scan the smallest index group containing the statement.
+            ###
+            key = MemoryStore._index_key
+            groups = [
+                self._index_get('subject', key(stmt.subject)),
+                self._index_get('property', key(snak.property))]
+            if isinstance(snak, ValueSnak):
+                groups.append(self._index_get('value', key(snak.value)))
+            snak_mask = Filter.SnakMask.check(snak).value
+            found, claims = None, 0
+            for row in min(groups, key=len):
+                if (self._alive[row]
+                        and self._subject[row] == subject
+                        and self._property[row] == property
+                        and self._value[row] == value
+                        and self._snak[row] == snak_mask):
+                    claims += 1
+                    if self._annotation[row] == annotation:
+                        found = row
+            return found, claims
+
+        @override
+        def __len__(self) -> int:
+            return self._size
+
+        @override
+        def __iter__(self) -> Iterator[Statement]:
+            return map(self._decoder(), self._scan(Filter(), None))
+
+        @override
+        def add(self, stmt: Statement) -> bool:
+            row, claims = self._lookup(stmt)
+            if row is not None:
+                return False
+            self._append(stmt)
+            if claims == 0:
+                self._counts.update(stmt.claim, 1)
+            return True
+
+        def _append(self, stmt: Statement) -> None:
+            row = len(self._alive)
+            key = MemoryStore._index_key
+            snak = stmt.snak
+            self._subject.append(self._encode_value(stmt.subject))
+            self._subject_index.setdefault(
+                key(stmt.subject), array.array('q')).append(row)
+            self._property.append(self._encode_value(snak.property))
+            self._property_index.setdefault(
+                key(snak.property), array.array('q')).append(row)
+            if isinstance(snak, ValueSnak):
+                self._value.append(self._encode_value(snak.value))
+                self._value_index.setdefault(
+                    key(snak.value), array.array('q')).append(row)
+            else:
+                self._value.append(self.NIL)
+            self._snak.append(Filter.SnakMask.check(snak).value)
+            if isinstance(stmt, AnnotatedStatement):
+                self._annotation.append(self._encode(
+                    (stmt.qualifiers, stmt.references, stmt.rank)))
+            else:
+                self._annotation.append(self.NIL)
+            self._alive.append(1)
+            self._size += 1
+
+        @override
+        def remove(self, stmt: Statement) -> bool:
+            row, claims = self._lookup(stmt)
+            if row is None:
+                return False
+            if claims == 1:
+                self._counts.update(stmt.claim, -1)
+            key = MemoryStore._index_key
+            snak = stmt.snak
+            self._unindex_row(self._subject_index, key(stmt.subject), row)
+            self._unindex_row(self._property_index, key(snak.property), row)
+            if isinstance(snak, ValueSnak):
+                self._unindex_row(self._value_index, key(snak.value), row)
+            self._alive[row] = 0
+            self._size -= 1
+            dead = len(self._alive) - self._size
+            if (dead >= self.compaction_threshold
+                    and dead > len(self._alive) * self.compaction_ratio):
+                self._compact()
+            return True
+
+        def _unindex_row(
+                self,
+                index: dict[Hashable, array.array[int]],
+                key: MemoryStore.IndexKey,
+                row: int
+        ) -> None:
+            rows = index[key]
+            i = bisect.bisect_left(rows, row)  # rows are sorted
+            assert i < len(rows) and rows[i] == row
+            if len(rows) == 1:
+                del index[key]
+            else:
+                del rows[i]
+
+        def _compact(self) -> None:
+            stmts = list(map(self._decoder(), self._scan(Filter(), None)))
+            counts = self._counts  # compaction keeps the same claims
+            self._init_columns()
+            for stmt in stmts:
+                self._append(stmt)
+            self._counts = counts
+
+        @override
+        def count(
+                self,
+                by: MemoryStore.IndexName | None = None,
+                key: Hashable = None
+        ) -> int | None:
+            return self._counts.get(by, key)
+
+        @override
+        def candidates(
+                self,
+                filter: Filter,
+                snapshot: bool = False
+        ) -> Iterable[Statement]:
+            ###
+            # The result is always a snapshot: rows are never overwritten,
+            # the rows to be decoded are fixed here, and the decoder is
+            # bound to the current columns.
+            ###
+            filter = filter.normalize()
+            return map(self._decoder(filter.annotated), self._scan(
+                filter, self._candidate_rows(filter)))
+
+        @override
+        def partition(
+                self,
+                filter: Filter,
+                by: MemoryStore.IndexName
+        ) -> Iterable[Iterable[Statement]]:
+            filter = filter.normalize()
+            rows = self._candidate_rows(filter)
+            decode = self._decoder()
+            if rows is not None:
+                return (map(decode, self._scan(filter, rows)),)
+            else:
+                return map(lambda group: map(
+                    decode, self._scan(filter, group)),
+                    self._index_groups(by))
+
+        def _candidate_rows(self, filter: Filter) -> Sequence[int] | None:
+            candidates: list[set[int]] = []
+            for fp, by in (
+                    (filter.subject, 'subject'),
+                    (filter.property, 'property'),
+                    (filter.value, 'value')):
+                keys = MemoryStore._index_keys(fp)
+                if keys is None:
+                    continue    # cannot use index
+                rows: set[int] = set()
+                for key in keys:
+                    rows.update(self._index_get(
+                        cast(MemoryStore.IndexName, by), key))
+                candidates.append(rows)
+            if not candidates:
+                return None
+            candidates.sort(key=len)
+            return sorted(candidates[0].intersection(*candidates[1:]))
+
+        def _index_get(
+                self,
+                by: MemoryStore.IndexName,
+                key: MemoryStore.IndexKey
+        ) -> Sequence[int]:
+            return getattr(self, f'_{by}_index').get(key, ())
+
+        def _index_groups(
+                self,
+                by: MemoryStore.IndexName
+        ) -> Iterable[Sequence[int]]:
+            return getattr(self, f'_{by}_index').values()
+
+        def _scan(
+                self,
+                filter: Filter,
+                rows: Sequence[int] | None
+        ) -> Sequence[int]:
+            ###
+            # Selects the live rows (among `rows`, or among all rows if
+            # `rows` is None) whose snak, subject datatype, and value
+            # datatype agree with the masks of `filter`.  This only prunes
+            # the candidates: the remaining parts of the filter are checked
+            # by the caller over the decoded statements.
+            ###
+            n = len(self._alive) if rows is None else len(rows)
+            if n == 0:
+                return ()
+            snak_mask = filter.snak_mask.value
+            subject_mask = filter.subject_mask.value
+            value_mask = filter.value_mask.value
+            np = self._numpy() if n >= self.numpy_threshold else None
+            if np is not None:
+                idx = np.asarray(rows, dtype=np.int64)\
+                    if rows is not None else None
+
+                def column(col: Any, dtype: Any) -> Any:
+                    a = np.frombuffer(col, dtype=dtype)
+                    return a if idx is None else a[idx]
+                masks = np.frombuffer(self._term_masks, dtype=np.int64)
+                snak = column(self._snak, np.uint8)
+                sel = column(self._alive, np.uint8) != 0
+                sel &= (snak & snak_mask) != 0
+                sel &= (masks[column(
+                    self._subject, np.int64)] & subject_mask) != 0
+                if value_mask != Filter.VALUE.value:
+                    sel &= (snak != Filter.VALUE_SNAK.value) | ((masks[
+                        column(self._value, np.int64)] & value_mask) != 0)
+                hits = np.flatnonzero(sel)
+                return cast(Sequence[int], (
+                    hits if idx is None else idx[hits]).tolist())
+            else:
+                alive, snak, subject, value, masks = (
+                    self._alive, self._snak, self._subject, self._value,
+                    self._term_masks)
+                value_snak = Filter.VALUE_SNAK.value
+                return array.array('q', (
+                    row for row in (range(n) if rows is None else rows)
+                    if alive[row]
+                    and snak[row] & snak_mask
+                    and masks[subject[row]] & subject_mask
+                    and (snak[row] != value_snak
+                         or masks[value[row]] & value_mask)))
+
+        @classmethod
+        def _numpy(cls) -> ModuleType | None:
+            try:
+                import numpy
+                return numpy
+            except ImportError:
+                return None
+
+        def dump(self, file: BinaryIO) -> None:
+            """Writes storage to file in snapshot format.
+
+            See :class:`MemoryStore.MappedStorage`.
+
+            Parameters:
+               file: Binary file.
+            """
+            assert self._size == len(self._alive)  # no dead rows
+            term_data = list(map(pickle.dumps, self._terms))
+            term_offsets = array.array('q', [0])
+            for data in term_data:
+                term_offsets.append(term_offsets[-1] + len(data))
+            sections: list[tuple[str, Any]] = [
+                ('term_offsets', term_offsets),
+                ('term_data', b''.join(term_data)),
+                ('term_masks', self._term_masks),
+                ('subject', self._subject),
+                ('property', self._property),
+                ('value', self._value),
+                ('snak', self._snak),
+                ('annotation', self._annotation),
+                ('alive', self._alive)]
+            for by in ('subject', 'property', 'value'):
+                ###
+                # Indexes are stored as sorted arrays of key digests plus
+                # the corresponding row groups.  Groups whose keys have the
+                # same digest are merged (these only introduce spurious
+                # candidates).
+                ###
+                groups: dict[int, array.array[int]] = {}
+                index: dict[Hashable, array.array[int]] = getattr(
+                    self, f'_{by}_index')
+                for key, rows in index.items():
+                    groups.setdefault(
+                        MemoryStore.MappedStorage._digest(key),
+                        array.array('q')).extend(rows)
+                digests = array.array('q', sorted(groups))
+                offsets = array.array('q', [0])
+                all_rows = array.array('q')
+                for digest in digests:
+                    all_rows.extend(sorted(groups[digest]))
+                    offsets.append(len(all_rows))
+                sections.append((f'{by}_index_digests', digests))
+                sections.append((f'{by}_index_offsets', offsets))
+                sections.append((f'{by}_index_rows', all_rows))
+            layout: dict[str, tuple[int, int]] = {}
+            offset = 0
+            for name, data in sections:
+                size = memoryview(data).nbytes
+                layout[name] = (offset, size)
+                offset += size + (-size % 8)
+            header = json.dumps({
+                'version': MemoryStore.MappedStorage.VERSION,
+                'byteorder': sys.byteorder,
+                'size': self._size,
+                'sections': layout}).encode()
+            file.write(MemoryStore.MappedStorage.MAGIC)
+            file.write(struct.pack('<q', len(header)))
+            file.write(header)
+            file.write(bytes(-len(header) % 8))
+            for _, data in sections:
+                size = memoryview(data).nbytes
+                file.write(data)
+                file.write(bytes(-size % 8))
+
+    class MappedStorage(CompactStorage):
+        """Compact storage backed by a snapshot buffer.
+
+        The snapshot buffer (usually a memory-mapped file) is used as is:
+        columns and indexes are views over it, and terms are unpickled on
+        demand.  Hence, the storage is read-only and processes which map
+        the same file share its physical pages.
+
+        Parameters:
+           buffer: Snapshot buffer.
+           path: Path to snapshot file (if `buffer` came from a file).
+        """
+
+        #: Magic number of snapshot files.
+        MAGIC: Final[bytes] = b'KIFMEMST'
+
+        #: Version of the snapshot format.
+        VERSION: Final[int] = 1
+
+        class Terms(Sequence[Any]):
+            """Lazily unpickled term dictionary.
+
+            Parameters:
+               offsets: Term offsets.
+               data: Pickled terms.
+            """
+
+            __slots__ = (
+                '_offsets',
+                '_data',
+                '_cache',
+            )
+
+            #: Term offsets.
+            _offsets: Sequence[int]
+
+            #: Pickled terms.
+            _data: memoryview
+
+            #: Unpickled terms.
+            _cache: dict[int, Any]
+
+            def __init__(
+                    self,
+                    offsets: Sequence[int],
+                    data: memoryview
+            ) -> None:
+                self._offsets = offsets
+                self._data = data
+                self._cache = {}
+
+            @override
+            def __len__(self) -> int:
+                return len(self._offsets) - 1
+
+            @override
+            def __getitem__(self, i: Any) -> Any:
+                term = self._cache.get(i)
+                if term is None:
+                    term = pickle.loads(
+                        self._data[self._offsets[i]:self._offsets[i + 1]])
+                    self._cache[i] = term
+                return term
+
+        __slots__ = (
+            '_buffer',
+            '_path',
+            '_indexes',
+        )
+
+        #: Snapshot buffer.
+        _buffer: Any
+
+        #: Path to snapshot file.
+        _path: pathlib.PurePath | None
+
+        #: Index arrays (key digests, group offsets, and rows).
+        _indexes: dict[str, tuple[Sequence[int], Sequence[int], Sequence[int]]]
+
+        @classmethod
+        def load(
+                cls,
+                path: pathlib.PurePath | str,
+                mmap: bool = True
+        ) -> MemoryStore.MappedStorage:
+            """Loads mapped storage from snapshot file.
+
+            Parameters:
+               path: Path to snapshot file.
+               mmap: Whether to memory-map the snapshot file (instead of
+                  reading it into memory).
+
+            Returns:
+               Mapped storage.
+            """
+            with builtins.open(path, 'rb') as file:
+                if mmap:
+                    buffer: Any = mmaplib.mmap(
+                        file.fileno(), 0, access=mmaplib.ACCESS_READ)
+                else:
+                    buffer = file.read()
+            return cls(buffer, pathlib.Path(path))
+
+        def __init__(
+                self,
+                buffer: Any,
+                path: pathlib.PurePath | None = None
+        ) -> None:
+            super().__init__()
+            self._buffer = buffer
+            self._path = path
+            view = memoryview(buffer)
+            if bytes(view[:8]) != self.MAGIC:
+                raise ValueError('not a memory store snapshot')
+            (header_size,) = struct.unpack_from('<q', view, 8)
+            header = json.loads(bytes(view[16:16 + header_size]))
+            if header['version'] != self.VERSION:
+                raise ValueError(
+                    f"unsupported snapshot version {header['version']}")
+            if header['byteorder'] != sys.byteorder:
+                raise ValueError(
+                    f"unsupported snapshot byte order {header['byteorder']}")
+            start = 16 + header_size + (-header_size % 8)
+
+            def section(name: str, format: Literal['q', 'B']) -> Any:
+                offset, size = header['sections'][name]
+                return view[start + offset:start + offset + size].cast(format)
+            self._terms = cast(list[Any], self.Terms(
+                section('term_offsets', 'q'), section('term_data', 'B')))
+            self._term_masks = section('term_masks', 'q')
+            self._subject = section('subject', 'q')
+            self._property = section('property', 'q')
+            self._value = section('value', 'q')
+            self._snak = section('snak', 'B')
+            self._annotation = section('annotation', 'q')
+            self._alive = section('alive', 'B')
+            self._size = header['size']
+            self._indexes = {
+                by: (section(f'{by}_index_digests', 'q'),
+                     section(f'{by}_index_offsets', 'q'),
+                     section(f'{by}_index_rows', 'q'))
+                for by in ('subject', 'property', 'value')}
+
+        @property
+        def path(self) -> pathlib.PurePath | None:
+            """The path to snapshot file."""
+            return self._path
+
+        @classmethod
+        def _digest(cls, key: MemoryStore.IndexKey) -> int:
+            return int.from_bytes(hashlib.blake2b(
+                repr(key).encode(), digest_size=8).digest(),
+                sys.byteorder, signed=True)
+
+        @override
+        def add(self, stmt: Statement) -> bool:
+            raise NotImplementedError('mapped storage is read-only')
+
+        @override
+        def remove(self, stmt: Statement) -> bool:
+            raise NotImplementedError('mapped storage is read-only')
+
+        @override
+        def dump(self, file: BinaryIO) -> None:
+            file.write(memoryview(self._buffer))
+
+        @override
+        def count(
+                self,
+                by: MemoryStore.IndexName | None = None,
+                key: Hashable = None
+        ) -> int | None:
+            return None         # snapshots do not keep claim counts
+
+        @override
+        def _index_get(
+                self,
+                by: MemoryStore.IndexName,
+                key: MemoryStore.IndexKey
+        ) -> Sequence[int]:
+            digests, offsets, rows = self._indexes[by]
+            digest = self._digest(key)
+            i = bisect.bisect_left(digests, digest)
+            if i < len(digests) and digests[i] == digest:
+                return rows[offsets[i]:offsets[i + 1]]
+            else:
+                return ()
+
+        @override
+        def _index_groups(
+                self,
+                by: MemoryStore.IndexName
+        ) -> Iterable[Sequence[int]]:
+            _, offsets, rows = self._indexes[by]
+            return map(
+                lambda i: rows[offsets[i]:offsets[i + 1]],
+                range(len(offsets) - 1))
+
+        def thaw(self) -> MemoryStore.CompactStorage:
+            """Copies storage into a (writable) compact storage.
+
+            Returns:
+               Compact storage.
+            """
+            storage = MemoryStore.CompactStorage()
+            storage._terms = list(self._terms)
+            storage._term_ids = {
+                term: id for id, term in enumerate(storage._terms)}
+            for name in (
+                    '_term_masks', '_subject', '_property', '_value',
+                    '_snak', '_annotation'):
+                view = getattr(self, name)
+                column = array.array(view.format)
+                column.frombytes(view.cast('B'))
+                setattr(storage, name, column)
+            storage._alive = bytearray(self._alive)
+            storage._size = self._size
+            key, terms = MemoryStore._index_key, storage._terms
+            for row in range(len(storage._alive)):
+                storage._subject_index.setdefault(key(
+                    terms[storage._subject[row]]),
+                    array.array('q')).append(row)
+                storage._property_index.setdefault(key(
+                    terms[storage._property[row]]),
+                    array.array('q')).append(row)
+                if storage._value[row] != self.NIL:
+                    storage._value_index.setdefault(key(
+                        terms[storage._value[row]]),
+                        array.array('q')).append(row)
+            storage._init_counts()
+            return storage
+
+    class Matcher:
+        """Statement matcher.
+
+        Matches statements against filter.  Positions of `filter` whose
+        fingerprint is a disjunction of value fingerprints are matched by
+        probing a hash table of the index keys of the disjuncts.
+
+        Parameters:
+           filter: Normal filter.
+        """
+
+        __slots__ = (
+            'filter',
+            '_filter',
+            '_probes',
+        )
+
+        #: Type alias for probes.
+        Probe: TypeAlias = tuple[
+            'MemoryStore.IndexName',
+            dict[Hashable, list[ValueFingerprint]]]
+
+        #: The filter of matcher.
+        filter: Filter
+
+        #: The filter checked by the matcher (before the probes).
+        _filter: Filter
+
+        #: The probes of matcher.
+        _probes: tuple[Probe, ...]
+
+        def __init__(self, filter: Filter) -> None:
+            self.filter = filter
+            probes: list[MemoryStore.Matcher.Probe] = []
+            kwargs: dict[str, Any] = {}
+            for by in ('subject', 'property', 'value'):
+                fp = getattr(filter, by)
+                if (isinstance(fp, OrFingerprint)
+                        and all(map(ValueFingerprint.test, fp.args))):
+                    table: dict[Hashable, list[ValueFingerprint]] = {}
+                    for arg in fp.args:
+                        table.setdefault(MemoryStore._index_key(
+                            arg.value), []).append(arg)
+                    probes.append((cast(MemoryStore.IndexName, by), table))
+                    kwargs[by] = None
+            ###
+            # IMPORTANT: The masks of `filter` already reflect the probed
+            # fingerprints, and so these can safely be replaced by the full
+            # fingerprint.
+            ###
+            self._filter = filter.replace(**kwargs) if kwargs else filter
+            self._probes = tuple(probes)
+
+        def match(self, stmt: Statement) -> bool:
+            """Tests whether matcher matches statement.
+
+            Parameters:
+               stmt: Statement.
+
+            Returns:
+               ``True`` if successful; ``False`` otherwise.
+            """
+            if not self._filter.match(stmt):
+                return False
+            for by, table in self._probes:
+                if by == 'subject':
+                    value: Value = stmt.subject
+                elif by == 'property':
+                    value = stmt.snak.property
+                elif isinstance(stmt.snak, ValueSnak):
+                    value = stmt.snak.value
+                else:
+                    return False
+                if not any(map(lambda fp: fp.match(value), table.get(
+                        MemoryStore._index_key(value), ()))):
+                    return False
+            return True
+
+    #: Type alias for executor names.
+    Executor: TypeAlias = Literal['thread', 'process']
+
     __slots__ = (
-        '_statements',
+        '_lock',
+        '_storage',
+        '_executor',
+        '_workers',
+        '_process_pool',
     )
 
+    #: Reentrant lock to sync access to statement storage.
+    _lock: threading.RLock
+
     #: Statement storage.
-    _statements: set[Statement]
+    _storage: Storage
+
+    #: Executor of async filters.
+    _executor: Executor
+
+    #: Number of worker processes.
+    _workers: int | None
+
+    #: Process pool (created on demand).
+    _process_pool: concurrent.futures.ProcessPoolExecutor | None
+
+    #: Mapped storages opened by the worker processes (indexed by path).
+    _worker_storages: ClassVar[dict[str, MemoryStore.MappedStorage]] = {}
 
     def __init__(
             self,
             store_name: str,
             *args: Statement,
             graph: TGraph | None = None,
+            index: bool | None = None,
+            compact: bool | None = None,
+            executor: MemoryStore.Executor | None = None,
+            workers: int | None = None,
             **kwargs: Any
     ) -> None:
         super().__init__(store_name, *args, **kwargs)
-        self._statements = set(itertools.chain(
+        self._lock = threading.RLock()
+        self._executor = KIF_Object._check_arg(
+            executor if executor is not None else 'thread',
+            executor in (None, 'thread', 'process'),
+            "expected 'thread' or 'process'",
+            type(self), 'executor', None, ValueError)
+        self._workers = KIF_Object._check_optional_arg_int(
+            workers, None, type(self), 'workers')
+        self._process_pool = None
+        stmts = itertools.chain(
             map(functools.partial(
                 Statement.check, function=type(self), name='args'), args),
             Graph.check(graph, type(self), 'graph')
-            if graph is not None else ()))
+            if graph is not None else ())
+        index = index if index is not None else True
+        compact = compact if compact is not None else False
+        if compact:
+            self._storage = self.CompactStorage(stmts)
+        else:
+            self._storage = self.SetStorage(stmts, index)
 
     @override
-    def _filter(
+    def _close(self) -> None:
+        pool = getattr(self, '_process_pool', None)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+    def _get_process_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = concurrent.futures.ProcessPoolExecutor(
+                self._workers)
+        return self._process_pool
+
+# -- Indexes ---------------------------------------------------------------
+
+    @classmethod
+    def _index_key(cls, value: Value) -> MemoryStore.IndexKey:
+        ###
+        # IMPORTANT: Index keys must be coarser than the notion of equality
+        # used by ValueFingerprint._match(), i.e., if a value fingerprint
+        # matches a value then both must have the same key.  Hence the
+        # property range, the string vs. external id distinction, the
+        # quantity bounds, and the time details are ignored here.
+        ###
+        if isinstance(value, Property):
+            return (Property, value.iri)
+        elif isinstance(value, String):
+            return (String, value.content)
+        elif isinstance(value, Quantity):
+            return (Quantity, value.amount)
+        elif isinstance(value, Time):
+            return (Time,)
+        else:
+            return value
+
+    @classmethod
+    def _index_keys(
+            cls,
+            fp: Fingerprint
+    ) -> Set[MemoryStore.IndexKey] | None:
+        if isinstance(fp, ValueFingerprint):
+            return {cls._index_key(fp.value)}
+        elif isinstance(fp, EmptyFingerprint):
+            return set()
+        elif isinstance(fp, OrFingerprint) and fp.args:
+            keys: set[MemoryStore.IndexKey] = set()
+            for arg in fp.args:
+                arg_keys = cls._index_keys(arg)
+                if arg_keys is None:
+                    return None  # some disjunct cannot be indexed
+                keys.update(arg_keys)
+            return keys
+        elif isinstance(fp, AndFingerprint):
+            and_keys: Set[MemoryStore.IndexKey] | None = None
+            for arg in fp.args:
+                arg_keys = cls._index_keys(arg)
+                if arg_keys is None:
+                    continue    # skip conjuncts that cannot be indexed
+                elif and_keys is None:
+                    and_keys = arg_keys
+                else:
+                    and_keys = set(and_keys) & arg_keys
+            return and_keys
+        else:
+            return None
+
+    @classmethod
+    def _count_keys(cls, value: Value) -> Sequence[Hashable]:
+        ###
+        # The keys under which `value` is counted: the value itself, plus
+        # its IRI if `value` is a property (i.e., properties are counted
+        # with and without their range).
+        ###
+        if type(value) is Property:
+            return ((Property, value.iri), (Property, value.iri, value.range))
+        else:
+            return (value,)
+
+    #: Type alias for count patterns (position, count keys, and whether
+    #: each key counts the claims of a single value).
+    CountPattern: TypeAlias = tuple[
+        IndexName | None, Sequence[Hashable], bool]
+
+    @classmethod
+    def _count_fingerprint_keys(
+            cls,
+            fp: ValueFingerprint
+    ) -> tuple[Sequence[Hashable], bool] | None:
+        ###
+        # IMPORTANT: Gets count keys such that `fp` matches a value iff the
+        # value is counted under exactly one of these keys (see
+        # ValueFingerprint._match() and the masks set by Filter.normalize()),
+        # or None if there are no such keys.
+        # Also returns whether each key is the key of a single value.
+        ###
+        value = fp.value
+        if isinstance(value, DeepDataValue):
+            return None         # matched up to their details
+        elif type(value) is Property:
+            if value.range is None:
+                return ((Property, value.iri),), False  # any range
+            else:
+                return ((Property, value.iri, value.range),
+                        (Property, value.iri, None)), True
+        else:
+            return (value,), True
+
+    def _count_pattern(
+            self,
+            filter: Filter
+    ) -> MemoryStore.CountPattern | None:
+        ###
+        # If normal `filter` constrains nothing but (at most) one position
+        # to a value with exact count keys, e.g., Filter(subject=x),
+        # returns the position and the count keys of the value.  Otherwise,
+        # returns None.
+        ###
+        args: dict[str, Any] = {}
+        for by in ('subject', 'property', 'value'):
+            fp = getattr(filter, by)
+            if fp.is_full():
+                continue
+            if args or not isinstance(fp, ValueFingerprint):
+                return None
+            args[by] = fp
+        if filter != Filter(annotated=filter.annotated, **args).normalize():
+            return None         # other constraints
+        for by, fp in args.items():
+            keys = self._count_fingerprint_keys(fp)
+            if keys is None:
+                return None
+            return (cast(MemoryStore.IndexName, by), *keys)
+        return None, (None,), False
+
+    def _count_claims(
+            self,
+            pattern: MemoryStore.CountPattern
+    ) -> Sequence[int] | None:
+        by, keys, _ = pattern
+        counts = [self._storage.count(by, key) for key in keys]
+        if None in counts:
+            return None
+        return cast(list[int], counts)
+
+# -- Joins -----------------------------------------------------------------
+
+    def _join(self, filter: Filter) -> MemoryStore.Matcher:
+        ###
+        # Evaluates the snak, converse-snak, and path fingerprints in
+        # `filter` against the store and replaces them by the disjunction
+        # of the values they match.  Each step of the evaluation is an index
+        # lookup (hash join) followed by a probe of the matched statements.
+        ###
+        filter = filter.normalize()
+        subject, property, value = map(
+            self._join_fingerprint,
+            (filter.subject, filter.property, filter.value))
+        if (subject is not filter.subject
+                or property is not filter.property
+                or value is not filter.value):
+            filter = filter.replace(subject, property, value).normalize()
+        return self.Matcher(filter)
+
+    def _join_fingerprint(self, fp: Fingerprint) -> Fingerprint:
+        if isinstance(fp, ConverseSnakFingerprint):
+            snak = fp.snak
+            assert isinstance(snak, ValueSnak)
+            return self._join_project(Filter(
+                snak.value, snak.property, None, Filter.VALUE_SNAK,
+                value_mask=Filter.ENTITY),
+                lambda s: cast(ValueSnak, s.snak).value)
+        elif isinstance(fp, SnakFingerprint):
+            return self._join_project(
+                Filter.from_snak(None, fp.snak), lambda s: s.subject)
+        elif isinstance(fp, PathFingerprint):
+            path = fp.path.normalize()
+            edges = path.args if isinstance(path, SequencePath) else (path,)
+            ###
+            # Evaluate the path backwards, from its last edge (whose value
+            # is given) to its first edge.
+            ###
+            values: Fingerprint = ValueFingerprint(fp.value)
+            for edge in reversed(edges):
+                assert isinstance(edge, EdgePath)
+                values = self._join_project(Filter(
+                    None, edge.property, values, Filter.VALUE_SNAK),
+                    lambda s: s.subject)
+                if values.is_empty():
+                    break
+            return values
+        elif isinstance(fp, (AndFingerprint, OrFingerprint)):
+            args = tuple(map(self._join_fingerprint, fp.args))
+            if all(map(lambda x, y: x is y, args, fp.args)):
+                return fp
+            else:
+                return type(fp)(*args)
+        else:
+            return fp
+
+    def _join_project(
             self,
             filter: Filter,
+            projection: Callable[[Statement], Value]
+    ) -> Fingerprint:
+        with self._lock:
+            matcher = self._join(filter)
+            values = set(map(projection, itertools.filter(
+                matcher.match, self._storage.candidates(matcher.filter))))
+        ###
+        # IMPORTANT: Snak and path fingerprints never match pseudo-properties
+        # (see SnakFingerprint._match()).
+        ###
+        values = {v for v in values if not isinstance(v, PseudoProperty)}
+        if not values:
+            return EmptyFingerprint()
+        elif len(values) == 1:
+            return ValueFingerprint(next(iter(values)))
+        else:
+            return OrFingerprint(*map(ValueFingerprint, values))
+
+# -- Add & remove ----------------------------------------------------------
+
+    def add_many(self, stmts: Iterable[Statement]) -> None:
+        """Adds statements to store.
+
+        Statements already in store are ignored.
+
+        Parameters:
+           stmts: Statements.
+        """
+        self._add_many(map(functools.partial(
+            Statement.check, function=self.add_many,
+            name='stmts', position=1), stmts))
+
+    def _add_many(self, stmts: Iterable[Statement]) -> None:
+        with self._lock:
+            storage = self._get_writable_storage()
+            for stmt in stmts:
+                storage.add(stmt)
+
+    async def aadd_many(self, stmts: Iterable[Statement]) -> None:
+        """Async version of :meth:`MemoryStore.add_many`."""
+        await asyncio.to_thread(self._add_many, list(map(functools.partial(
+            Statement.check, function=self.aadd_many,
+            name='stmts', position=1), stmts)))
+
+    def remove_many(self, stmts: Iterable[Statement]) -> None:
+        """Removes statements from store.
+
+        Statements not in store are ignored.
+
+        Parameters:
+           stmts: Statements.
+        """
+        self._remove_many(map(functools.partial(
+            Statement.check, function=self.remove_many,
+            name='stmts', position=1), stmts))
+
+    def _remove_many(self, stmts: Iterable[Statement]) -> None:
+        with self._lock:
+            storage = self._get_writable_storage()
+            for stmt in stmts:
+                storage.remove(stmt)
+
+    async def aremove_many(self, stmts: Iterable[Statement]) -> None:
+        """Async version of :meth:`MemoryStore.remove_many`."""
+        await asyncio.to_thread(self._remove_many, list(map(
+            functools.partial(
+                Statement.check, function=self.aremove_many,
+                name='stmts', position=1), stmts)))
+
+    def _get_writable_storage(self) -> MemoryStore.Storage:
+        if isinstance(self._storage, self.MappedStorage):
+            self._storage = self._storage.thaw()  # copy on write
+        return self._storage
+
+# -- Snapshots -------------------------------------------------------------
+
+    @classmethod
+    def open(
+            cls,
+            path: pathlib.PurePath | str,
+            mmap: bool = True,
+            **kwargs: Any
+    ) -> MemoryStore:
+        """Opens memory store snapshot.
+
+        The resulting store uses a :class:`MemoryStore.MappedStorage`.  It
+        is copied into a :class:`MemoryStore.CompactStorage` on the first
+        addition or removal.
+
+        .. warning::
+
+           Snapshots contain pickled data.  Never open snapshots from
+           untrusted sources.
+
+        Parameters:
+           path: Path to snapshot file (see :meth:`MemoryStore.save`).
+           mmap: Whether to memory-map the snapshot file (instead of
+              reading it into memory).
+           kwargs: Other keyword arguments.
+
+        Returns:
+           Memory store.
+        """
+        store = cls(cls.store_name, **kwargs)
+        store._storage = cls.MappedStorage.load(path, mmap)
+        return store
+
+    def save(self, path: pathlib.PurePath | str) -> None:
+        """Saves memory store snapshot.
+
+        Parameters:
+           path: Path to snapshot file.
+        """
+        with self._lock:
+            storage = self._storage
+            if (not isinstance(storage, self.CompactStorage)
+                    or len(storage) != len(storage._alive)):
+                storage = self.CompactStorage(storage)
+            ###
+            # IMPORTANT: Write to a temporary file and then rename it, as
+            # truncating a file which is memory-mapped by some other store
+            # would crash the processes reading from it.
+            ###
+            tmp = pathlib.Path(f'{path}.tmp')
+            with builtins.open(tmp, 'wb') as file:
+                storage.dump(file)
+            os.replace(tmp, path)
+
+# -- Ask -------------------------------------------------------------------
+
+    @override
+    def _ask(self, filter: Filter, options: TOptions) -> bool:
+        with self._lock:
+            matcher = self._join(filter)
+            pattern = self._count_pattern(matcher.filter)
+            if pattern is not None:
+                counts = self._count_claims(pattern)
+                if counts is not None:
+                    return any(counts)
+            return any(map(
+                matcher.match, self._storage.candidates(matcher.filter)))
+
+    @override
+    async def _aask(self, filter: Filter, options: TOptions) -> bool:
+        return await asyncio.to_thread(self._ask, filter, options)
+
+# -- Contains --------------------------------------------------------------
+
+    @override
+    def _contains_many(
+            self,
+            stmts: Sequence[Statement],
+            filters: Sequence[Filter],
             options: TOptions
-    ) -> Iterator[Statement]:
-        return itertools.filter(
-            filter.match, self._filter_it_statements(filter))
+    ) -> list[bool]:
+        with self._lock:
+            return [
+                filter.is_nonempty() and self._contains_probe(stmt, filter)
+                for stmt, filter in zip(stmts, filters)]
+
+    def _contains_probe(self, stmt: Statement, filter: Filter) -> bool:
+        matcher = self._join(filter)
+        return any(
+            other == stmt and matcher.match(other)
+            for other in self._storage.candidates(matcher.filter))
 
-    def _filter_it_statements(
+    @override
+    async def _acontains_many(
             self,
-            filter: Filter
+            stmts: Sequence[Statement],
+            filters: Sequence[Filter],
+            options: TOptions
+    ) -> list[bool]:
+        return await asyncio.to_thread(
+            self._contains_many, stmts, filters, options)
+
+# -- Count -----------------------------------------------------------------
+
+    @override
+    def _count(self, filter: Filter, options: TOptions) -> int:
+        return self._count_with_projection(
+            filter, lambda s: s.claim, 'subject', 'claim')
+
+    @override
+    def _count_s(self, filter: Filter, options: TOptions) -> int:
+        return self._count_with_projection(
+            filter, lambda s: s.subject, 'subject', 'subject')
+
+    @override
+    def _count_p(self, filter: Filter, options: TOptions) -> int:
+        return self._count_with_projection(
+            filter, lambda s: s.snak.property, 'property', 'property')
+
+    @override
+    def _count_v(self, filter: Filter, options: TOptions) -> int:
+        return self._count_with_projection(
+            filter.replace(snak_mask=Filter.VALUE_SNAK),
+            lambda s: cast(ValueSnak, s.snak).value, 'value', 'value')
+
+    @override
+    def _count_sp(self, filter: Filter, options: TOptions) -> int:
+        return self._count_with_projection(
+            filter, lambda s: (s.subject, s.snak.property),
+            'subject', None)
+
+    @override
+    def _count_sv(self, filter: Filter, options: TOptions) -> int:
+        return self._count_with_projection(
+            filter.replace(snak_mask=Filter.VALUE_SNAK),
+            lambda s: (s.subject, cast(ValueSnak, s.snak).value),
+            'subject', None)
+
+    @override
+    def _count_pv(self, filter: Filter, options: TOptions) -> int:
+        return self._count_with_projection(
+            filter.replace(snak_mask=Filter.VALUE_SNAK),
+            lambda s: s.snak, 'property', None)
+
+    def _count_with_projection(
+            self,
+            filter: Filter,
+            projection: Callable[[Statement], Hashable],
+            by: MemoryStore.IndexName,
+            counted: Literal['claim', 'subject', 'property', 'value'] | None
+    ) -> int:
+        assert not filter.annotated
+        with self._lock:
+            matcher = self._join(filter)
+            ###
+            # If `filter` is a single pattern, get the count from the claim
+            # counts: the sum of the counts if we're counting claims, or the
+            # number of nonzero counts (i.e., of matched values) if we're
+            # counting the pattern position and each count is that of a
+            # single value.
+            ###
+            pattern = (self._count_pattern(matcher.filter)
+                       if counted is not None else None)
+            if pattern is not None:
+                counts = self._count_claims(pattern)
+                if counts is not None:
+                    if counted == 'claim':
+                        return sum(counts)
+                    elif counted == pattern[0] and pattern[2]:
+                        return sum(map(bool, counts))
+            ###
+            # Count the distinct projections one partition at a time.  This
+            # works because the first component of the projection determines
+            # the partition, and so the same projection can never occur in
+            # two distinct partitions.
+            ###
+            return sum(map(lambda stmts: len(set(map(
+                projection, itertools.filter(matcher.match, stmts)))),
+                self._storage.partition(matcher.filter, by)))
+
+    @override
+    async def _acount(self, filter: Filter, options: TOptions) -> int:
+        return await asyncio.to_thread(self._count, filter, options)
+
+    @override
+    async def _acount_s(self, filter: Filter, options: TOptions) -> int:
+        return await asyncio.to_thread(self._count_s, filter, options)
+
+    @override
+    async def _acount_p(self, filter: Filter, options: TOptions) -> int:
+        return await asyncio.to_thread(self._count_p, filter, options)
+
+    @override
+    async def _acount_v(self, filter: Filter, options: TOptions) -> int:
+        return await asyncio.to_thread(self._count_v, filter, options)
+
+    @override
+    async def _acount_sp(self, filter: Filter, options: TOptions) -> int:
+        return await asyncio.to_thread(self._count_sp, filter, options)
+
+    @override
+    async def _acount_sv(self, filter: Filter, options: TOptions) -> int:
+        return await asyncio.to_thread(self._count_sv, filter, options)
+
+    @override
+    async def _acount_pv(self, filter: Filter, options: TOptions) -> int:
+        return await asyncio.to_thread(self._count_pv, filter, options)
+
+# -- Filter ----------------------------------------------------------------
+
+    @override
+    def _filter(
+            self,
+            filter: Filter,
+            options: TOptions
     ) -> Iterator[Statement]:
-        if filter.annotated:
-            return map(lambda stmt: stmt.annotate(), self._statements)
-        else:
-            return map(lambda stmt: stmt.unannotate(), self._statements)
+        with self._lock:
+            matcher = self._join(filter)
+            return itertools.filter(
+                matcher.match, self._filter_it_statements(matcher.filter))
+
+    def _filter_it_statements(self, filter: Filter) -> Iterator[Statement]:
+        with self._lock:
+            ###
+            # Take a snapshot of the candidates so that the resulting
+            # iterator is not affected by concurrent additions or removals.
+            ###
+            return iter(self._storage.candidates(filter, snapshot=True))
 
     @override
-    def _afilter(
+    async def _afilter(
             self,
             filter: Filter,
             options: TOptions
@@ -136,27 +1934,97 @@ class MemoryStore(
         if limit is None:
             limit = options.max_limit
         assert limit is not None
-        batches = itertools.batched(
-            self._filter_it_statements(filter), options.page_size)
-        return itertools.amix(
-            self._afilter_helper(filter, batches),
-            distinct=options.distinct,
-            distinct_window_size=options.distinct_window_size,
-            limit=limit, method='chain')
+        it = self._afilter_helper(
+            self._afilter_jobs(filter, options), options.lookahead)
+        try:
+            async for stmt in itertools.amix(
+                    it,
+                    distinct=options.distinct,
+                    distinct_window_size=options.distinct_window_size,
+                    limit=limit, method='chain'):
+                yield stmt
+        finally:
+            await it.aclose()   # cancel outstanding batches
 
-    async def _afilter_helper(
+    def _afilter_jobs(
             self,
             filter: Filter,
-            batches: Iterator[Sequence[Statement]]
-    ) -> AsyncIterator[Statement]:
-        async def task(
-                batch: Sequence[Statement]
-        ) -> Sequence[Statement]:
+            options: TOptions
+    ) -> Iterator[functools.partial[list[Statement]]]:
+        with self._lock:
+            storage, matcher = self._storage, self._join(filter)
+            filter = matcher.filter
+            if (self._executor == 'process'
+                    and isinstance(storage, self.MappedStorage)
+                    and storage.path is not None):
+                ###
+                # The worker processes map the snapshot file themselves, and
+                # so only row numbers and results need to be pickled.
+                ###
+                path = str(storage.path)
+                return map(lambda rows: functools.partial(
+                    self._worker_filter_rows, path, matcher, rows),
+                    itertools.batched(storage._scan(
+                        filter, storage._candidate_rows(filter)),
+                        options.page_size))
+            else:
+                return map(lambda batch: functools.partial(
+                    self._worker_filter, matcher, batch),
+                    itertools.batched(self._filter_it_statements(
+                        filter), options.page_size))
+
+    async def _afilter_helper(
+            self,
+            jobs: Iterator[functools.partial[list[Statement]]],
+            lookahead: int
+    ) -> AsyncGenerator[Statement, None]:
+        pool = self._get_process_pool()\
+            if self._executor == 'process' else None
+
+        def task(
+                job: functools.partial[list[Statement]]
+        ) -> asyncio.Future[list[Statement]]:
             _logger.debug(
                 '%s():filtering %d statements asynchronously',
-                task.__qualname__, len(batch))
-            return await asyncio.to_thread(
-                lambda: list(itertools.filter(filter.match, batch)))
-        for batch in await asyncio.gather(*map(task, batches)):
-            for stmt in batch:
-                yield stmt
+                task.__qualname__, len(job.args[-1]))
+            if pool is None:
+                return asyncio.ensure_future(asyncio.to_thread(job))
+            else:
+                return asyncio.get_running_loop().run_in_executor(pool, job)
+        ###
+        # Keep at most `lookahead` batches in flight and yield the results
+        # of each batch as soon as it is done.
+        ###
+        pending = set(map(task, itertools.islice(jobs, max(lookahead, 1))))
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                pending.update(map(task, itertools.islice(jobs, len(done))))
+                for future in done:
+                    for stmt in future.result():
+                        yield stmt
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _worker_filter(
+            matcher: Filter | MemoryStore.Matcher,
+            stmts: Iterable[Statement]
+    ) -> list[Statement]:
+        return list(itertools.filter(matcher.match, stmts))
+
+    @classmethod
+    def _worker_filter_rows(
+            cls,
+            path: str,
+            matcher: MemoryStore.Matcher,
+            rows: Sequence[int]
+    ) -> list[Statement]:
+        storage = cls._worker_storages.get(path)
+        if storage is None:
+            storage = cls.MappedStorage.load(path)
+            cls._worker_storages[path] = storage
+        return cls._worker_filter(matcher, map(
+            storage._decoder(matcher.filter.annotated), rows))
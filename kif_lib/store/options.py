@@ -8,6 +8,7 @@ import dataclasses
 from ..engine import _EngineOptions
 from ..typing import Any, override
 from .abc import _StoreOptions
+from .caching import CachingStoreOptions
 from .empty import EmptyStoreOptions
 from .memory import MemoryStoreOptions
 from .mixer import MixerStoreOptions
@@ -18,6 +19,9 @@ from .sparql import SPARQL_StoreOptions
 class StoreOptions(_StoreOptions, name='store'):
     """Store options."""
 
+    caching: CachingStoreOptions = dataclasses.field(
+        default_factory=CachingStoreOptions)
+
     empty: EmptyStoreOptions = dataclasses.field(
         default_factory=EmptyStoreOptions)
 
@@ -32,6 +36,7 @@ class StoreOptions(_StoreOptions, name='store'):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
+        self.caching = CachingStoreOptions()
         self.empty = EmptyStoreOptions()
         self.memory = MemoryStoreOptions()
         self.mixer = MixerStoreOptions()
@@ -5,11 +5,13 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import concurrent.futures
 import contextlib
 import dataclasses
 import io
 import logging
 import pathlib
+import pickle
 
 from typing_extensions import overload
 
@@ -19,6 +21,7 @@ from ...model import Entity, Filter
 from ...model import Graph as KIF_Graph
 from ...model import (
     Item,
+    KIF_Object,
     Lexeme,
     Property,
     Statement,
@@ -40,6 +43,7 @@ from ...typing import (
     Generator,
     Iterable,
     Iterator,
+    Literal,
     override,
     TextIO,
     TypeAlias,
@@ -74,6 +78,12 @@ class Reader(
        data: Data to be used as input source.
        graph: KIF graph to used as input source.
        parse: Input parsing function.
+       executor: Executor of async filters (``'thread'`` or
+          ``'process'``).  The ``'process'`` executor requires `parse`
+          and `kwargs` to be picklable (e.g., `parse` cannot be a lambda
+          or a local function); if they are not, threads are used.
+       workers: Number of worker processes (if `executor` is
+          ``'process'``).
        kwargs: Other keyword arguments.
     """
 
@@ -118,6 +128,9 @@ class Reader(
     #: Type alias for input parsing function.
     ParseFn: TypeAlias = Callable[[T], Iterable[Statement]]
 
+    #: Type alias for executor names.
+    Executor: TypeAlias = Literal['thread', 'process']
+
     __slots__ = (
         '_args',
         '_kwargs',
@@ -125,6 +138,9 @@ class Reader(
         '_registered',
         '_registry',
         '_scheduled',
+        '_executor',
+        '_workers',
+        '_process_pool',
     )
 
     #: Input sources.
@@ -145,6 +161,15 @@ class Reader(
     #: Scheduled statements.
     _scheduled: set[Statement]
 
+    #: Executor of async filters.
+    _executor: Executor
+
+    #: Number of worker processes.
+    _workers: int | None
+
+    #: Process pool (created on demand).
+    _process_pool: concurrent.futures.ProcessPoolExecutor | None
+
     def __init__(
             self,
             store_name: str,
@@ -154,11 +179,21 @@ class Reader(
             data: TData | None = None,
             graph: TGraph | None = None,
             parse: ParseFn | None = None,
+            executor: Executor | None = None,
+            workers: int | None = None,
             **kwargs: Any
     ) -> None:
         super().__init__(store_name)
         self._args = []
         self._kwargs = kwargs
+        self._executor = KIF_Object._check_arg(
+            executor if executor is not None else 'thread',
+            executor in (None, 'thread', 'process'),
+            "expected 'thread' or 'process'",
+            type(self), 'executor', None, ValueError)
+        self._workers = KIF_Object._check_optional_arg_int(
+            workers, None, type(self), 'workers')
+        self._process_pool = None
 
         def push(src: Reader.Source) -> None:
             self._args.append(src)
@@ -186,6 +221,19 @@ class Reader(
     def _preprocess_args(self, *args: Any) -> Iterator[Any]:
         yield from args
 
+    @override
+    def _close(self) -> None:
+        pool = getattr(self, '_process_pool', None)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+    def _get_process_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = concurrent.futures.ProcessPoolExecutor(
+                self._workers)
+        return self._process_pool
+
     def _check_arg(self, arg: Any) -> Source:
         if isinstance(arg, self.Source):
             return arg
@@ -521,8 +569,15 @@ class Reader(
         assert len(self._args) >= 2, self._args
         pre, mid, pos = (self._args[0],), self._args[1:-1], (self._args[-1],)
         f = (lambda it: self._afilter_helper(list(map(parse, it)), task))
+        if self._executor == 'process' and self._check_process_args():
+            locations, mid = map(list, itertools.partition(
+                lambda src: not isinstance(src, self.Location), mid))
+            pre_its = [f(pre), self._afilter_process_helper(
+                filter, limit, cast(list[Reader.Location], locations))]
+        else:
+            pre_its = [f(pre)]
         return itertools.amix(
-            f(pre),
+            *pre_its,
             ###
             # IMPORTANT: We use itertools.batched() here to limit the number
             # of parallel tasks to the number returned by
@@ -566,6 +621,77 @@ class Reader(
                 psinfo() if psinfo else '')
             count = 0
 
+    def _check_process_args(self) -> bool:
+        ###
+        # Workers get the parsing function and the other keyword arguments
+        # pickled.  So if these cannot be pickled, fall back to threads.
+        ###
+        try:
+            pickle.dumps((self._get_process_parse_fn(), self._kwargs))
+            return True
+        except (pickle.PicklingError, AttributeError, TypeError) as err:
+            _logger.warning(
+                '%s(): cannot use process executor, '
+                'fall-backing to threads: %s',
+                self._check_process_args.__qualname__, err)
+            return False
+
+    def _get_process_parse_fn(self) -> ParseFn | None:
+        return self._parse_fn if self._parse_fn != self._parse else None
+
+    async def _afilter_process_helper(
+            self,
+            filter: Filter,
+            limit: int,
+            locations: list[Reader.Location]
+    ) -> AsyncIterator[Statement]:
+        ###
+        # Each location is parsed and filtered by a fresh reader running in
+        # a worker process.  The entities registered and the statements
+        # scheduled by the worker are merged back into this reader, so
+        # that they are taken into account by the postamble.
+        ###
+        loop = asyncio.get_running_loop()
+        pool = self._get_process_pool()
+        parse = self._get_process_parse_fn()
+        futures = [loop.run_in_executor(pool, functools.partial(
+            self._worker_filter_location, parse, self._kwargs, filter,
+            limit, src.location)) for src in locations]
+        try:
+            for future in asyncio.as_completed(futures):
+                stmts, registered, scheduled = await future
+                for entity, descriptor in registered:
+                    if descriptor is not None:
+                        self._register_descriptor(
+                            entity, descriptor)  # type: ignore
+                    else:
+                        self._registered.add(entity)
+                self._schedule(*scheduled)
+                for stmt in stmts:
+                    yield stmt
+        finally:
+            for future in futures:
+                future.cancel()
+
+    @classmethod
+    def _worker_filter_location(
+            cls,
+            parse: ParseFn | None,
+            kwargs: dict[str, Any],
+            filter: Filter,
+            limit: int,
+            location: TLocation
+    ) -> tuple[list[Statement], list[tuple[Entity, Any]], list[Statement]]:
+        reader = cls(cls.store_name, parse=parse, **kwargs)
+        with reader(limit=limit) as options:
+            stmts = list(reader._filter_parse_arg(
+                filter, options, cls.Location(location)))
+        return (
+            stmts,
+            [(entity, reader._registry.describe(entity))  # type: ignore
+             for entity in reader._registered],
+            list(reader._scheduled))
+
 
 class JSONL_Reader(
         Reader[TOptions],
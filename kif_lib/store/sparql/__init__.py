@@ -6,6 +6,7 @@ from __future__ import annotations
 from .httpx import HttpxSPARQL_Store
 from .jena import JenaSPARQL_Store
 from .qlever import QLeverSPARQL_Store
+from .query_cache import SPARQL_QueryCache
 from .rdf import (
     DBpediaRDF_Store,
     PubChemRDF_Store,
@@ -40,6 +41,7 @@ __all__ = (
     'RDF_Store',
     'RDFLibSPARQL_Store',
     'RDFoxSPARQL_Store',
+    'SPARQL_QueryCache',
     'SPARQL_Store',
     'SPARQL_StoreOptions',
     'UniProtSPARQL_Store',
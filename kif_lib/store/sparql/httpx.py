@@ -9,9 +9,9 @@ import httpx
 
 from ...__version__ import __version__
 from ...compiler.sparql import SPARQL_Mapping
-from ...compiler.sparql.results import SPARQL_Results
+from ...compiler.sparql.results import iterparse_sparql_results, SPARQL_Results
 from ...model import IRI, KIF_Object, T_IRI
-from ...typing import Any, cast, Final, Mapping, override, TypeAlias
+from ...typing import Any, cast, Final, Iterator, Mapping, override, TypeAlias
 from .sparql_core import _CoreSPARQL_Store, TCoreSPARQL_Store
 
 _logger: Final[logging.Logger] = logging.getLogger(__name__)
@@ -29,6 +29,16 @@ class HttpxSPARQL_Store(
        iri: IRI of the target SPARQL endpoint.
        headers: HTTP headers.
        mapping: SPARQL mapping.
+       query_cache: Persistent query cache (or path to its database).
+       concurrent: Whether to evaluate disjoint queries concurrently.
+       adaptive_page_size: Whether to adapt the page size to the
+          evaluation time of pages.
+       streaming: Whether to stream the results of filter queries.
+       prefetch: Whether to prefetch the pages of filter queries.
+       compiled_filter_cache_size: Maximum number of compiled filters to
+          cache.
+       values_chunk_size: Maximum number of values per chunk of large
+          value disjunctions.
        kwargs: Other keyword arguments.
     """
 
@@ -123,6 +133,10 @@ class HttpxSPARQL_Store(
                 await self._aclient.aclose()
                 self._aclient = None
 
+        @override
+        def _get_query_cache_iri(self) -> str | None:
+            return self._iri.content
+
         @override
         def _select(
                 self,
@@ -131,6 +145,32 @@ class HttpxSPARQL_Store(
         ) -> SPARQL_Results:
             return self._http_post(query, timeout).json()
 
+        @override
+        def _select_stream(
+                self,
+                query: str,
+                timeout: float | None = None
+        ) -> SPARQL_Results:
+            return iterparse_sparql_results(
+                self._http_post_stream(query, timeout))
+
+        def _http_post_stream(
+                self,
+                content: str,
+                timeout: float | None = None
+        ) -> Iterator[str]:
+            with self.client.stream(
+                    'POST', self._iri.content,
+                    content=self._http_post_encode_content(content),
+                    timeout=httpx.Timeout(timeout)) as res:
+                try:
+                    res.raise_for_status()
+                except httpx.HTTPStatusError as err:
+                    res.read()
+                    _logger.debug(res.text)
+                    raise err
+                yield from res.iter_text()
+
         def _http_post(
                 self,
                 content: str,
@@ -147,6 +187,20 @@ class HttpxSPARQL_Store(
                 raise err
             return res
 
+        @override
+        def _is_timeout_error(self, err: BaseException) -> bool:
+            if isinstance(err, httpx.TimeoutException):
+                return True
+            if isinstance(err, httpx.HTTPStatusError):
+                ###
+                # Some endpoints (e.g., Blazegraph) report query timeouts
+                # as internal server errors.
+                ###
+                status = err.response.status_code
+                return status == 504 or (
+                    status == 500 and 'TimeoutException' in err.response.text)
+            return super()._is_timeout_error(err)
+
         def _http_post_encode_content(self, content: str) -> bytes:
             if ('Content-Type' in self._headers
                 and self._headers['Content-Type'].startswith(
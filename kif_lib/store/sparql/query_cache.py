@@ -0,0 +1,261 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pathlib
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+from ...compiler.sparql.results import SPARQL_Results
+from ...model import KIF_Object
+from ...typing import Callable, cast, ClassVar, TypeAlias, Union
+
+TLocation: TypeAlias = Union[pathlib.PurePath, str]
+
+
+class SPARQL_QueryCache:
+    """Persistent SPARQL query cache.
+
+    Stores raw SPARQL results in a local SQLite database keyed by a hash
+    of the endpoint IRI and the query text.  The database can be shared
+    by multiple threads and processes.
+
+    Entries older than `ttl` seconds are ignored and dropped on lookup.
+    When the total size of the stored results exceeds `max_size` bytes,
+    the least-recently used entries are dropped.
+
+    Parameters:
+       path: Path to the cache database.
+       max_size: Maximum total size of stored results (in bytes).
+       ttl: Time-to-live of entries (in seconds).
+       timeout: How long to wait for a locked database (in seconds).
+    """
+
+    #: Default value for the max size parameter (1 GiB).
+    DEFAULT_MAX_SIZE: ClassVar[int] = 1 << 30
+
+    #: Default value for the timeout parameter.
+    DEFAULT_TIMEOUT: ClassVar[float] = 30.
+
+    __slots__ = (
+        '_connection',
+        '_lock',
+        '_max_size',
+        '_path',
+        '_timeout',
+        '_ttl',
+    )
+
+    #: Path to the cache database.
+    _path: pathlib.Path
+
+    #: Maximum total size of stored results.
+    _max_size: int
+
+    #: Time-to-live of entries.
+    _ttl: float | None
+
+    #: How long to wait for a locked database.
+    _timeout: float
+
+    #: SQLite connection (created on demand).
+    _connection: sqlite3.Connection | None
+
+    #: Lock protecting the connection.
+    _lock: threading.Lock
+
+    def __init__(
+            self,
+            path: TLocation,
+            max_size: int | None = None,
+            ttl: float | None = None,
+            timeout: float | None = None
+    ) -> None:
+        self._path = pathlib.Path(KIF_Object._check_arg_isinstance(
+            path, (pathlib.PurePath, str), type(self), 'path', 1))
+        self._max_size = KIF_Object._check_arg(
+            cast(int, KIF_Object._check_optional_arg_int(
+                max_size, self.DEFAULT_MAX_SIZE, type(self), 'max_size', 2)),
+            lambda x: x >= 0, 'expected a non-negative int',
+            type(self), 'max_size', 2, ValueError)
+        ttl = KIF_Object._check_optional_arg_number(
+            ttl, None, type(self), 'ttl', 3)
+        if ttl is not None:
+            ttl = float(KIF_Object._check_arg(
+                ttl, lambda x: x > 0, 'expected a positive number',
+                type(self), 'ttl', 3, ValueError))
+        self._ttl = ttl
+        self._timeout = float(KIF_Object._check_arg(
+            cast(float, KIF_Object._check_optional_arg_number(
+                timeout, self.DEFAULT_TIMEOUT, type(self), 'timeout', 4)),
+            lambda x: x >= 0, 'expected a non-negative number',
+            type(self), 'timeout', 4, ValueError))
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._get_connection().execute(
+                'SELECT COUNT(*) FROM results').fetchone()[0]
+
+    @property
+    def path(self) -> pathlib.Path:
+        """The path to the cache database."""
+        return self._path
+
+    @property
+    def max_size(self) -> int:
+        """The maximum total size of stored results (in bytes)."""
+        return self._max_size
+
+    @property
+    def ttl(self) -> float | None:
+        """The time-to-live of entries (in seconds)."""
+        return self._ttl
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self._path, timeout=self._timeout,
+                isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('''\
+CREATE TABLE IF NOT EXISTS results (
+  key TEXT PRIMARY KEY,
+  created REAL NOT NULL,
+  accessed REAL NOT NULL,
+  size INTEGER NOT NULL,
+  value BLOB NOT NULL)''')
+            conn.execute('''\
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)''')
+            self._connection = conn
+        return self._connection
+
+    def close(self) -> None:
+        """Closes the cache database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    @classmethod
+    def key(
+            cls,
+            iri: str,
+            query: str,
+            _re: re.Pattern = re.compile(r'_:[A-Za-z0-9]+')
+    ) -> str:
+        """Gets the cache key of `query` over endpoint `iri`.
+
+        Blank node labels are renamed in order of first occurrence, as
+        the compiler generates fresh labels for each query.
+
+        Parameters:
+           iri: Endpoint IRI.
+           query: Query string.
+
+        Returns:
+           Cache key.
+        """
+        labels: dict[str, str] = {}
+        query = _re.sub(lambda m: labels.setdefault(
+            m.group(0), f'_:b{len(labels)}'), query)
+        return hashlib.sha256(
+            f'{iri}\n{query}'.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> SPARQL_Results | None:
+        """Gets the results associated with `key`.
+
+        Parameters:
+           key: Cache key.
+
+        Returns:
+           SPARQL results or ``None`` (no entry or entry has expired).
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._get_connection()
+            row = conn.execute(
+                'SELECT created, value FROM results WHERE key=?',
+                (key,)).fetchone()
+            if row is None:
+                return None
+            if self._ttl is not None and now - row[0] > self._ttl:
+                conn.execute('DELETE FROM results WHERE key=?', (key,))
+                return None
+            conn.execute(
+                'UPDATE results SET accessed=? WHERE key=?', (now, key))
+        return json.loads(zlib.decompress(row[1]))
+
+    def set(self, key: str, results: SPARQL_Results) -> None:
+        """Associates `results` with `key`.
+
+        Parameters:
+           key: Cache key.
+           results: SPARQL results.
+        """
+        value = zlib.compress(json.dumps(
+            results, separators=(',', ':')).encode('utf-8'))
+        if len(value) > self._max_size:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.execute(
+                    'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+                    (key, now, now, len(value), value))
+                self._evict(conn)
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+        if total <= self._max_size:
+            return
+        for key, size in conn.execute(
+                'SELECT key, size FROM results ORDER BY accessed').fetchall():
+            conn.execute('DELETE FROM results WHERE key=?', (key,))
+            total -= size
+            if total <= self._max_size:
+                break
+
+    def get_or_set(
+            self,
+            key: str,
+            get_results: Callable[[], SPARQL_Results]
+    ) -> SPARQL_Results:
+        """Gets the results associated with `key`.
+
+        If there is no such entry, evaluates `get_results` and associates
+        its value with `key`.
+
+        Parameters:
+           key: Cache key.
+           get_results: Function to get the results of a cache miss.
+
+        Returns:
+           SPARQL results.
+        """
+        results = self.get(key)
+        if results is None:
+            results = get_results()
+            self.set(key, results)
+        return results
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        with self._lock:
+            self._get_connection().execute('DELETE FROM results')
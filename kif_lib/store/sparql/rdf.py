@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import os
+from typing import TYPE_CHECKING
 
 from ... import rdflib
 from ...compiler.sparql import SPARQL_Mapping
@@ -13,6 +14,9 @@ from ..abc import Store
 from ..mixer import MixerStore
 from .sparql_core import _CoreSPARQL_Store
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ...compiler.sparql.mapping.wikidata import WikidataMapping
+
 
 class RDF_Store(
         MixerStore,
@@ -166,6 +170,7 @@ class WikidataRDF_Store(
             strict: bool | None = None,
             truthy: Filter.TDatatypeMask | None = None,
             use_schema: bool | None = None,
+            class_hierarchy: WikidataMapping.ClassHierarchy | None = None,
             **kwargs: Any
     ) -> None:
         if mapping is None:
@@ -173,7 +178,8 @@ class WikidataRDF_Store(
                 blazegraph=False,  # force
                 strict=strict,
                 truthy=truthy,
-                use_schema=use_schema)
+                use_schema=use_schema,
+                class_hierarchy=class_hierarchy)
         super().__init__(
             store_name, *args, format=format,
             location=location, file=file, data=data, graph=graph,
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import dataclasses
 import re
+from typing import TYPE_CHECKING
 
 from ... import functools, itertools, rdflib
 from ...compiler.sparql import SPARQL_Mapping
@@ -29,6 +30,9 @@ from ..mixer import MixerStore, MixerStoreOptions
 from .rdf import RDF_Store
 from .sparql_core import _CoreSPARQL_Store
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ...compiler.sparql.mapping.wikidata import WikidataMapping
+
 
 @dataclasses.dataclass
 class _SPARQL_StoreOptions(MixerStoreOptions):
@@ -522,6 +526,7 @@ class WikidataSPARQL_Store(
             strict: bool | None = None,
             truthy: Filter.TDatatypeMask | None = None,
             use_schema: bool | None = None,
+            class_hierarchy: WikidataMapping.ClassHierarchy | None = None,
             **kwargs: Any
     ) -> None:
         if not args:
@@ -534,7 +539,8 @@ class WikidataSPARQL_Store(
                 blazegraph=blazegraph,
                 strict=strict,
                 truthy=truthy,
-                use_schema=use_schema)
+                use_schema=use_schema,
+                class_hierarchy=class_hierarchy)
         super().__init__(
             store_name, *args, format=format,
             location=location, file=file, data=data, graph=graph,
@@ -603,13 +609,15 @@ class WDQS_Store(
             skolemize: bool | None = None,
             mapping: SPARQL_Mapping | None = None,
             truthy: Filter.TDatatypeMask | None = None,
+            class_hierarchy: WikidataMapping.ClassHierarchy | None = None,
             **kwargs: Any
     ) -> None:
         if mapping is None:
             mapping = _CoreSPARQL_Store._wikidata_mapping_constructor(
                 blazegraph=True,  # force
                 strict=True,      # force
-                truthy=truthy)
+                truthy=truthy,
+                class_hierarchy=class_hierarchy)
         super().__init__(
             store_name, *args, format=format,
             location=location, file=file, data=data, graph=graph,
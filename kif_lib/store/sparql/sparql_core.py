@@ -5,12 +5,19 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import collections
+import concurrent.futures
+import contextlib
 import logging
 import pathlib
+import re
 import threading
+import time
+import weakref
 
 from ... import functools, itertools, rdflib
 from ...compiler.sparql import SPARQL_FilterCompiler, SPARQL_Mapping
+from ...compiler.sparql.builder import SelectQuery
 from ...compiler.sparql.results import (
     SPARQL_Results,
     SPARQL_ResultsAsk,
@@ -21,7 +28,10 @@ from ...model import (
     Entity,
     Filter,
     Graph,
+    Item,
     KIF_Object,
+    Lexeme,
+    OrFingerprint,
     Property,
     Snak,
     SnakTemplate,
@@ -31,6 +41,7 @@ from ...model import (
     Term,
     TGraph,
     Value,
+    ValueFingerprint,
     ValuePair,
     ValueSnak,
     ValueSnakTemplate,
@@ -38,15 +49,20 @@ from ...model import (
 )
 from ...typing import (
     Any,
+    AsyncGenerator,
     AsyncIterator,
+    Awaitable,
     BinaryIO,
     Callable,
     cast,
+    ClassVar,
     Final,
+    Generator,
     Iterable,
     Iterator,
     Location,
     Mapping,
+    Optional,
     override,
     Sequence,
     Set,
@@ -56,8 +72,10 @@ from ...typing import (
     Union,
 )
 from ..abc import Store, StoreOptions, TOptions
+from .query_cache import SPARQL_QueryCache
 
 _TOptions = TypeVar('_TOptions', bound=StoreOptions)
+_TTerm = TypeVar('_TTerm', bound=Term)
 T = TypeVar('T')
 TLocation: TypeAlias = Union[pathlib.PurePath, str]
 
@@ -77,6 +95,16 @@ class _CoreSPARQL_Store(
        backend: SPARQL store backend.
        mapping: SPARQL mapping.
        args: Other arguments.
+       query_cache: Persistent query cache (or path to its database).
+       concurrent: Whether to evaluate disjoint queries concurrently.
+       adaptive_page_size: Whether to adapt the page size to the
+          evaluation time of pages.
+       streaming: Whether to stream the results of filter queries.
+       prefetch: Whether to prefetch the pages of filter queries.
+       compiled_filter_cache_size: Maximum number of compiled filters to
+          cache.
+       values_chunk_size: Maximum number of values per chunk of large
+          value disjunctions.
        kwargs: Other keyword arguments.
     """
 
@@ -126,7 +154,8 @@ class _CoreSPARQL_Store(
                Ask query results.
             """
             _logger.debug('%s()\n%s', self.ask.__qualname__, query)
-            return self._ask(query)
+            return cast(SPARQL_ResultsAsk, self._with_query_cache(
+                query, lambda: cast(SPARQL_Results, self._ask(query))))
 
         def _ask(self, query: str) -> SPARQL_ResultsAsk:
             return cast(SPARQL_ResultsAsk, self._select(query))
@@ -138,7 +167,9 @@ class _CoreSPARQL_Store(
         ) -> SPARQL_ResultsAsk:
             """Async version of :meth:`_CoreSPARQL_Store.Backend.ask`."""
             _logger.debug('%s()\n%s', self.aask.__qualname__, query)
-            return await self._aask(query)
+            return cast(SPARQL_ResultsAsk, await self._awith_query_cache(
+                query, cast(Callable[[], Awaitable[SPARQL_Results]],
+                            lambda: self._aask(query))))
 
         async def _aask(self, query: str) -> SPARQL_ResultsAsk:
             return await asyncio.create_task(asyncio.to_thread(
@@ -159,7 +190,8 @@ class _CoreSPARQL_Store(
                Select query results.
             """
             _logger.debug('%s()\n%s', self.select.__qualname__, query)
-            return self._select(query, timeout)
+            return self._with_query_cache(
+                query, lambda: self._select(query, timeout))
 
         @abc.abstractmethod
         def _select(
@@ -169,6 +201,36 @@ class _CoreSPARQL_Store(
         ) -> SPARQL_Results:
             raise NotImplementedError
 
+        def select_stream(
+                self,
+                query: str,
+                timeout: float | None = None
+        ) -> SPARQL_Results:
+            """Evaluates select query over back-end streaming its results.
+
+            The bindings of the returned results might be parsed lazily,
+            as they are consumed, in which case they can be traversed only
+            once.  Cacheable results are not streamed.
+
+            Parameters:
+               query: Query string.
+               timeout: Timeout.
+
+            Returns:
+               Select query results.
+            """
+            if self._get_query_cache_key(query) is not None:
+                return self.select(query, timeout)
+            _logger.debug('%s()\n%s', self.select_stream.__qualname__, query)
+            return self._select_stream(query, timeout)
+
+        def _select_stream(
+                self,
+                query: str,
+                timeout: float | None = None
+        ) -> SPARQL_Results:
+            return self._select(query, timeout)
+
         async def aselect(
                 self,
                 query: str,
@@ -176,7 +238,8 @@ class _CoreSPARQL_Store(
         ) -> SPARQL_Results:
             """Async version of :meth:`_CoreSPARQL_Store.Backend.select`."""
             _logger.debug('%s()\n%s', self.aselect.__qualname__, query)
-            return await self._aselect(query, timeout)
+            return await self._awith_query_cache(
+                query, lambda: self._aselect(query, timeout))
 
         async def _aselect(
                 self,
@@ -186,6 +249,56 @@ class _CoreSPARQL_Store(
             return await asyncio.create_task(asyncio.to_thread(
                 lambda: self._select(query, timeout)))
 
+        def _is_timeout_error(self, err: BaseException) -> bool:
+            """Tests whether `err` signals a query timeout.
+
+            Parameters:
+               err: Exception.
+
+            Returns:
+               ``True`` if successful; ``False`` otherwise.
+            """
+            return isinstance(err, TimeoutError)
+
+        def _get_query_cache_iri(self) -> str | None:
+            return None
+
+        def _get_query_cache_key(self, query: str) -> str | None:
+            cache = self._store._query_cache
+            if cache is None or self._store._backend is not self:
+                return None     # not the main backend of store
+            iri = self._get_query_cache_iri()
+            if iri is None:
+                return None     # results are not cacheable
+            return cache.key(iri, query)
+
+        def _with_query_cache(
+                self,
+                query: str,
+                get_results: Callable[[], SPARQL_Results]
+        ) -> SPARQL_Results:
+            key = self._get_query_cache_key(query)
+            if key is None:
+                return get_results()
+            assert self._store._query_cache is not None
+            return self._store._query_cache.get_or_set(key, get_results)
+
+        async def _awith_query_cache(
+                self,
+                query: str,
+                aget_results: Callable[[], Awaitable[SPARQL_Results]]
+        ) -> SPARQL_Results:
+            key = self._get_query_cache_key(query)
+            if key is None:
+                return await aget_results()
+            cache = self._store._query_cache
+            assert cache is not None
+            results = await asyncio.to_thread(cache.get, key)
+            if results is None:
+                results = await aget_results()
+                await asyncio.to_thread(cache.set, key, results)
+            return results
+
     class LocalBackend(Backend):
         """Abstract base class for local backends.
 
@@ -334,9 +447,193 @@ class _CoreSPARQL_Store(
         def _skolemize(self) -> None:
             raise NotImplementedError
 
+    class PageSizeController:
+        """Page size controller.
+
+        If adaptive, grows the page size while pages are evaluated fast
+        and shrinks it when they are evaluated slowly or time out.
+
+        Parameters:
+           page_size: Initial page size.
+           max_page_size: Maximum page size.
+           adaptive: Whether to adapt the page size.
+        """
+
+        #: Pages evaluated in less than this many seconds grow the page size.
+        FAST: ClassVar[float] = 1.
+
+        #: Pages evaluated in more than this many seconds shrink the page size.
+        SLOW: ClassVar[float] = 10.
+
+        __slots__ = (
+            'adaptive',
+            'max_page_size',
+            'page_size',
+        )
+
+        #: Whether to adapt the page size.
+        adaptive: bool
+
+        #: Maximum page size.
+        max_page_size: int
+
+        #: Current page size.
+        page_size: int
+
+        def __init__(
+                self,
+                page_size: int,
+                max_page_size: int,
+                adaptive: bool = True
+        ) -> None:
+            self.adaptive = adaptive
+            self.max_page_size = max(max_page_size, 1)
+            self.page_size = max(min(page_size, self.max_page_size), 1)
+
+        def update(self, page_size: int, elapsed: float) -> None:
+            """Updates the page size after a page evaluation.
+
+            Parameters:
+               page_size: Size of the evaluated page.
+               elapsed: Time taken by the evaluation (in seconds).
+            """
+            if not self.adaptive:
+                return
+            if elapsed < self.FAST and page_size == self.page_size:
+                self.page_size = min(2 * page_size, self.max_page_size)
+            elif elapsed > self.SLOW:
+                self.page_size = max(page_size // 2, 1)
+
+        def shrink(self) -> bool:
+            """Halves the page size after a page evaluation timed out.
+
+            Returns:
+               ``True`` if the page size was shrunk (the page should be
+               retried); ``False`` otherwise.
+            """
+            if not self.adaptive or self.page_size <= 1:
+                return False
+            self.page_size //= 2
+            return True
+
+    class _FilterBinding:
+        """Binding of the constants of a filter to the placeholders of its
+        shape.
+
+        Parameters:
+           constants: Placeholders indexed by constant.
+        """
+
+        #: First placeholder number.
+        BASE: ClassVar[int] = 10**18
+
+        #: Regex matching placeholder numbers.
+        _re_number: ClassVar[re.Pattern] = re.compile(
+            r'(?<![0-9])1[0-9]{18}(?![0-9])')
+
+        #: Regex matching abstractable IRIs (the ones ending in a number).
+        _re_iri: ClassVar[re.Pattern] = re.compile(
+            r'^(.*[^0-9])([1-9][0-9]*)$')
+
+        __slots__ = (
+            'numbers',
+            'values',
+        )
+
+        #: Constant numbers indexed by placeholder number.
+        numbers: dict[str, str]
+
+        #: Constants indexed by placeholder.
+        values: dict[Term, Term]
+
+        @classmethod
+        def abstract(
+                cls,
+                filter: Filter
+        ) -> tuple[Filter, _CoreSPARQL_Store._FilterBinding | None]:
+            """Abstracts the item and lexeme constants of filter.
+
+            Each constant whose IRI ends in a number is replaced by a
+            placeholder which differs from it only in that number.
+
+            Parameters:
+               filter: Filter.
+
+            Returns:
+               The resulting filter (shape) and the binding of its
+               placeholders (or ``None`` if there are none).
+            """
+            constants: dict[Value, Value] = {}
+
+            def sigma(x: Any) -> Any:
+                if not isinstance(x, (Item, Lexeme)):
+                    return x
+                if x not in constants:
+                    m = cls._re_iri.match(x.iri.content)
+                    if m is None:
+                        return x
+                    constants[x] = type(x)(
+                        m.group(1) + str(cls.BASE + len(constants)))
+                return constants[x]
+            shape = filter.substitute(sigma)
+            if not constants:
+                return filter, None
+            return shape, cls(constants)
+
+        def __init__(self, constants: Mapping[Value, Value]) -> None:
+            self.numbers = {}
+            self.values = {}
+            for constant, placeholder in constants.items():
+                assert isinstance(constant, (Item, Lexeme))
+                assert isinstance(placeholder, (Item, Lexeme))
+                m = self._re_iri.match(constant.iri.content)
+                n = self._re_iri.match(placeholder.iri.content)
+                assert m is not None and n is not None
+                self.numbers[n.group(2)] = m.group(2)
+                self.values[placeholder] = constant
+
+        def bind_text(self, text: str) -> str:
+            """Replaces placeholders by constants in query text.
+
+            Parameters:
+               text: Query text.
+
+            Returns:
+               Query text.
+            """
+            return self._re_number.sub(
+                lambda m: self.numbers.get(m.group(0), m.group(0)), text)
+
+        def bind_term(self, term: _TTerm) -> _TTerm:
+            """Replaces placeholders by constants in term.
+
+            Parameters:
+               term: Term.
+
+            Returns:
+               Term.
+            """
+            value = self.values.get(term)
+            if value is not None:
+                return cast(_TTerm, value)
+            return term.substitute(self.values)
+
     __slots__ = (
+        '_adaptive_page_size',
         '_backend',
+        '_compiled_filter_cache',
+        '_compiled_filter_cache_lock',
+        '_compiled_filter_cache_size',
+        '_concurrent',
         '_mapping',
+        '_prefetch',
+        '_query_cache',
+        '_filter_query_templates',
+        '_filter_query_templates_lock',
+        '_streaming',
+        '_thread_pool',
+        '_thread_pool_lock',
+        '_values_chunk_size',
     )
 
     def __init__(
@@ -345,16 +642,43 @@ class _CoreSPARQL_Store(
             mapping: SPARQL_Mapping,
             backend: type[_CoreSPARQL_Store.Backend],
             *args: Any,
+            query_cache: SPARQL_QueryCache | TLocation | None = None,
+            concurrent: bool | None = None,
+            adaptive_page_size: bool | None = None,
+            streaming: bool | None = None,
+            prefetch: bool | None = None,
+            compiled_filter_cache_size: int | None = None,
+            values_chunk_size: int | None = None,
             **kwargs: Any
     ) -> None:
         self._mapping = None
         self._init_mapping(mapping, type(self), 'mapping')
+        self._query_cache = None
+        self._init_query_cache(query_cache, type(self), 'query_cache')
+        self._concurrent = bool(concurrent)
+        self._adaptive_page_size = bool(adaptive_page_size)
+        self._streaming = bool(streaming)
+        self._prefetch = bool(prefetch)
+        self._compiled_filter_cache = collections.OrderedDict()
+        self._compiled_filter_cache_lock = threading.Lock()
+        self._compiled_filter_cache_size = 0
+        self._filter_query_templates = weakref.WeakKeyDictionary()
+        self._filter_query_templates_lock = threading.Lock()
+        self.set_compiled_filter_cache_size(compiled_filter_cache_size)
+        self._values_chunk_size = 0
+        self.set_values_chunk_size(values_chunk_size)
+        self._thread_pool = None
+        self._thread_pool_lock = threading.Lock()
         self._backend = None
         self._init_backend(backend, args, kwargs, type(self), 'backend')
         super().__init__(store_name, **kwargs)
 
     @override
     def _close(self) -> None:
+        pool = getattr(self, '_thread_pool', None)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
         if self._backend is not None:
             self.backend.close()
 
@@ -363,6 +687,35 @@ class _CoreSPARQL_Store(
         if self._backend is not None:
             await self.backend.aclose()
 
+# -- Thread pool -----------------------------------------------------------
+
+    #: Thread pool (created on demand).
+    _thread_pool: concurrent.futures.ThreadPoolExecutor | None
+
+    #: Lock to sync the creation of thread pool.
+    _thread_pool_lock: threading.Lock
+
+    def _get_thread_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        ###
+        # The pool is shared by all requests of store.  Only leaf tasks
+        # (i.e., tasks that do not wait for other tasks of the pool) are
+        # submitted to it.
+        ###
+        with self._thread_pool_lock:
+            if self._thread_pool is None:
+                self._thread_pool = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix=type(self).__name__)
+            return self._thread_pool
+
+    def _is_concurrent(self, queries: Sequence[Any]) -> bool:
+        ###
+        # Disjoint queries are evaluated concurrently if the concurrent
+        # flag is set or if values chunking is enabled, as the chunks of
+        # a large disjunction are meant to be evaluated in parallel.
+        ###
+        return len(queries) > 1 and (
+            self._concurrent or self._values_chunk_size > 0)
+
 # -- Backend ---------------------------------------------------------------
 
     #: SPARQL store backend.
@@ -395,6 +748,354 @@ class _CoreSPARQL_Store(
         assert self._backend is not None
         return self._backend
 
+# -- Query cache -----------------------------------------------------------
+
+    #: Persistent query cache.
+    _query_cache: SPARQL_QueryCache | None
+
+    def _init_query_cache(
+            self,
+            query_cache: SPARQL_QueryCache | TLocation | None,
+            function: Location | None = None,
+            name: str | None = None,
+            position: int | None = None
+    ) -> None:
+        if query_cache is None or isinstance(query_cache, SPARQL_QueryCache):
+            self._query_cache = query_cache
+        else:
+            self._query_cache = SPARQL_QueryCache(KIF_Object._check_arg(
+                query_cache, isinstance(query_cache, (pathlib.PurePath, str)),
+                'expected SPARQL_QueryCache, path, or str',
+                function, name, position, TypeError))
+
+    @property
+    def query_cache(self) -> SPARQL_QueryCache | None:
+        """The persistent query cache of SPARQL store."""
+        return self.get_query_cache()
+
+    def get_query_cache(self) -> SPARQL_QueryCache | None:
+        """Gets the persistent query cache of SPARQL store.
+
+        Returns:
+           SPARQL query cache or ``None`` (no cache).
+        """
+        return self._query_cache
+
+# -- Concurrency -----------------------------------------------------------
+
+    #: Whether to evaluate disjoint queries concurrently.
+    _concurrent: bool
+
+    @property
+    def concurrent(self) -> bool:
+        """The concurrent flag of SPARQL store."""
+        return self.get_concurrent()
+
+    @concurrent.setter
+    def concurrent(self, concurrent: bool | None = None) -> None:
+        self.set_concurrent(concurrent)
+
+    def get_concurrent(self) -> bool:
+        """Gets the concurrent flag of SPARQL store.
+
+        If set, the disjoint queries of a filter are evaluated
+        concurrently instead of one after the other.
+
+        Returns:
+           Concurrent flag.
+        """
+        return self._concurrent
+
+    def set_concurrent(self, concurrent: bool | None = None) -> None:
+        """Sets the concurrent flag of SPARQL store.
+
+        If `concurrent` is ``None``, resets it to ``False``.
+
+        Parameters:
+           concurrent: Concurrent flag.
+        """
+        self._concurrent = bool(concurrent)
+
+# -- Adaptive page size ----------------------------------------------------
+
+    #: Whether to adapt the page size.
+    _adaptive_page_size: bool
+
+    @property
+    def adaptive_page_size(self) -> bool:
+        """The adaptive page size flag of SPARQL store."""
+        return self.get_adaptive_page_size()
+
+    @adaptive_page_size.setter
+    def adaptive_page_size(
+            self,
+            adaptive_page_size: bool | None = None
+    ) -> None:
+        self.set_adaptive_page_size(adaptive_page_size)
+
+    def get_adaptive_page_size(self) -> bool:
+        """Gets the adaptive page size flag of SPARQL store.
+
+        If set, the page size of filter queries starts at the page size
+        option and grows (up to the max page size option) while pages are
+        evaluated fast, and shrinks when they are evaluated slowly.  Pages
+        that time out are retried with half the size.
+
+        Returns:
+           Adaptive page size flag.
+        """
+        return self._adaptive_page_size
+
+    def set_adaptive_page_size(
+            self,
+            adaptive_page_size: bool | None = None
+    ) -> None:
+        """Sets the adaptive page size flag of SPARQL store.
+
+        If `adaptive_page_size` is ``None``, resets it to ``False``.
+
+        Parameters:
+           adaptive_page_size: Adaptive page size flag.
+        """
+        self._adaptive_page_size = bool(adaptive_page_size)
+
+# -- Streaming -------------------------------------------------------------
+
+    #: Whether to stream the results of filter queries.
+    _streaming: bool
+
+    @property
+    def streaming(self) -> bool:
+        """The streaming flag of SPARQL store."""
+        return self.get_streaming()
+
+    @streaming.setter
+    def streaming(self, streaming: bool | None = None) -> None:
+        self.set_streaming(streaming)
+
+    def get_streaming(self) -> bool:
+        """Gets the streaming flag of SPARQL store.
+
+        If set, the pages of (sync) filter queries are fetched one at a
+        time and their results are consumed as they are parsed, instead of
+        after the whole page is parsed.  Streaming is not used with
+        adaptive page size, and supersedes the lookahead option.
+
+        Returns:
+           Streaming flag.
+        """
+        return self._streaming
+
+    def set_streaming(self, streaming: bool | None = None) -> None:
+        """Sets the streaming flag of SPARQL store.
+
+        If `streaming` is ``None``, resets it to ``False``.
+
+        Parameters:
+           streaming: Streaming flag.
+        """
+        self._streaming = bool(streaming)
+
+# -- Prefetch --------------------------------------------------------------
+
+    #: Whether to prefetch the pages of filter queries.
+    _prefetch: bool
+
+    @property
+    def prefetch(self) -> bool:
+        """The prefetch flag of SPARQL store."""
+        return self.get_prefetch()
+
+    @prefetch.setter
+    def prefetch(self, prefetch: bool | None = None) -> None:
+        self.set_prefetch(prefetch)
+
+    def get_prefetch(self) -> bool:
+        """Gets the prefetch flag of SPARQL store.
+
+        If set, once a full page of a (sync) filter query arrives, up to
+        lookahead of the next pages are fetched in background while the
+        current one is being consumed.  Prefetching is not used with
+        adaptive page size nor with streaming.
+
+        Returns:
+           Prefetch flag.
+        """
+        return self._prefetch
+
+    def set_prefetch(self, prefetch: bool | None = None) -> None:
+        """Sets the prefetch flag of SPARQL store.
+
+        If `prefetch` is ``None``, resets it to ``False``.
+
+        Parameters:
+           prefetch: Prefetch flag.
+        """
+        self._prefetch = bool(prefetch)
+
+# -- Compiled filter cache -------------------------------------------------
+
+    #: Type alias for compiled filter cache keys.
+    _CompiledFilterKey: TypeAlias = tuple[
+        Filter, SPARQL_FilterCompiler.Projection, bool, int, str]
+
+    #: Type alias for compiled filters.
+    _CompiledFilter: TypeAlias = tuple[
+        SPARQL_FilterCompiler, VariablePattern, StatementVariable,
+        Optional[_FilterBinding]]
+
+    #: Type alias for the disjoint queries of compiled filters.
+    _CompiledFilterQuery: TypeAlias = tuple[
+        SPARQL_FilterCompiler, SPARQL_FilterCompiler.Query,
+        Optional[_FilterBinding]]
+
+    #: Compiled filters (in least-recently used order).
+    _compiled_filter_cache: collections.OrderedDict[
+        _CompiledFilterKey, tuple[
+            SPARQL_FilterCompiler, VariablePattern, StatementVariable]]
+
+    #: Lock to sync access to compiled filter cache.
+    _compiled_filter_cache_lock: threading.Lock
+
+    #: Maximum number of compiled filters to cache.
+    _compiled_filter_cache_size: int
+
+    #: Type alias for prepared query template keys (projection, distinct
+    #: flag, and limit).  Count queries have limit ``None`` and ask
+    #: queries have projection ``None``.
+    _FilterQueryTemplateKey: TypeAlias = tuple[
+        Optional[SPARQL_FilterCompiler.Projection], bool, Optional[int]]
+
+    #: Prepared query templates (i.e., pre-rendered query texts) of the
+    #: disjoint queries of cached compiled filters.
+    _filter_query_templates: weakref.WeakKeyDictionary[
+        SPARQL_FilterCompiler.Query, dict[_FilterQueryTemplateKey, str]]
+
+    #: Maximum number of prepared query templates per disjoint query.
+    _filter_query_templates_size: Final[int] = 16
+
+    #: Lock to sync builds of shared queries.
+    _filter_query_templates_lock: threading.Lock
+
+    @property
+    def compiled_filter_cache_size(self) -> int:
+        """The compiled filter cache size of SPARQL store."""
+        return self.get_compiled_filter_cache_size()
+
+    @compiled_filter_cache_size.setter
+    def compiled_filter_cache_size(
+            self,
+            compiled_filter_cache_size: int | None = None
+    ) -> None:
+        self.set_compiled_filter_cache_size(compiled_filter_cache_size)
+
+    def get_compiled_filter_cache_size(self) -> int:
+        """Gets the compiled filter cache size of SPARQL store.
+
+        If nonzero, the results of compiling filters are cached (up to
+        this many) and the queries of cached filters are rendered once
+        into prepared query templates.
+
+        The cache key is the shape of the normalized filter, i.e., the
+        filter with its item and lexeme constants abstracted: each
+        constant whose IRI ends in a number (e.g., ``wd:Q5``) is replaced
+        by a placeholder which differs from it only in that number.  So
+        mapping entries matched against the constant by IRI prefix or by
+        IRI pattern match the placeholder in the same way.  The actual
+        constants are substituted for the placeholders in the query texts
+        and in the results.  Other constants (e.g., properties and data
+        values) are part of the shape.  Page queries get their limit and
+        offset from the query builder; only first pages are prepared.
+
+        Compiled filters depend on the mapping options, which are part of
+        the cache key, and on the state of the mapping, which is not.
+        Use :meth:`clear_compiled_filter_cache` to discard compiled
+        filters when the latter changes.  Constants are not abstracted if
+        the mapping has a class hierarchy cache (as in Wikidata mapping),
+        since the compiled queries then depend on the closures of the
+        constants.
+
+        Returns:
+           Compiled filter cache size.
+        """
+        return self._compiled_filter_cache_size
+
+    def set_compiled_filter_cache_size(
+            self,
+            compiled_filter_cache_size: int | None = None
+    ) -> None:
+        """Sets the compiled filter cache size of SPARQL store.
+
+        If `compiled_filter_cache_size` is ``None``, resets it to zero
+        (i.e., disables the cache).
+
+        Parameters:
+           compiled_filter_cache_size: Compiled filter cache size.
+        """
+        size = cast(int, KIF_Object._check_optional_arg_int(
+            compiled_filter_cache_size, 0, self.set_compiled_filter_cache_size,
+            'compiled_filter_cache_size', 1))
+        with self._compiled_filter_cache_lock:
+            self._compiled_filter_cache_size = max(size, 0)
+            while len(self._compiled_filter_cache) > (
+                    self._compiled_filter_cache_size):
+                self._compiled_filter_cache.popitem(last=False)
+
+    def clear_compiled_filter_cache(self) -> None:
+        """Discards all cached compiled filters."""
+        with self._compiled_filter_cache_lock:
+            self._compiled_filter_cache.clear()
+
+# -- Values chunk size -----------------------------------------------------
+
+    #: Maximum number of values per chunk of large value disjunctions.
+    _values_chunk_size: int
+
+    @property
+    def values_chunk_size(self) -> int:
+        """The values chunk size of SPARQL store."""
+        return self.get_values_chunk_size()
+
+    @values_chunk_size.setter
+    def values_chunk_size(self, values_chunk_size: int | None = None) -> None:
+        self.set_values_chunk_size(values_chunk_size)
+
+    def get_values_chunk_size(self) -> int:
+        """Gets the values chunk size of SPARQL store.
+
+        If nonzero, filters whose subject, property, or value is a
+        disjunction of more than this many values are split into filters
+        over chunks of (at most) this many values.  The chunks are
+        compiled separately and their disjoint queries are evaluated as
+        if they were disjoint queries of a single compiled filter.  These
+        are evaluated concurrently (in the store's thread pool) whenever
+        chunking is enabled, regardless of the :attr:`concurrent` flag.
+
+        Only disjunctions on projected positions are split, so that the
+        results of distinct chunks are distinct.
+
+        Returns:
+           Values chunk size.
+        """
+        return self._values_chunk_size
+
+    def set_values_chunk_size(
+            self,
+            values_chunk_size: int | None = None
+    ) -> None:
+        """Sets the values chunk size of SPARQL store.
+
+        If `values_chunk_size` is ``None``, resets it to zero (i.e.,
+        disables chunking).
+
+        Parameters:
+           values_chunk_size: Values chunk size.
+        """
+        size = cast(int, KIF_Object._check_optional_arg_int(
+            values_chunk_size, 0, self.set_values_chunk_size,
+            'values_chunk_size', 1))
+        self._values_chunk_size = max(size, 0)
+
 # -- SPARQL mapping --------------------------------------------------------
 
     @classmethod
@@ -532,29 +1233,76 @@ class _CoreSPARQL_Store(
 
     @override
     def _ask(self, filter: Filter, options: TOptions) -> bool:
-        it = self._build_ask_query_stream_from_filter(filter, options)
-        return any(
-            self._parse_ask_results(self.backend.ask(str(query.ask())))
-            for query in it)
+        queries = list(self._build_ask_query_stream_from_filter(
+            filter, options))
+        if len(queries) <= 1:
+            return any(
+                self._parse_ask_results(self.backend.ask(query))
+                for query in queries)
+        ###
+        # Evaluate the disjoint queries concurrently and return as soon
+        # as one of them succeeds.  A failure is raised only if none of
+        # them succeeds.  Pending queries are cancelled; the ones in
+        # flight are left to finish in background.
+        ###
+        pool = self._get_thread_pool()
+        futures = [pool.submit(self.backend.ask, query) for query in queries]
+        error: BaseException | None = None
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    if self._parse_ask_results(future.result()):
+                        return True
+                except Exception as err:
+                    error = error or err
+            if error is not None:
+                raise error
+            return False
+        finally:
+            for future in futures:
+                future.cancel()
 
     @override
     async def _aask(self, filter: Filter, options: TOptions) -> bool:
-        it = list(self._build_ask_query_stream_from_filter(filter, options))
-        tasks = (
-            asyncio.ensure_future(self.backend.aask(str(query.ask())))
-            for query in it)
-        return any(
-            self._parse_ask_results(results)
-            for results in await asyncio.gather(*tasks))
+        tasks = [
+            asyncio.ensure_future(self.backend.aask(query))
+            for query in self._build_ask_query_stream_from_filter(
+                filter, options)]
+        error: BaseException | None = None
+        try:
+            for task in asyncio.as_completed(tasks):
+                try:
+                    if self._parse_ask_results(await task):
+                        return True
+                except Exception as err:
+                    error = error or err
+            if error is not None:
+                raise error
+            return False
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     def _build_ask_query_stream_from_filter(
             self,
             filter: Filter,
             options: TOptions
-    ) -> Iterator[SPARQL_FilterCompiler.Query]:
-        compiler, _, _ = self._compile_filter(
-            filter, options, SPARQL_FilterCompiler.Projection.ALL)
-        yield from compiler.query_stack
+    ) -> Iterator[str]:
+        for _, query, binding in self._get_compiled_filter_queries(
+                self._compile_filter_chunks(
+                    filter, options, SPARQL_FilterCompiler.Projection.ALL)):
+            yield self._build_ask_query_text(query, binding)
+
+    def _build_ask_query_text(
+            self,
+            query: SPARQL_FilterCompiler.Query,
+            binding: _FilterBinding | None = None
+    ) -> str:
+        return self._build_filter_query_template(
+            query, (None, False, None), binding,
+            lambda: self._build_filter_query_shared(
+                query, lambda: query.ask()))
 
     def _parse_ask_results(self, results: SPARQL_ResultsAsk) -> bool:
         assert 'boolean' in results
@@ -609,12 +1357,24 @@ class _CoreSPARQL_Store(
             options: TOptions,
             projection: SPARQL_FilterCompiler.Projection
     ) -> int:
-        it = self._build_count_query_stream_from_filter(
-            filter, options, projection)
-        return sum(
-            self._parse_count_results(
-                count, self.backend.select(str(query), options.timeout))
-            for count, query in it)
+        queries = list(self._build_count_query_stream_from_filter(
+            filter, options, projection))
+        if not self._is_concurrent(queries):
+            return sum(
+                self._parse_count_results(
+                    self.backend.select(query, options.timeout))
+                for query in queries)
+        futures = [
+            self._get_thread_pool().submit(
+                self.backend.select, query, options.timeout)
+            for query in queries]
+        try:
+            return sum(
+                self._parse_count_results(future.result())
+                for future in futures)
+        finally:
+            for future in futures:
+                future.cancel()
 
     @override
     async def _acount(self, filter: Filter, options: TOptions) -> int:
@@ -663,48 +1423,59 @@ class _CoreSPARQL_Store(
             options: TOptions,
             projection: SPARQL_FilterCompiler.Projection
     ) -> int:
-        it = list(self._build_count_query_stream_from_filter(
-            filter, options, projection))
         tasks = (
-            asyncio.ensure_future(
-                self.backend.aselect(str(query), options.timeout))
-            for _, query in it)
-        return sum(
-            self._parse_count_results(count, results)
-            for (count, _), results in zip(
-                it, await asyncio.gather(*tasks)))
+            asyncio.ensure_future(self.backend.aselect(query, options.timeout))
+            for query in self._build_count_query_stream_from_filter(
+                filter, options, projection))
+        return sum(map(
+            self._parse_count_results, await asyncio.gather(*tasks)))
 
     def _build_count_query_stream_from_filter(
             self,
             filter: Filter,
             options: TOptions,
             projection: SPARQL_FilterCompiler.Projection
-    ) -> Iterator[tuple[SPARQL_FilterCompiler.Query.Variable,
-                        SPARQL_FilterCompiler.Query]]:
-        compiler, _, _ = self._compile_filter(
-            filter.replace(annotated=False), options, projection)
-        for disjoint_query in compiler.query_stack:
-            try:
-                q = next(self._build_filter_query_stream(
-                    compiler, disjoint_query, projection, True, 1, 1))
-            except StopIteration as err:
-                raise self._should_not_get_here() from err
-            q.set_limit(None)
-            q.set_offset(None)
-            count = compiler.fresh_qvar()
-            query = compiler.Query()
-            query.subquery(q)()
-            yield count, query.select((q.count(), count))  # type: ignore
-
-    def _parse_count_results(
+    ) -> Iterator[str]:
+        for compiler, disjoint_query, binding in (
+                self._get_compiled_filter_queries(
+                    self._compile_filter_chunks(
+                        filter.replace(annotated=False), options,
+                        projection))):
+            yield self._build_count_query_text(
+                compiler, disjoint_query, projection, binding)
+
+    #: Name of the variable bound to the result of count queries.
+    _count_query_variable: Final[str] = '_count'
+
+    def _build_count_query_text(
             self,
-            count: SPARQL_FilterCompiler.Query.Variable,
-            results: SPARQL_Results
-    ) -> int:
+            compiler: SPARQL_FilterCompiler,
+            query: SPARQL_FilterCompiler.Query,
+            projection: SPARQL_FilterCompiler.Projection,
+            binding: _FilterBinding | None = None
+    ) -> str:
+        ###
+        # The count variable is fixed (instead of fresh in `compiler`), so
+        # that builds do not touch the state of shared compilers and the
+        # count queries of a given filter always have the same text.
+        ###
+        def build() -> SelectQuery:
+            q = compiler.build_query(
+                query=query, projection=projection, distinct=True)
+            count = compiler.Query()
+            count.subquery(q)()
+            return count.select((
+                q.count(), count.var(self._count_query_variable)))
+        return self._build_filter_query_template(
+            query, (projection, True, None), binding,
+            lambda: self._build_filter_query_shared(query, build))
+
+    def _parse_count_results(self, results: SPARQL_Results) -> int:
         assert 'results' in results
         assert 'bindings' in results['results']
         assert len(results['results']['bindings']) == 1
-        return int(results['results']['bindings'][0][str(count)]['value'])
+        return int(results['results']['bindings'][0][
+            self._count_query_variable]['value'])
 
 # -- Filter ----------------------------------------------------------------
 
@@ -787,47 +1558,333 @@ class _CoreSPARQL_Store(
             options: TOptions,
             projection: SPARQL_FilterCompiler.Projection
     ) -> Iterator[ClosedTerm]:
-        compiler, _, variable = self._compile_filter(
-            filter, options, projection)
-        push = compiler.build_results()
+        chunks = self._compile_filter_chunks(filter, options, projection)
+        compiler, _, variable, _ = chunks[0]
+        queries = list(self._get_compiled_filter_queries(chunks))
         select = functools.partial(
             self._filter_with_projection_select, compiler, projection)
         limit = options.limit
         if limit is None:
             limit = options.max_limit
         assert limit is not None
-        timeout = options.timeout
         total_count = 0
 
         def process(
-                disjoint_query: SPARQL_FilterCompiler.Query
+                compiler: SPARQL_FilterCompiler,
+                disjoint_query: SPARQL_FilterCompiler.Query,
+                filter_binding: _CoreSPARQL_Store._FilterBinding | None
         ) -> Iterator[ClosedTerm]:
-            stream = self._build_filter_query_stream(
-                compiler, disjoint_query, projection,
-                options.distinct, limit, options.page_size)
             nonlocal total_count
+            push = compiler.build_results()
+            fixed = self._filter_uses_fixed_pages(disjoint_query)
             count = 0
+            with contextlib.closing(self._build_filter_pages(
+                    compiler, disjoint_query, filter_binding, projection,
+                    options, limit, options.lookahead)) as pages:
+                for results in pages:
+                    bindings = self._build_filter_result_binding_stream(
+                        (results,))
+                    first = next(bindings, None)
+                    if first is None:
+                        return      # done
+                    for binding in itertools.chain(
+                            (first,), bindings, ({},)):
+                        thetas = push(binding)
+                        if thetas is None:
+                            continue  # push more results
+                        for theta in thetas:
+                            stmt = variable.instantiate(theta)
+                            assert isinstance(
+                                stmt, (Statement, StatementTemplate))
+                            if filter_binding is not None:
+                                stmt = filter_binding.bind_term(stmt)
+                            yield select(stmt)
+                            count += 1
+                            total_count += 1
+                            assert total_count <= limit, (count, limit)
+                            if total_count == limit:
+                                return  # done
+                    if fixed and count < options.page_size:
+                        break       # done
+        if self._is_concurrent(queries):
+            return self._filter_with_projection_concurrent(
+                queries, variable, select, projection, options, limit)
+        return itertools.chain(*itertools.starmap(process, queries))
+
+    def _build_filter_pages(
+            self,
+            compiler: SPARQL_FilterCompiler,
+            query: SPARQL_FilterCompiler.Query,
+            binding: _FilterBinding | None,
+            projection: SPARQL_FilterCompiler.Projection,
+            options: TOptions,
+            limit: int,
+            lookahead: int
+    ) -> Generator[SPARQL_Results, None, None]:
+        controller = self._build_filter_page_size_controller(options)
+        if self.adaptive_page_size:
+            return self._build_filter_adaptive_page_stream(
+                compiler, query, binding, projection, options.distinct,
+                limit, controller, options.timeout)
+        elif self.streaming:
+            return self._build_filter_streaming_page_stream(
+                self._build_filter_query_stream(
+                    compiler, query, binding, projection, options.distinct,
+                    limit, options.page_size), options.timeout)
+        else:
+            return self._build_filter_page_stream(
+                self._build_filter_query_stream(
+                    compiler, query, binding, projection, options.distinct,
+                    limit, options.page_size),
+                options.page_size, lookahead, options.timeout)
+
+    def _build_filter_streaming_page_stream(
+            self,
+            stream: Iterator[str],
+            timeout: float | None
+    ) -> Generator[SPARQL_Results, None, None]:
+        ###
+        # Evaluates the page queries in `stream` streaming their results.
+        # The bindings of each page are closed once the page is done with,
+        # so that the underlying response is released even if the page is
+        # not consumed to the end.
+        ###
+        for query in stream:
+            results = self.backend.select_stream(query, timeout)
+            try:
+                yield results
+            finally:
+                bindings = cast(dict[str, Any], results).get(
+                    'results', {}).get('bindings')
+                if isinstance(bindings, Generator):
+                    bindings.close()
+
+    def _build_filter_page_stream(
+            self,
+            stream: Iterator[str],
+            page_size: int,
+            lookahead: int,
+            timeout: float | None
+    ) -> Generator[SPARQL_Results, None, None]:
+        ###
+        # Evaluates the page queries in `stream`.  If prefetch is enabled,
+        # once a full page arrives, keeps up to `lookahead` of the next
+        # pages in flight while the current one is being consumed.  Pages
+        # still in flight when the stream is closed are cancelled.
+        ###
+        query = next(stream, None)
+        if query is None:
+            return              # done
+        results = self.backend.select(query, timeout)
+        if (not self.prefetch or lookahead <= 1
+                or self._count_filter_result_bindings(
+                    results) < page_size):
+            yield results
             for query in stream:
-                bindings = list(self._build_filter_result_binding_stream((
-                    self.backend.select(str(query), timeout),)))
-                for binding in itertools.chain(bindings, ({},)):
+                yield self.backend.select(query, timeout)
+            return              # done
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=lookahead)
+        pending: collections.deque[
+            concurrent.futures.Future[SPARQL_Results]] = collections.deque()
+        exhausted = False
+
+        def fill() -> None:
+            nonlocal exhausted
+            while not exhausted and len(pending) < lookahead:
+                query = next(stream, None)
+                if query is None:
+                    exhausted = True
+                else:
+                    pending.append(executor.submit(
+                        self.backend.select, query, timeout))
+        try:
+            fill()
+            yield results
+            while pending:
+                results = pending.popleft().result()
+                if self._count_filter_result_bindings(results) < page_size:
+                    exhausted = True  # last page
+                    for future in pending:
+                        future.cancel()
+                    pending.clear()
+                else:
+                    fill()
+                yield results
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _build_filter_adaptive_page_stream(
+            self,
+            compiler: SPARQL_FilterCompiler,
+            query: SPARQL_FilterCompiler.Query,
+            binding: _FilterBinding | None,
+            projection: SPARQL_FilterCompiler.Projection,
+            distinct: bool,
+            limit: int,
+            controller: PageSizeController,
+            timeout: float | None
+    ) -> Generator[SPARQL_Results, None, None]:
+        offset = 0
+        while offset < limit:
+            n, results = self._select_filter_page(
+                controller, lambda n: self._build_filter_query_text(
+                    compiler, query, projection, distinct, n, offset,
+                    binding),
+                limit - offset, timeout)
+            yield results
+            offset += n
+            if self._count_filter_result_bindings(results) < n:
+                break           # done
+
+    def _select_filter_page(
+            self,
+            controller: PageSizeController,
+            build: Callable[[int], str],
+            limit: int,
+            timeout: float | None
+    ) -> tuple[int, SPARQL_Results]:
+        ###
+        # Evaluates the page query of size `n` constructed by `build`,
+        # where `n` is the current page size of `controller` (at most
+        # `limit`).  If the evaluation times out, retries it with half the
+        # size (if the controller allows it).
+        ###
+        while True:
+            n = min(controller.page_size, limit)
+            start = time.perf_counter()
+            try:
+                results = self.backend.select(build(n), timeout)
+            except Exception as err:
+                if self.backend._is_timeout_error(err) and controller.shrink():
+                    _logger.debug(
+                        '%s(): page of size %d timed out; retrying with %d',
+                        self._select_filter_page.__qualname__,
+                        n, controller.page_size)
+                    continue
+                raise
+            controller.update(n, time.perf_counter() - start)
+            return n, results
+
+    async def _aselect_filter_page(
+            self,
+            controller: PageSizeController,
+            build: Callable[[int], str],
+            limit: int,
+            timeout: float | None
+    ) -> tuple[int, SPARQL_Results]:
+        while True:
+            n = min(controller.page_size, limit)
+            start = time.perf_counter()
+            try:
+                results = await self.backend.aselect(build(n), timeout)
+            except Exception as err:
+                if self.backend._is_timeout_error(err) and controller.shrink():
+                    _logger.debug(
+                        '%s(): page of size %d timed out; retrying with %d',
+                        self._aselect_filter_page.__qualname__,
+                        n, controller.page_size)
+                    continue
+                raise
+            controller.update(n, time.perf_counter() - start)
+            return n, results
+
+    def _build_filter_page_size_controller(
+            self,
+            options: TOptions
+    ) -> PageSizeController:
+        return self.PageSizeController(
+            options.page_size, options.max_page_size,
+            self.adaptive_page_size)
+
+    def _count_filter_result_bindings(self, results: SPARQL_Results) -> int:
+        return sum(1 for _ in self._build_filter_result_binding_stream(
+            (results,)))
+
+    def _filter_with_projection_concurrent(
+            self,
+            queries: Sequence[_CompiledFilterQuery],
+            variable: StatementVariable,
+            select: Callable[[Statement | StatementTemplate], ClosedTerm],
+            projection: SPARQL_FilterCompiler.Projection,
+            options: TOptions,
+            limit: int
+    ) -> Iterator[ClosedTerm]:
+        ###
+        # Fetches the pages of each disjoint query in the thread pool of
+        # store and consumes them in order of arrival.  Result processing
+        # happens in the calling thread.  Each task fetches a single page
+        # (lookahead is 1), so only leaf tasks are submitted to the pool.
+        ###
+        streams = [
+            self._build_filter_pages(
+                compiler, disjoint_query, binding, projection, options,
+                limit, 1)
+            for compiler, disjoint_query, binding in queries]
+        fixed = [
+            self._filter_uses_fixed_pages(disjoint_query)
+            for _, disjoint_query, _ in queries]
+        filter_bindings = [binding for _, _, binding in queries]
+        pushes = [compiler.build_results() for compiler, _, _ in queries]
+        counts = [0] * len(streams)
+        total_count = 0
+        pending: dict[
+            concurrent.futures.Future[SPARQL_Results | None], int] = {}
+        pool = self._get_thread_pool()
+
+        def submit(i: int) -> None:
+            pending[pool.submit(next, streams[i], None)] = i
+
+        def close(i: int, *args: Any) -> None:
+            streams[i].close()
+        try:
+            for i in range(len(streams)):
+                submit(i)
+            while pending:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    i = pending.pop(future)
+                    results = future.result()
+                    if results is None:
+                        continue    # done with i
+                    bindings = list(self._build_filter_result_binding_stream(
+                        (results,)))
                     if not bindings:
-                        return      # done
-                    thetas = push(binding)
-                    if thetas is None:
-                        continue    # push more results
-                    for theta in thetas:
-                        stmt = variable.instantiate(theta)
-                        assert isinstance(stmt, (Statement, StatementTemplate))
-                        yield select(stmt)
-                        count += 1
-                        total_count += 1
-                        assert total_count <= limit, (count, limit)
-                        if total_count == limit:
-                            return  # done
-                if count < options.page_size:
-                    break           # done
-        return itertools.chain(*map(process, compiler.query_stack))
+                        continue    # done with i
+                    for binding in itertools.chain(bindings, ({},)):
+                        thetas = pushes[i](binding)
+                        if thetas is None:
+                            continue  # push more results
+                        for theta in thetas:
+                            stmt = variable.instantiate(theta)
+                            assert isinstance(
+                                stmt, (Statement, StatementTemplate))
+                            filter_binding = filter_bindings[i]
+                            if filter_binding is not None:
+                                stmt = filter_binding.bind_term(stmt)
+                            yield select(stmt)
+                            counts[i] += 1
+                            total_count += 1
+                            assert total_count <= limit, (total_count, limit)
+                            if total_count == limit:
+                                return  # done
+                    if not fixed[i] or counts[i] >= options.page_size:
+                        submit(i)
+        finally:
+            ###
+            # Streams still being advanced by a worker are closed as soon
+            # as the worker is done with them; the others are closed here.
+            ###
+            for future, i in pending.items():
+                future.cancel()
+                future.add_done_callback(functools.partial(close, i))
+            busy = set(pending.values())
+            for i in range(len(streams)):
+                if i not in busy:
+                    close(i)
 
     def _filter_with_projection_select(
             self,
@@ -952,33 +2009,31 @@ class _CoreSPARQL_Store(
             options: TOptions,
             projection: SPARQL_FilterCompiler.Projection
     ) -> AsyncIterator[ClosedTerm]:
-        compiler, _, variable = self._compile_filter(
-            filter, options, projection)
-        push = compiler.build_results()
+        chunks = self._compile_filter_chunks(filter, options, projection)
+        compiler, _, variable, _ = chunks[0]
+        queries = list(self._get_compiled_filter_queries(chunks))
         select = functools.partial(
             self._filter_with_projection_select, compiler, projection)
         limit = options.limit
         if limit is None:
             limit = options.max_limit
         assert limit is not None
-        timeout = options.timeout
         total_count = 0
 
         async def aprocess(
-                disjoint_query: SPARQL_FilterCompiler.Query
+                compiler: SPARQL_FilterCompiler,
+                disjoint_query: SPARQL_FilterCompiler.Query,
+                filter_binding: _CoreSPARQL_Store._FilterBinding | None
         ) -> AsyncIterator[ClosedTerm]:
-            stream = self._build_filter_query_stream(
-                compiler, disjoint_query, projection,
-                options.distinct, limit, options.page_size)
             nonlocal total_count
+            push = compiler.build_results()
+            fixed = self._filter_uses_fixed_pages(disjoint_query)
             count = 0
-            for batch in itertools.batched(stream, self.lookahead):
-                tasks = (
-                    asyncio.ensure_future(self.backend.aselect(
-                        str(q), timeout))
-                    for q in batch)
-                bindings = list(self._build_filter_result_binding_stream(
-                    await asyncio.gather(*tasks)))
+            async for batch in self._abuild_filter_pages(
+                    compiler, disjoint_query, filter_binding, projection,
+                    options, limit):
+                bindings = list(
+                    self._build_filter_result_binding_stream(batch))
                 if not bindings:
                     break           # done
                 for binding in itertools.chain(bindings, ({},)):
@@ -988,18 +2043,181 @@ class _CoreSPARQL_Store(
                     for theta in thetas:
                         stmt = variable.instantiate(theta)
                         assert isinstance(stmt, (Statement, StatementTemplate))
+                        if filter_binding is not None:
+                            stmt = filter_binding.bind_term(stmt)
                         yield select(stmt)
                         count += 1
                         total_count += 1
                         assert total_count <= limit, (count, limit)
                         if total_count == limit:
                             return  # done
-                if count % self.page_size != 0:
+                if fixed and count % options.page_size != 0:
                     break           # done
-        async for term in itertools.achain(*map(
-                aprocess, compiler.query_stack)):
+        if self._is_concurrent(queries):
+            it = self._afilter_with_projection_concurrent(
+                queries, variable, select, projection, options, limit)
+        else:
+            it = itertools.achain(*itertools.starmap(aprocess, queries))
+        async for term in it:
             yield term
 
+    async def _afilter_with_projection_concurrent(
+            self,
+            queries: Sequence[_CompiledFilterQuery],
+            variable: StatementVariable,
+            select: Callable[[Statement | StatementTemplate], ClosedTerm],
+            projection: SPARQL_FilterCompiler.Projection,
+            options: TOptions,
+            limit: int
+    ) -> AsyncIterator[ClosedTerm]:
+        streams = [
+            self._abuild_filter_pages(
+                compiler, disjoint_query, binding, projection, options, limit)
+            for compiler, disjoint_query, binding in queries]
+        fixed = [
+            self._filter_uses_fixed_pages(disjoint_query)
+            for _, disjoint_query, _ in queries]
+        filter_bindings = [binding for _, _, binding in queries]
+        pushes = [compiler.build_results() for compiler, _, _ in queries]
+        counts = [0] * len(streams)
+        total_count = 0
+        pending: dict[
+            asyncio.Future[Sequence[SPARQL_Results] | None], int] = {}
+
+        async def anext_batch(i: int) -> Sequence[SPARQL_Results] | None:
+            try:
+                return await streams[i].__anext__()
+            except StopAsyncIteration:
+                return None
+
+        def submit(i: int) -> None:
+            pending[asyncio.ensure_future(anext_batch(i))] = i
+        try:
+            for i in range(len(streams)):
+                submit(i)
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    i = pending.pop(task)
+                    batch = task.result()
+                    if batch is None:
+                        continue    # done with i
+                    bindings = list(self._build_filter_result_binding_stream(
+                        batch))
+                    if not bindings:
+                        continue    # done with i
+                    for binding in itertools.chain(bindings, ({},)):
+                        thetas = pushes[i](binding)
+                        if thetas is None:
+                            continue  # push more results
+                        for theta in thetas:
+                            stmt = variable.instantiate(theta)
+                            assert isinstance(
+                                stmt, (Statement, StatementTemplate))
+                            filter_binding = filter_bindings[i]
+                            if filter_binding is not None:
+                                stmt = filter_binding.bind_term(stmt)
+                            yield select(stmt)
+                            counts[i] += 1
+                            total_count += 1
+                            assert total_count <= limit, (total_count, limit)
+                            if total_count == limit:
+                                return  # done
+                    if not fixed[i] or counts[i] % options.page_size == 0:
+                        submit(i)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for stream in streams:
+                await stream.aclose()
+
+    async def _abuild_filter_pages(
+            self,
+            compiler: SPARQL_FilterCompiler,
+            query: SPARQL_FilterCompiler.Query,
+            binding: _FilterBinding | None,
+            projection: SPARQL_FilterCompiler.Projection,
+            options: TOptions,
+            limit: int
+    ) -> AsyncGenerator[Sequence[SPARQL_Results], None]:
+        controller = self._build_filter_page_size_controller(options)
+        if self.adaptive_page_size:
+            offset = 0
+            while offset < limit:
+                n, results = await self._aselect_filter_page(
+                    controller, lambda n: self._build_filter_query_text(
+                        compiler, query, projection, options.distinct, n,
+                        offset, binding), limit - offset, options.timeout)
+                yield (results,)
+                offset += n
+                if self._count_filter_result_bindings(results) < n:
+                    break       # done
+        else:
+            stream = self._build_filter_query_stream(
+                compiler, query, binding, projection, options.distinct,
+                limit, options.page_size)
+            for batch in itertools.batched(stream, self.lookahead):
+                tasks = (
+                    asyncio.ensure_future(self.backend.aselect(
+                        q, options.timeout))
+                    for q in batch)
+                yield await asyncio.gather(*tasks)
+
+    def _compile_filter_chunks(
+            self,
+            filter: Filter,
+            options: TOptions,
+            projection: SPARQL_FilterCompiler.Projection
+    ) -> Sequence[_CompiledFilter]:
+        return [
+            self._compile_filter(chunk, options, projection)
+            for chunk in self._split_filter_values(filter, projection)]
+
+    def _split_filter_values(
+            self,
+            filter: Filter,
+            projection: SPARQL_FilterCompiler.Projection
+    ) -> Sequence[Filter]:
+        n = self._values_chunk_size
+        if n == 0:
+            return (filter,)
+        ###
+        # Split the largest disjunction of (more than n) values occurring
+        # on a projected position.
+        ###
+        best: tuple[int, OrFingerprint] | None = None
+        for i, (mask, fp) in enumerate(zip(
+                (SPARQL_FilterCompiler.Projection.SUBJECT,
+                 SPARQL_FilterCompiler.Projection.PROPERTY,
+                 SPARQL_FilterCompiler.Projection.VALUE),
+                (filter.subject, filter.property, filter.value))):
+            if (projection & mask
+                    and isinstance(fp, OrFingerprint)
+                    and len(fp.args) > n
+                    and (best is None or len(fp.args) > len(best[1].args))
+                    and all(isinstance(arg, ValueFingerprint)
+                            for arg in fp.args)):
+                best = (i, fp)
+        if best is None:
+            return (filter,)
+        i, fp = best
+        args: list[Any] = [Filter.KEEP] * 3
+        chunks = []
+        for chunk in itertools.batched(fp.args, n):
+            args[i] = OrFingerprint(*chunk)
+            chunks.append(filter.replace(*args))
+        return chunks
+
+    def _get_compiled_filter_queries(
+            self,
+            chunks: Iterable[_CompiledFilter]
+    ) -> Iterator[_CompiledFilterQuery]:
+        for compiler, _, _, binding in chunks:
+            for disjoint_query in compiler.query_stack:
+                yield compiler, disjoint_query, binding
+
     def _compile_filter(
             self,
             filter: Filter,
@@ -1012,8 +2230,7 @@ class _CoreSPARQL_Store(
                 (SPARQL_FilterCompiler.Projection.PROPERTY
                  | SPARQL_FilterCompiler.Projection.VALUE),
             }
-    ) -> tuple[
-            SPARQL_FilterCompiler, VariablePattern, StatementVariable]:
+    ) -> _CompiledFilter:
         assert projection.value != 0
         if projection in _projection_v_sv_pv:
             ###
@@ -1022,6 +2239,37 @@ class _CoreSPARQL_Store(
             ###
             assert filter.snak_mask & Filter.VALUE_SNAK
             filter = filter.replace(snak_mask=Filter.VALUE_SNAK)
+        if self._compiled_filter_cache_size == 0:
+            return (*self._compile_filter_tail(filter, options), None)
+        if getattr(self.mapping, 'class_hierarchy', None) is None:
+            filter, binding = self._FilterBinding.abstract(filter)
+        else:
+            binding = None
+        mapping_options = getattr(self.mapping, 'options', None)
+        key: _CoreSPARQL_Store._CompiledFilterKey = (
+            filter, projection, options.debug, options.omega,
+            repr(mapping_options.to_ast())
+            if mapping_options is not None else '')
+        with self._compiled_filter_cache_lock:
+            compiled = self._compiled_filter_cache.get(key)
+            if compiled is not None:
+                self._compiled_filter_cache.move_to_end(key)
+                return (*compiled, binding)
+        compiled = self._compile_filter_tail(filter, options)
+        for disjoint_query in compiled[0].query_stack:
+            self._filter_query_templates[disjoint_query] = {}
+        with self._compiled_filter_cache_lock:
+            self._compiled_filter_cache[key] = compiled
+            while len(self._compiled_filter_cache) > (
+                    self._compiled_filter_cache_size):
+                self._compiled_filter_cache.popitem(last=False)
+        return (*compiled, binding)
+
+    def _compile_filter_tail(
+            self,
+            filter: Filter,
+            options: TOptions
+    ) -> tuple[SPARQL_FilterCompiler, VariablePattern, StatementVariable]:
         compiler = SPARQL_FilterCompiler(
             filter, self.mapping, debug=options.debug, omega=options.omega)
         compiler.compile()
@@ -1033,30 +2281,106 @@ class _CoreSPARQL_Store(
             self,
             compiler: SPARQL_FilterCompiler,
             query: SPARQL_FilterCompiler.Query,
+            binding: _FilterBinding | None,
             projection: SPARQL_FilterCompiler.Projection,
             distinct: bool,
             limit: int,
             page_size: int
-    ) -> Iterator[SPARQL_FilterCompiler.Query]:
+    ) -> Iterator[str]:
         assert limit >= 0
         if limit > 0:
             page_size = min(page_size, limit)
             for offset in range(0, limit, page_size):
                 remaining = limit - offset
                 if remaining < page_size:
-                    yield compiler.build_query(
-                        query=query,
-                        projection=projection,
-                        distinct=distinct,
-                        limit=remaining,
-                        offset=offset)
+                    yield self._build_filter_query_text(
+                        compiler, query, projection, distinct,
+                        remaining, offset, binding)
                     break
-                yield compiler.build_query(
-                    query=query,
-                    projection=projection,
-                    distinct=distinct,
-                    limit=page_size,
-                    offset=offset)
+                yield self._build_filter_query_text(
+                    compiler, query, projection, distinct, page_size, offset,
+                    binding)
+
+    def _build_filter_query_text(
+            self,
+            compiler: SPARQL_FilterCompiler,
+            query: SPARQL_FilterCompiler.Query,
+            projection: SPARQL_FilterCompiler.Projection,
+            distinct: bool,
+            limit: int,
+            offset: int,
+            binding: _FilterBinding | None = None
+    ) -> str:
+        def build() -> str:
+            return self._build_filter_query_shared(
+                query, lambda: compiler.build_query(
+                    query=query, projection=projection, distinct=distinct,
+                    limit=limit, offset=offset))
+        if offset != 0:
+            ###
+            # Only first pages are prepared.
+            ###
+            text = build()
+            return text if binding is None else binding.bind_text(text)
+        return self._build_filter_query_template(
+            query, (projection, distinct, limit), binding, build)
+
+    def _build_filter_query_template(
+            self,
+            query: SPARQL_FilterCompiler.Query,
+            key: _FilterQueryTemplateKey,
+            binding: _FilterBinding | None,
+            build: Callable[[], str]
+    ) -> str:
+        ###
+        # If `query` belongs to a cached compiled filter, gets its text
+        # from the prepared template under `key`, rendering the template
+        # if it does not exist yet.  Then substitutes the constants of
+        # `binding` for their placeholders.
+        ###
+        templates = self._filter_query_templates.get(query)
+        text: str | None
+        if templates is None:
+            text = build()
+        else:
+            text = templates.get(key)
+            if text is None:
+                text = build()
+                if len(templates) < self._filter_query_templates_size:
+                    templates[key] = text
+        return text if binding is None else binding.bind_text(text)
+
+    def _build_filter_query_shared(
+            self,
+            query: SPARQL_FilterCompiler.Query,
+            build: Callable[[], Any]
+    ) -> str:
+        ###
+        # Building a query with sub-selects updates its sub-select blocks
+        # (see WikidataMapping.build_query).  So if `query` is shared,
+        # i.e., belongs to a cached compiled filter, its builds are
+        # serialized and its sub-select blocks are restored afterwards.
+        ###
+        if (query not in self._filter_query_templates
+                or not query.where.subselect_blocks):
+            return str(build())
+        with self._filter_query_templates_lock:
+            saved = [(sb, sb.query) for sb in query.where.subselect_blocks]
+            try:
+                return str(build())
+            finally:
+                for sb, q in saved:
+                    sb.query = q
+
+    def _filter_uses_fixed_pages(
+            self,
+            query: SPARQL_FilterCompiler.Query
+    ) -> bool:
+        ###
+        # Adaptive page streams stop by themselves; the pages of other
+        # streams have a fixed size and are checked by caller.
+        ###
+        return not self.adaptive_page_size
 
     def _build_filter_result_binding_stream(
             self,
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 from collections.abc import (
+    AsyncGenerator,
     AsyncIterable,
     AsyncIterator,
     Awaitable,
@@ -60,6 +61,7 @@ Location: TypeAlias = Union[Callable[..., Any], str]
 __all__ = (
     'Any',
     'assert_type',
+    'AsyncGenerator',
     'AsyncIterable',
     'AsyncIterator',
     'Awaitable',
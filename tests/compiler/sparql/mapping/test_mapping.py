@@ -3,18 +3,28 @@
 
 from __future__ import annotations
 
+from unittest import mock
+
 from kif_lib import (
+    Filter,
     Item,
     ItemVariable,
+    NoValueSnak,
     Property,
     Quantity,
     Statement,
     StatementVariable,
     Variable,
 )
-from kif_lib.compiler.sparql import SPARQL_Compiler, SPARQL_Mapping
+from kif_lib.compiler.sparql import (
+    SPARQL_Compiler,
+    SPARQL_FilterCompiler,
+    SPARQL_Mapping,
+)
+from kif_lib.compiler.sparql.mapping.wikidata import WikidataMapping
 from kif_lib.model import VStatement
 from kif_lib.typing import Any, assert_type, Callable, Iterator, Sequence
+from kif_lib.vocabulary import wd
 
 from ....tests import TestCase
 
@@ -78,6 +88,71 @@ class Test(TestCase):
         self.assertEqual(len(Empty()), 0)
         self.assertEqual(len(A()), 3)
 
+    def test_entry_index(self) -> None:
+        assert_type(A().entry_index, SPARQL_Mapping.EntryIndex)
+        a = A()
+        index = a.get_entry_index()
+        self.assertIs(index, a.entry_index)
+        self.assertIs(index, A().entry_index)
+        self.assertEqual(index.entries, tuple(a))
+        self.assertEqual(Empty().entry_index.entries, ())
+        self.assertEqual(
+            index.lookup(Property('x')(Item('y'), Item('z'))), {0, 2})
+        self.assertEqual(
+            index.lookup(Property('x')(ItemVariable('y'), Quantity(0))),
+            {1, 2})
+        self.assertEqual(
+            index.lookup(Property('y')(Item('y'), Item('z'))), {2})
+        self.assertEqual(
+            index.lookup(Variable('x')(Item('y'), Variable('z'))), {0, 1, 2})
+        self.assertEqual(
+            index.lookup(StatementVariable('x')), {0, 1, 2})
+        ###
+        # The index is a necessary condition for matching.
+        ###
+        wikidata = WikidataMapping()
+        index = wikidata.entry_index
+        self.assertEqual(len(index.entries), len(wikidata))
+        for pat in (
+                wd.instance_of(wd.Brazil, Variable('v')),
+                wd.population(ItemVariable('s'), Variable('v')),
+                wd.label(Variable('s'), Variable('v')),
+                wd.official_website(wd.Brazil, Variable('v')),
+                Variable('p')(wd.Brazil, Variable('v')),
+                Statement(Variable('s'), NoValueSnak(Variable('p'))),
+                StatementVariable('x')):
+            matches = {i for i, entry in enumerate(index.entries)
+                       if next(entry.match(pat), None) is not None}
+            self.assertLessEqual(matches, index.lookup(pat))
+        self.assertLess(
+            len(index.lookup(wd.label(Variable('s'), Variable('v')))),
+            len(index.entries))
+
+    def test_entry_index_push_patterns(self) -> None:
+        wikidata = WikidataMapping()
+        index = wikidata.entry_index
+        calls: list[tuple[SPARQL_Mapping.Entry, Any]] = []
+        match = SPARQL_Mapping.Entry.match_and_preprocess
+
+        def match_and_preprocess(entry, mapping, compiler, pat, **kwargs):
+            calls.append((entry, pat))
+            return match(entry, mapping, compiler, pat, **kwargs)
+        with mock.patch.object(
+                SPARQL_Mapping.Entry, 'match_and_preprocess',
+                autospec=True, side_effect=match_and_preprocess):
+            SPARQL_FilterCompiler(
+                Filter(wd.Brazil, wd.label).normalize(), wikidata).compile()
+        ###
+        # Only the entries given by the index for each pattern are tried,
+        # in order of priority.
+        ###
+        self.assertTrue(calls)
+        self.assertLess(len(calls), len(index.entries))
+        positions = [index.entries.index(entry) for entry, _ in calls]
+        self.assertEqual(positions, sorted(positions))
+        for entry, pat in calls:
+            self.assertIn(index.entries.index(entry), index.lookup(pat))
+
 
 if __name__ == '__main__':
     Test.main()
@@ -0,0 +1,96 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+from unittest import main, TestCase
+
+from kif_lib.compiler.sparql.results import iterparse_sparql_results
+from kif_lib.typing import Any, Iterator
+
+
+class Test(TestCase):
+
+    def chunks(self, text: str, n: int) -> Iterator[str]:
+        return (text[i:i + n] for i in range(0, len(text), n))
+
+    def parse(self, text: str, n: int) -> Any:
+        results: Any = iterparse_sparql_results(self.chunks(text, n))
+        if 'results' in results and 'bindings' in results['results']:
+            results['results']['bindings'] = list(
+                results['results']['bindings'])
+        return results
+
+    def test_iterparse_sparql_results(self) -> None:
+        def b(i: int) -> dict[str, Any]:
+            return {'x': {'type': 'uri', 'value': f'http://x.org/{i}'},
+                    'y': {'type': 'literal', 'value': f'"{i}"\n' * i}}
+        docs: list[Any] = [
+            {},
+            {'head': {}},
+            {'head': {'vars': []}, 'results': {'bindings': []}},
+            {'head': {'vars': ['x', 'y']},
+             'results': {'bindings': [b(i) for i in range(10)]}},
+            {'results': {'bindings': [b(0)], 'ordered': True},
+             'head': {'vars': ['x', 'y']}, 'n': 1234}]
+        for doc in docs:
+            for indent in (None, 2):
+                text = json.dumps(doc, indent=indent)
+                for n in (1, 3, 8, len(text)):
+                    self.assertEqual(self.parse(text, n), doc)
+
+    def test_iterparse_sparql_results_lazy(self) -> None:
+        consumed = 0
+
+        def chunks() -> Iterator[str]:
+            nonlocal consumed
+            for chunk in (
+                    '{"head": {"vars": ["x"]}, "results": {"bindings": [',
+                    '{"x": {"type": "uri", "value": "a"}}, ',
+                    '{"x": {"type": "uri", "value": "b"}}',
+                    ']}}'):
+                consumed += 1
+                yield chunk
+        results: Any = iterparse_sparql_results(chunks())
+        self.assertEqual(results['head'], {'vars': ['x']})
+        self.assertEqual(consumed, 1)
+        bindings = results['results']['bindings']
+        self.assertEqual(next(bindings), {'x': {'type': 'uri', 'value': 'a'}})
+        self.assertEqual(consumed, 2)
+        self.assertEqual(next(bindings), {'x': {'type': 'uri', 'value': 'b'}})
+        self.assertRaises(StopIteration, next, bindings)
+        self.assertEqual(consumed, 4)
+
+    def test_iterparse_sparql_results_close(self) -> None:
+        closed = 0
+
+        def chunks(*texts: str) -> Iterator[str]:
+            nonlocal closed
+            try:
+                yield from texts
+            finally:
+                closed += 1
+        iterparse_sparql_results(chunks('{"head": {}', '}'))
+        self.assertEqual(closed, 1)
+        self.assertRaises(
+            ValueError, iterparse_sparql_results, chunks('[]'))
+        self.assertEqual(closed, 2)
+        results: Any = iterparse_sparql_results(chunks(
+            '{"results": {"bindings": [{}, {}', ']}}'))
+        bindings = results['results']['bindings']
+        self.assertEqual(next(bindings), {})
+        self.assertEqual(closed, 2)
+        bindings.close()
+        self.assertEqual(closed, 3)
+
+    def test_iterparse_sparql_results_error(self) -> None:
+        self.assertRaises(ValueError, iterparse_sparql_results, [])
+        self.assertRaises(ValueError, iterparse_sparql_results, ['[]'])
+        results: Any = iterparse_sparql_results(
+            ['{"results": {"bindings": [{}, {}'])
+        self.assertRaises(ValueError, list, results['results']['bindings'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from kif_lib import Statement, Store, Text
+from kif_lib.store import CachingStore
+from kif_lib.typing import Any
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    @classmethod
+    def KB(cls, **kwargs: Any) -> CachingStore:
+        kb = Store('caching', Store(
+            'memory',
+            wd.instance_of(wd.Brazil, wd.country_),
+            wd.instance_of(wd.Argentina, wd.country_),
+            wd.label(wd.Brazil, 'Brazil'),
+            wd.label(wd.Brazil, Text('Brasil', 'pt')),
+            wd.label(wd.Argentina, 'Argentina')), **kwargs)
+        assert isinstance(kb, CachingStore)
+        return kb
+
+    def test_filter(self) -> None:
+        kb = self.KB()
+        self.assertIsInstance(kb.source, Store)
+        self.assertEqual(
+            set(kb.filter_s(value=wd.country_)), {wd.Brazil, wd.Argentina})
+        self.assertEqual(kb.statistics.misses, 1)
+        self.assertEqual(kb.statistics.size, 1)
+        kb.source.add_many([wd.instance_of(wd.Adam, wd.country_)])
+        self.assertEqual(
+            set(kb.filter_s(value=wd.country_)), {wd.Brazil, wd.Argentina})
+        self.assertEqual(kb.statistics.hits, 1)
+        ###
+        # Projection, limit, and language are part of the key.
+        ###
+        self.assertEqual(len(set(kb.filter(value=wd.country_))), 3)
+        self.assertEqual(len(list(kb.filter_s(
+            value=wd.country_, limit=1))), 1)
+        set(kb.filter_v(subject=wd.Brazil, language='pt'))
+        set(kb.filter_v(subject=wd.Brazil, language='en'))
+        self.assertEqual(kb.statistics.misses, 5)
+        ###
+        # Partially consumed results are not cached.
+        ###
+        kb.clear_cache()
+        next(kb.filter(subject=wd.Brazil))
+        self.assertEqual(kb.statistics.size, 0)
+        self.assertEqual(len(list(kb.filter(subject=wd.Brazil))), 3)
+        self.assertEqual(kb.statistics.size, 1)
+
+    def test_count_ask(self) -> None:
+        kb = self.KB()
+        self.assertEqual(kb.count(property=wd.label), 3)
+        self.assertEqual(kb.count_s(property=wd.label), 2)
+        self.assertTrue(kb.ask(subject=wd.Brazil))
+        self.assertFalse(kb.ask(subject=wd.Adam))
+        kb.source.add_many([wd.label(wd.Adam, 'Adam')])
+        self.assertEqual(kb.count(property=wd.label), 3)
+        self.assertEqual(kb.count_s(property=wd.label), 2)
+        self.assertTrue(kb.ask(subject=wd.Brazil))
+        self.assertFalse(kb.ask(subject=wd.Adam))
+        self.assertEqual(kb.statistics.hits, 4)
+        self.assertEqual(kb.statistics.misses, 4)
+
+    def test_async(self) -> None:
+        kb = self.KB()
+
+        async def afilter(**kwargs: Any) -> set[Statement]:
+            return {stmt async for stmt in kb.afilter(**kwargs)}
+        stmts = set(kb.filter(subject=wd.Brazil))
+        self.assertEqual(asyncio.run(afilter(subject=wd.Brazil)), stmts)
+        self.assertEqual(kb.statistics.hits, 1)
+        self.assertEqual(
+            asyncio.run(afilter(subject=wd.Argentina)),
+            set(kb.filter(subject=wd.Argentina)))
+        self.assertEqual(kb.statistics.hits, 2)
+        self.assertEqual(asyncio.run(kb.acount(subject=wd.Brazil)), 3)
+        self.assertTrue(asyncio.run(kb.aask(subject=wd.Brazil)))
+        self.assertEqual(kb.count(subject=wd.Brazil), 3)
+        self.assertTrue(kb.ask(subject=wd.Brazil))
+        self.assertEqual(kb.statistics.hits, 4)
+
+    def test_max_size(self) -> None:
+        kb = self.KB(max_size=2)
+        kb.count(subject=wd.Brazil)
+        kb.count(subject=wd.Argentina)
+        kb.count(subject=wd.Brazil)
+        kb.count(subject=wd.Adam)
+        self.assertEqual(kb.statistics.evictions, 1)
+        self.assertEqual(kb.statistics.size, 2)
+        kb.count(subject=wd.Brazil)
+        self.assertEqual(kb.statistics.hits, 2)
+        kb = self.KB(max_size=0)
+        kb.count(subject=wd.Brazil)
+        kb.count(subject=wd.Brazil)
+        self.assertEqual(kb.statistics.hits, 0)
+        self.assert_raises_bad_argument(
+            TypeError, None, 'max_size', 'expected int, got str',
+            CachingStore, 'caching', Store('empty'), max_size='x')
+        self.assert_raises_bad_argument(
+            ValueError, None, 'max_size', 'expected a non-negative int',
+            CachingStore, 'caching', Store('empty'), max_size=-1)
+
+    def test_ttl(self) -> None:
+        kb = self.KB(ttl=.05)
+        kb.count(subject=wd.Brazil)
+        kb.count(subject=wd.Brazil)
+        self.assertEqual(kb.statistics.hits, 1)
+        time.sleep(.1)
+        kb.count(subject=wd.Brazil)
+        self.assertEqual(kb.statistics.expirations, 1)
+        self.assertEqual(kb.statistics.misses, 2)
+        self.assert_raises_bad_argument(
+            TypeError, None, 'ttl', 'expected float or int, got str',
+            CachingStore, 'caching', Store('empty'), ttl='x')
+        self.assert_raises_bad_argument(
+            ValueError, None, 'ttl', 'expected a positive number',
+            CachingStore, 'caching', Store('empty'), ttl=0)
+
+
+if __name__ == '__main__':
+    Test.main()
@@ -3,7 +3,11 @@
 
 from __future__ import annotations
 
-from kif_lib import Store
+import asyncio
+
+from kif_lib import Statement, Store
+from kif_lib.store import Reader
+from kif_lib.typing import Any
 from kif_lib.vocabulary import wd
 
 from ...tests import StoreTestCase
@@ -19,6 +23,51 @@ class Test(StoreTestCase):
         xf(F(property=wd.mass),
            set(rdf.filter(property=wd.mass, annotated=True)))
 
+    def test_process_executor(self) -> None:
+        rdf = Store('rdf', 'tests/data/benzene.ttl')
+        kb = Store(
+            'jsonl-reader', 'tests/data/benzene.jsonl',
+            executor='process', workers=2)
+
+        async def afilter(**kwargs: Any) -> set[Statement]:
+            return {stmt async for stmt in kb.afilter(**kwargs)}
+        try:
+            xf, F = self.store_xfilter_assertion(kb)
+            xf(F(), set(rdf.filter(annotated=True)))
+            xf(F(property=wd.mass),
+               set(rdf.filter(property=wd.mass, annotated=True)))
+            self.assertEqual(
+                asyncio.run(afilter(annotated=True)),
+                set(rdf.filter(annotated=True)))
+            self.assertEqual(
+                asyncio.run(afilter(property=wd.mass)),
+                set(rdf.filter(property=wd.mass)))
+        finally:
+            kb.close()
+
+    def test_process_executor_unpicklable(self) -> None:
+        rdf = Store('rdf', 'tests/data/benzene.ttl')
+        base = Store('jsonl-reader')
+        assert isinstance(base, Reader)
+        kb = Store(
+            'jsonl-reader', 'tests/data/benzene.jsonl',
+            parse=lambda input: base._parse(input),
+            executor='process', workers=2)
+
+        async def afilter(**kwargs: Any) -> set[Statement]:
+            return {stmt async for stmt in kb.afilter(**kwargs)}
+        try:
+            ###
+            # Lambdas cannot be pickled, so threads are used instead.
+            ###
+            with self.assertLogs('kif_lib.store.reader.reader', 'WARNING'):
+                self.assertEqual(
+                    asyncio.run(afilter(property=wd.mass)),
+                    set(rdf.filter(property=wd.mass)))
+            self.assertIsNone(kb._process_pool)  # type: ignore
+        finally:
+            kb.close()
+
 
 if __name__ == '__main__':
     Test.main()
@@ -0,0 +1,79 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+
+from kif_lib import Store, Text
+from kif_lib.store import MemoryStore
+from kif_lib.typing import Any, Final, Sequence
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    _kwargs: Final[Sequence[dict[str, Any]]] = (
+        {}, {'index': False}, {'compact': True})
+
+    def test_add_many(self) -> None:
+        for kwargs in self._kwargs:
+            kb = Store('memory', **kwargs)
+            assert isinstance(kb, MemoryStore)
+            self.assert_raises_bad_argument(
+                TypeError, 1, 'stmts', 'cannot coerce int into Statement',
+                kb.add_many, [0])
+            self.assertEqual(kb.count(), 0)
+            kb.add_many([
+                wd.instance_of(wd.Brazil, wd.country_),
+                wd.label(wd.Brazil, Text('Brasil', 'pt'))])
+            self.assertEqual(kb.count(), 2)
+            self.assertEqual(kb.count(subject=wd.Brazil), 2)
+            self.assertEqual(kb.count(property=wd.label), 1)
+            self.assertEqual(kb.count(value=wd.country_), 1)
+            kb.add_many([
+                wd.instance_of(wd.Brazil, wd.country_),
+                wd.instance_of(wd.Argentina, wd.country_)])
+            self.assertEqual(kb.count(), 3)
+            self.assertEqual(
+                set(kb.filter_s(value=wd.country_)),
+                {wd.Brazil, wd.Argentina})
+            asyncio.run(kb.aadd_many([
+                wd.label(wd.Argentina, Text('Argentina', 'pt'))]))
+            self.assertEqual(
+                set(kb.filter_s(property=wd.label)),
+                {wd.Brazil, wd.Argentina})
+
+    def test_remove_many(self) -> None:
+        for kwargs in self._kwargs:
+            kb = Store(
+                'memory',
+                wd.instance_of(wd.Brazil, wd.country_),
+                wd.instance_of(wd.Argentina, wd.country_),
+                wd.label(wd.Brazil, Text('Brasil', 'pt')),
+                **kwargs)
+            assert isinstance(kb, MemoryStore)
+            self.assert_raises_bad_argument(
+                TypeError, 1, 'stmts', 'cannot coerce int into Statement',
+                kb.remove_many, [0])
+            kb.remove_many([
+                wd.instance_of(wd.Brazil, wd.country_),
+                wd.instance_of(wd.Portugal, wd.country_)])
+            self.assertEqual(kb.count(), 2)
+            self.assertEqual(
+                set(kb.filter_s(value=wd.country_)), {wd.Argentina})
+            self.assertEqual(
+                set(kb.filter(subject=wd.Brazil)),
+                {wd.label(wd.Brazil, Text('Brasil', 'pt'))})
+            it = kb.filter(value=wd.country_)
+            asyncio.run(kb.aremove_many(kb.filter()))
+            self.assertEqual(kb.count(), 0)
+            self.assertFalse(kb.ask(subject=wd.Brazil))
+            self.assertEqual(
+                list(it), [wd.instance_of(wd.Argentina, wd.country_)])
+
+
+if __name__ == '__main__':
+    Test.main()
@@ -0,0 +1,105 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from kif_lib import Filter, Preferred, Store, Text
+from kif_lib.store import MemoryStore
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    def test_annotated(self) -> None:
+        stmts = {
+            wd.instance_of(wd.Brazil, wd.country_),
+            wd.instance_of(wd.Brazil, wd.country_).annotate(),
+            wd.instance_of(wd.Brazil, wd.country_).annotate(
+                rank=Preferred),
+            wd.label(wd.Brazil, Text('Brasil', 'pt')).annotate(
+                [wd.start_time('1822-09-07')]),
+            wd.date_of_birth.some_value(wd.Adam),
+            wd.date_of_death.no_value(wd.Adam)}
+        kb = Store('memory', *stmts, compact=True)
+        assert isinstance(kb, MemoryStore)
+        self.assertEqual(set(kb._storage), stmts)
+        self.assertEqual(len(kb._storage), len(stmts))
+        self.assertEqual(
+            set(kb.filter_annotated(property=wd.instance_of)),
+            {wd.instance_of(wd.Brazil, wd.country_).annotate(),
+             wd.instance_of(wd.Brazil, wd.country_).annotate(
+                 rank=Preferred)})
+        kb.remove_many([wd.instance_of(wd.Brazil, wd.country_).annotate()])
+        self.assertEqual(len(kb._storage), len(stmts) - 1)
+        kb.add_many([wd.instance_of(wd.Brazil, wd.country_).annotate()])
+        self.assertEqual(set(kb._storage), stmts)
+
+    def test_scan(self) -> None:
+        from .test_filter import Test as TestFilter
+        kb = TestFilter.KB(compact=True)
+        assert isinstance(kb, MemoryStore)
+        assert isinstance(kb._storage, MemoryStore.CompactStorage)
+        storage, cls = kb._storage, MemoryStore.CompactStorage
+        threshold = cls.numpy_threshold
+        for filter in [
+                Filter(),
+                Filter(snak_mask=Filter.SOME_VALUE_SNAK),
+                Filter(subject_mask=Filter.LEXEME),
+                Filter(value_mask=Filter.TEXT | Filter.QUANTITY),
+                Filter(subject=wd.Brazil, value_mask=Filter.ITEM),
+        ]:
+            stmts = set(kb.filter(filter=filter))
+            try:
+                cls.numpy_threshold = 0
+                self.assertEqual(set(kb.filter(filter=filter)), stmts)
+                cls.numpy_threshold = len(storage) + 1
+                self.assertEqual(set(kb.filter(filter=filter)), stmts)
+            finally:
+                cls.numpy_threshold = threshold
+
+    def test_compaction(self) -> None:
+        stmts = [wd.instance_of(wd.Q(i), wd.human) for i in range(8)]
+        kb = Store('memory', *stmts, compact=True)
+        assert isinstance(kb, MemoryStore)
+        assert isinstance(kb._storage, MemoryStore.CompactStorage)
+        storage, cls = kb._storage, MemoryStore.CompactStorage
+        threshold = cls.compaction_threshold
+        try:
+            cls.compaction_threshold = 4
+            ###
+            # Removed rows are dropped from the indexes.
+            ###
+            kb.remove_many(stmts[:2])
+            self.assertEqual(len(storage._alive), 8)
+            self.assertNotIn(0, storage._index_get(
+                'subject', MemoryStore._index_key(wd.Q(0))))
+            self.assertEqual(
+                len(storage._index_get('property', MemoryStore._index_key(
+                    wd.instance_of))), 6)
+            ###
+            # Snapshots are not affected by compaction.
+            ###
+            it = iter(kb.filter(property=wd.instance_of))
+            first = next(it)
+            ###
+            # Remove-add cycles do not grow the storage.
+            ###
+            for _ in range(10):
+                kb.remove_many(stmts[2:])
+                kb.add_many(stmts[2:])
+                self.assertLessEqual(len(storage._alive), 12)
+            self.assertEqual(
+                {first, *it}, set(stmts[2:]))
+            self.assertEqual(set(kb.filter()), set(stmts[2:]))
+            self.assertEqual(set(storage), set(stmts[2:]))
+            self.assertEqual(kb.count(property=wd.instance_of), 6)
+            kb.add_many(stmts[:2])
+            self.assertEqual(set(kb.filter(value=wd.human)), set(stmts))
+        finally:
+            cls.compaction_threshold = threshold
+
+
+if __name__ == '__main__':
+    Test.main()
@@ -0,0 +1,110 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from unittest import mock
+
+from kif_lib import Property, Statement, Store, String, ValueSnak
+from kif_lib.store import MemoryStore
+from kif_lib.typing import Any
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    @classmethod
+    def KB(cls, **kwargs: Any) -> Store:
+        from .test_filter import Test as TestFilter
+        return TestFilter.KB(**kwargs)
+
+    def test_count(self) -> None:
+        for kb in (
+                self.KB(), self.KB(index=False), self.KB(compact=True)):
+            c, cs, cp, cv, csp, csv, cpv, F = (
+                self.store_count_assertion_with_projection(kb))
+            c(43, F())
+            cs(6, F())
+            cp(18, F())
+            cv(40, F())
+            csp(30, F())
+            csv(40, F())
+            cpv(40, F())
+            c(10, F(subject=wd.Brazil))
+            cs(1, F(subject=wd.Brazil))
+            cp(7, F(subject=wd.Brazil))
+            csp(7, F(subject=wd.Brazil))
+            c(9, F(property=wd.label))
+            cs(5, F(property=wd.label))
+            cp(1, F(property=wd.label))
+            c(1, F(property=wd.instance_of, value=wd.country_))
+            c(3, F(snak_mask=F.SOME_VALUE_SNAK | F.NO_VALUE_SNAK))
+            cp(3, F(snak_mask=F.SOME_VALUE_SNAK | F.NO_VALUE_SNAK))
+            cv(0, F(snak_mask=F.SOME_VALUE_SNAK | F.NO_VALUE_SNAK))
+            c(32, F(value_mask=F.TEXT))
+            cv(29, F(value_mask=F.TEXT))
+            csp(19, F(value_mask=F.TEXT))
+
+    def test_count_native(self) -> None:
+        for kb in (self.KB(), self.KB(compact=True)):
+            mem = kb
+            assert isinstance(mem, MemoryStore)
+            x = wd.Q(123456)
+            c, cs, cp, cv, _, _, _, F = (
+                self.store_count_assertion_with_projection(kb))
+            a, _ = self.store_ask_assertion(kb)
+            ###
+            # Single-pattern counts do not scan the storage.
+            ###
+            with mock.patch.object(
+                    type(mem._storage), 'partition',
+                    side_effect=AssertionError):
+                c(43, F())
+                c(10, F(subject=wd.Brazil))
+                cs(1, F(subject=wd.Brazil))
+                c(9, F(property=wd.label))
+                cp(1, F(property=wd.label))
+                cv(1, F(value=wd.Latin_America))
+                a(True, F(subject=wd.Brazil))
+                a(False, F(subject=x, annotated=True))
+            ###
+            # Claim counts follow additions and removals, and count claims
+            # (not statements).
+            ###
+            stmt = wd.instance_of(x, wd.human)
+            n = kb.count(property=wd.instance_of)
+            mem.add_many([stmt, stmt.annotate(), stmt.annotate(
+                [wd.start_time('2025-01-01')])])
+            c(n + 1, F(property=wd.instance_of))
+            a(True, F(subject=x))
+            mem.remove_many([stmt, stmt.annotate()])
+            c(n + 1, F(property=wd.instance_of))
+            mem.remove_many([stmt.annotate([wd.start_time('2025-01-01')])])
+            c(n, F(property=wd.instance_of))
+            a(False, F(subject=x))
+            ###
+            # Properties are counted with and without their range.
+            ###
+            P31 = Property(wd.instance_of.iri)
+            mem.add_many([Statement(x, ValueSnak(P31, String('x')))])
+            c(n + 1, F(property=P31))
+            cp(2, F(property=P31))
+            c(n, F(property=wd.instance_of))
+            cp(1, F(property=wd.instance_of))
+
+    def test_ask(self) -> None:
+        for kb in (
+                self.KB(), self.KB(index=False), self.KB(compact=True)):
+            a, F = self.store_ask_assertion(kb)
+            a(True, F())
+            a(True, F(subject=wd.Brazil))
+            a(True, F(subject=wd.Brazil, value=wd.Latin_America))
+            a(False, F(subject=wd.Adam, value=wd.Latin_America))
+            a(True, F(snak_mask=F.NO_VALUE_SNAK))
+            a(False, F(subject=wd.benzene, snak_mask=F.NO_VALUE_SNAK))
+
+
+if __name__ == '__main__':
+    Test.main()
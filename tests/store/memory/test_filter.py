@@ -3,7 +3,22 @@
 
 from __future__ import annotations
 
-from kif_lib import Preferred, Statement, Store, Text, Time
+import asyncio
+import functools
+
+from kif_lib import (
+    ExternalId,
+    Filter,
+    itertools,
+    Preferred,
+    Quantity,
+    Statement,
+    Store,
+    Text,
+    Time,
+)
+from kif_lib.store import MemoryStore
+from kif_lib.typing import Any, Iterator, Sequence
 from kif_lib.vocabulary import wd
 
 from ...tests import StoreTestCase
@@ -14,7 +29,7 @@ class Test(StoreTestCase):
     _stmts: set[Statement] | None = None
 
     @classmethod
-    def KB(cls) -> Store:
+    def KB(cls, **kwargs: Any) -> Store:
         if cls._stmts is None:
             cls._stmts = set(cls.S(
                 'wikidata-rdf',
@@ -23,7 +38,7 @@ class Test(StoreTestCase):
                 'tests/data/benzene.ttl',
                 'tests/data/brazil.ttl'))
         assert cls._stmts is not None
-        return cls.S('memory', *cls._stmts)
+        return cls.S('memory', *cls._stmts, **kwargs)
 
     def test_empty(self) -> None:
         xf, F = self.store_xfilter_assertion(self.KB())
@@ -73,6 +88,137 @@ class Test(StoreTestCase):
             wd.family_name.some_value(wd.Adam),
             wd.father.no_value(wd.Adam)})
 
+    # -- index --
+
+    def test_index(self) -> None:
+        kb, kb_noindex, kb_compact = (
+            self.KB(), self.KB(index=False), self.KB(compact=True))
+        for filter in [
+                Filter(),
+                Filter(subject=wd.Brazil),
+                Filter(subject=wd.Brazil | wd.Adam),
+                Filter(subject=wd.Brazil, property=wd.label),
+                Filter(property=wd.instance_of),
+                Filter(property=wd.instance_of, value=wd.country_),
+                Filter(
+                    property=wd.label | wd.alias,
+                    value=Text('Brasil', 'pt')),
+                Filter(value=wd.Latin_America),
+                Filter(value=wd.Latin_America | wd.verb),
+                Filter(value=ExternalId('UHOVQNZJYSORNB-UHFFFAOYSA-N')),
+                Filter(value=Quantity('78.046950192', wd.dalton)),
+                Filter(value=Time('1822-09-07')),
+                Filter(subject=wd.Brazil, value=wd.Adam),
+                Filter(subject=wd.Brazil & wd.official_name(
+                    Text('República Federativa do Brasil', 'pt'))),
+        ]:
+            for annotated in (False, True):
+                f = filter.replace(annotated=annotated)
+                self.assertEqual(
+                    set(kb.filter(filter=f)),
+                    set(kb_noindex.filter(filter=f)), f)
+                self.assertEqual(
+                    set(kb.filter(filter=f)),
+                    set(kb_compact.filter(filter=f)), f)
+        self.assertTrue(kb.ask(value=wd.Latin_America))
+        self.assertFalse(kb.ask(subject=wd.Adam, value=wd.Latin_America))
+
+    # -- join --
+
+    def test_join(self) -> None:
+        stmts = [
+            wd.country(wd.Brazil, wd.Brazil),
+            wd.country(wd.Rio_de_Janeiro, wd.Brazil),
+            wd.country(wd.Argentina, wd.Argentina),
+            wd.instance_of(wd.Brazil, wd.country_),
+            wd.instance_of(wd.Argentina, wd.country_),
+            wd.continent(wd.Brazil, wd.South_America),
+            wd.label(wd.Brazil, 'Brazil'),
+            wd.label(wd.Argentina, 'Argentina'),
+            wd.label(wd.Rio_de_Janeiro, 'Rio de Janeiro'),
+            wd.date_of_birth.some_value(wd.Adam)]
+        for kwargs in ({}, {'index': False}, {'compact': True}):
+            kb = self.S('memory', *stmts, **kwargs)
+            xf, F = self.store_xfilter_assertion(kb)
+            xf(F(subject=wd.country(wd.Brazil), property=wd.label),
+               {wd.label(wd.Brazil, 'Brazil'),
+                wd.label(wd.Rio_de_Janeiro, 'Rio de Janeiro')})
+            xf(F(subject=wd.country(wd.Brazil) & wd.instance_of(
+                wd.country_), property=wd.label),
+               {wd.label(wd.Brazil, 'Brazil')})
+            xf(F(subject=wd.Argentina | wd.continent(
+                wd.South_America), property=wd.label),
+               {wd.label(wd.Brazil, 'Brazil'),
+                wd.label(wd.Argentina, 'Argentina')})
+            xf(F(subject=wd.date_of_birth.some_value()),
+               {wd.date_of_birth.some_value(wd.Adam)})
+            xf(F(subject=wd.country(wd.Adam)), ())
+            xf(F(subject=wd.Adam & wd.date_of_birth.some_value()),
+               {wd.date_of_birth.some_value(wd.Adam)})
+            xf(F(property=wd.label, value=Text('Brazil') & wd.country(
+                wd.Brazil)), ())
+            ###
+            # Converse-snak fingerprints.
+            ###
+            xf(F(subject=-wd.country(wd.Rio_de_Janeiro),
+                 property=wd.instance_of),
+               {wd.instance_of(wd.Brazil, wd.country_)})
+            xf(F(property=wd.country, value=-wd.country(
+                wd.Rio_de_Janeiro)),
+               {wd.country(wd.Brazil, wd.Brazil),
+                wd.country(wd.Rio_de_Janeiro, wd.Brazil)})
+            ###
+            # Path fingerprints.
+            ###
+            xf(F(subject=(wd.country / wd.continent)(wd.South_America),
+                 property=wd.label),
+               {wd.label(wd.Brazil, 'Brazil'),
+                wd.label(wd.Rio_de_Janeiro, 'Rio de Janeiro')})
+            xf(F(subject=(wd.country / wd.instance_of)(wd.country_),
+                 property=wd.label),
+               {wd.label(wd.Brazil, 'Brazil'),
+                wd.label(wd.Argentina, 'Argentina'),
+                wd.label(wd.Rio_de_Janeiro, 'Rio de Janeiro')})
+            xf(F(subject=(wd.country / wd.country / wd.continent)(
+                wd.South_America), property=wd.country),
+               {wd.country(wd.Brazil, wd.Brazil),
+                wd.country(wd.Rio_de_Janeiro, wd.Brazil)})
+            xf(F(subject=(wd.continent / wd.country)(wd.Brazil)), ())
+            self.assertEqual(kb.count(subject=wd.country(wd.Brazil)), 6)
+            self.assertTrue(kb.ask(
+                subject=wd.country(wd.Argentina), property=wd.label))
+            self.assertFalse(kb.ask(
+                subject=wd.country(wd.Argentina),
+                property=wd.continent))
+
+    # -- async --
+
+    def test_afilter_limit(self) -> None:
+        stmts = [wd.label(wd.Q(i), str(i)) for i in range(1, 1001)]
+        kb = self.S('memory', *stmts, page_size=10, lookahead=2)
+        assert isinstance(kb, MemoryStore)
+
+        async def afilter(limit: int) -> list[Statement]:
+            return [stmt async for stmt in kb.afilter(limit=limit)]
+        self.assertEqual(len(asyncio.run(afilter(5))), 5)
+        self.assertEqual(set(asyncio.run(afilter(2000))), set(stmts))
+        pulled = 0
+
+        def batches() -> Iterator[Sequence[Statement]]:
+            nonlocal pulled
+            for batch in itertools.batched(stmts, 10):
+                pulled += 1
+                yield batch
+
+        async def first() -> Statement:
+            it = kb._afilter_helper(map(lambda batch: functools.partial(
+                kb._worker_filter, Filter(), batch), batches()), 2)
+            stmt = await it.__anext__()
+            await it.aclose()
+            return stmt
+        self.assertIn(asyncio.run(first()), stmts)
+        self.assertLessEqual(pulled, 3)
+
 
 if __name__ == '__main__':
     Test.main()
@@ -0,0 +1,121 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import tempfile
+
+from kif_lib import ExternalId, Filter, Statement, Store, Text
+from kif_lib.store import MemoryStore
+from kif_lib.typing import Any
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    def test_save_open(self) -> None:
+        from .test_filter import Test as TestFilter
+        kb = TestFilter.KB()
+        assert isinstance(kb, MemoryStore)
+        with tempfile.TemporaryDirectory() as dir:
+            path = pathlib.Path(dir) / 'kb.snapshot'
+            kb.save(path)
+            for mmap in (True, False):
+                other = MemoryStore.open(path, mmap=mmap)
+                self.assertIsInstance(
+                    other._storage, MemoryStore.MappedStorage)
+                for filter in [
+                        Filter(),
+                        Filter(subject=wd.Brazil),
+                        Filter(property=wd.label | wd.alias),
+                        Filter(value=wd.Latin_America),
+                        Filter(value=ExternalId(
+                            'UHOVQNZJYSORNB-UHFFFAOYSA-N')),
+                        Filter(value_mask=Filter.TEXT),
+                ]:
+                    for annotated in (False, True):
+                        f = filter.replace(annotated=annotated)
+                        self.assertEqual(
+                            set(other.filter(filter=f)),
+                            set(kb.filter(filter=f)), f)
+                self.assertEqual(other.count(), kb.count())
+                self.assertEqual(other.count_p(), kb.count_p())
+                self.assertTrue(other.ask(subject=wd.Brazil))
+            ###
+            # Snapshots of snapshots.
+            ###
+            other = MemoryStore.open(path)
+            other.save(pathlib.Path(dir) / 'copy.snapshot')
+            self.assertEqual(
+                (pathlib.Path(dir) / 'copy.snapshot').read_bytes(),
+                path.read_bytes())
+
+    def test_copy_on_write(self) -> None:
+        kb = Store(
+            'memory',
+            wd.instance_of(wd.Brazil, wd.country_),
+            wd.label(wd.Brazil, Text('Brasil', 'pt')))
+        assert isinstance(kb, MemoryStore)
+        with tempfile.TemporaryDirectory() as dir:
+            path = pathlib.Path(dir) / 'kb.snapshot'
+            kb.save(path)
+            other = MemoryStore.open(path)
+            it = other.filter(subject=wd.Brazil)
+            other.add_many([wd.instance_of(wd.Argentina, wd.country_)])
+            other.remove_many([wd.instance_of(wd.Brazil, wd.country_)])
+            self.assertIsInstance(other._storage, MemoryStore.CompactStorage)
+            self.assertNotIsInstance(
+                other._storage, MemoryStore.MappedStorage)
+            self.assertEqual(
+                set(other.filter_s(value=wd.country_)), {wd.Argentina})
+            self.assertEqual(len(set(it)), 2)
+            other.save(path)
+            self.assertEqual(
+                set(MemoryStore.open(path).filter()),
+                set(other.filter()))
+
+    def test_process_executor(self) -> None:
+        stmts = [wd.label(wd.Q(i), str(i)) for i in range(1, 101)]
+        kb = Store(
+            'memory', *stmts, executor='process', workers=2, page_size=10)
+
+        async def afilter(kb: Store, **kwargs: Any) -> set[Statement]:
+            return {stmt async for stmt in kb.afilter(**kwargs)}
+        try:
+            self.assertEqual(asyncio.run(afilter(kb)), set(stmts))
+            with tempfile.TemporaryDirectory() as dir:
+                path = pathlib.Path(dir) / 'kb.snapshot'
+                kb.save(path)
+                other = MemoryStore.open(
+                    path, executor='process', workers=2, page_size=10)
+                try:
+                    self.assertEqual(
+                        asyncio.run(afilter(other)), set(stmts))
+                    self.assertEqual(
+                        asyncio.run(afilter(other, subject=wd.Q(7))),
+                        {wd.label(wd.Q(7), '7')})
+                    self.assertEqual(
+                        asyncio.run(afilter(
+                            other, subject=wd.Q(7), annotated=True)),
+                        {wd.label(wd.Q(7), '7').annotate()})
+                finally:
+                    other.close()
+        finally:
+            kb.close()
+        self.assert_raises_bad_argument(
+            ValueError, None, 'executor', "expected 'thread' or 'process'",
+            MemoryStore, 'memory', executor='fork')
+
+    def test_bad_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as dir:
+            path = pathlib.Path(dir) / 'kb.snapshot'
+            path.write_bytes(b'x' * 64)
+            self.assertRaises(ValueError, MemoryStore.open, path)
+
+
+if __name__ == '__main__':
+    Test.main()
@@ -0,0 +1,100 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+
+import httpx
+
+from kif_lib import Graph, Statement
+from kif_lib.store import HttpxSPARQL_Store, RDFLibSPARQL_Store
+from kif_lib.typing import Any
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    graph = Graph(*(wd.instance_of(wd.Q(i), wd.human) for i in range(10)))
+
+    def source(self) -> RDFLibSPARQL_Store:
+        return self.sparql_local_store(self.graph)
+
+    def store(
+            self,
+            max_limit: int | None = None,
+            **kwargs: Any
+    ) -> tuple[HttpxSPARQL_Store, list[int]]:
+        lock = threading.Lock()
+        limits: list[int] = []
+
+        def handler(request: httpx.Request, results: Any) -> httpx.Response:
+            m = re.search(r'LIMIT (\d+)', request.content.decode('utf-8'))
+            limit = int(m.group(1)) if m else 0
+            with lock:
+                limits.append(limit)
+            if max_limit is not None and limit > max_limit:
+                return httpx.Response(504)
+            return httpx.Response(200, json=results)
+        kb, _ = self.sparql_mock_store(self.graph, handler, **kwargs)
+        return kb, limits
+
+    def test_init(self) -> None:
+        kb, _ = self.store()
+        self.assertFalse(kb.adaptive_page_size)
+        kb, _ = self.store(adaptive_page_size=True)
+        self.assertTrue(kb.adaptive_page_size)
+        kb.adaptive_page_size = None
+        self.assertFalse(kb.adaptive_page_size)
+
+    def test_controller(self) -> None:
+        Controller = HttpxSPARQL_Store.PageSizeController
+        c = Controller(1, 4)
+        c.update(1, 0.)
+        self.assertEqual(c.page_size, 2)
+        c.update(1, 0.)         # short page
+        self.assertEqual(c.page_size, 2)
+        c.update(2, 0.)
+        c.update(4, 0.)
+        self.assertEqual(c.page_size, 4)
+        c.update(4, Controller.SLOW + 1)
+        self.assertEqual(c.page_size, 2)
+        self.assertTrue(c.shrink())
+        self.assertEqual(c.page_size, 1)
+        self.assertFalse(c.shrink())
+        c = Controller(2, 4, False)
+        c.update(2, 0.)
+        self.assertEqual(c.page_size, 2)
+        self.assertFalse(c.shrink())
+
+    def test_grow(self) -> None:
+        stmts = set(self.source().filter(value=wd.human))
+        self.assertEqual(len(stmts), 10)
+        kb, limits = self.store(adaptive_page_size=True)
+        with kb(page_size=1):
+            self.assertEqual(set(kb.filter(value=wd.human)), stmts)
+        self.assertEqual(limits[:4], [1, 2, 4, 8])
+
+    def test_split_on_timeout(self) -> None:
+        stmts = set(self.source().filter(value=wd.human))
+        kb, limits = self.store(max_limit=2)
+        with kb(page_size=8):
+            self.assertRaises(
+                httpx.HTTPStatusError, list, kb.filter(value=wd.human))
+
+        async def afilter() -> list[Statement]:
+            return [stmt async for stmt in kb.afilter(value=wd.human)]
+        kb, limits = self.store(max_limit=2, adaptive_page_size=True)
+        with kb(page_size=8):
+            self.assertEqual(set(kb.filter(value=wd.human)), stmts)
+            self.assertIn(8, limits)
+            self.assertIn(2, limits)
+            self.assertEqual(set(asyncio.run(afilter())), stmts)
+
+
+if __name__ == '__main__':
+    Test.main()
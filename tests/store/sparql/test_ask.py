@@ -0,0 +1,88 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import httpx
+
+from kif_lib import Filter, Graph
+from kif_lib.typing import Any
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    graph = Graph(
+        wd.instance_of(wd.Brazil, wd.country_),
+        wd.label(wd.Brazil, 'Brazil'))
+
+    def test_short_circuit(self) -> None:
+        release = threading.Event()
+
+        def handler(request: httpx.Request, results: Any) -> httpx.Response:
+            if not results.get('boolean'):
+                release.wait(10)  # negative branches are slow
+            return httpx.Response(200, json=results)
+
+        async def ahandler(
+                request: httpx.Request,
+                results: Any
+        ) -> httpx.Response:
+            if not results.get('boolean'):
+                await asyncio.sleep(10)  # negative branches are slow
+            return httpx.Response(200, json=results)
+        kb, source = self.sparql_mock_store(self.graph, handler, ahandler)
+        with source() as options:
+            self.assertGreater(len(list(
+                source._build_ask_query_stream_from_filter(
+                    source._check_filter(filter=Filter(wd.Brazil)),
+                    options))), 1)
+        ###
+        # Ask returns as soon as one of the disjoint queries succeeds.
+        ###
+        start = time.monotonic()
+        self.assertTrue(kb.ask(wd.Brazil))
+        self.assertTrue(asyncio.run(kb.aask(wd.Brazil)))
+        self.assertLess(time.monotonic() - start, 5)
+        release.set()
+        self.assertFalse(kb.ask(wd.Argentina))
+        self.assertFalse(kb.ask(wd.Brazil, value=wd.human))
+        ###
+        # The disjoint queries run in the thread pool of store.
+        ###
+        pool = kb._thread_pool
+        self.assertIsNotNone(pool)
+        self.assertTrue(kb.ask(wd.Brazil))
+        self.assertIs(kb._thread_pool, pool)
+
+    def test_failure(self) -> None:
+        def handler(request: httpx.Request, results: Any) -> httpx.Response:
+            if not results.get('boolean'):
+                return httpx.Response(500)  # negative branches fail
+            return httpx.Response(200, json=results)
+
+        async def ahandler(
+                request: httpx.Request,
+                results: Any
+        ) -> httpx.Response:
+            return handler(request, results)
+        kb, _ = self.sparql_mock_store(self.graph, handler, ahandler)
+        ###
+        # Failures are raised only if no disjoint query succeeds.
+        ###
+        for _ in range(5):
+            self.assertTrue(kb.ask(wd.Brazil))
+            self.assertTrue(asyncio.run(kb.aask(wd.Brazil)))
+        self.assertRaises(httpx.HTTPStatusError, kb.ask, wd.Argentina)
+        self.assertRaises(
+            httpx.HTTPStatusError, asyncio.run, kb.aask(wd.Argentina))
+
+
+if __name__ == '__main__':
+    Test.main()
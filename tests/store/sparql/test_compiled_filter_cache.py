@@ -0,0 +1,207 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+
+from kif_lib import Filter, Graph, Store, Text
+from kif_lib.compiler.sparql import SPARQL_FilterCompiler
+from kif_lib.compiler.sparql.mapping.wikidata import WikidataMapping
+from kif_lib.store import MixerStore, RDFLibSPARQL_Store
+from kif_lib.typing import Any
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    graph = Graph(
+        *(wd.instance_of(wd.Q(i), wd.human) for i in range(5)),
+        wd.instance_of(wd.Q(11), wd.country_),
+        wd.subclass_of(wd.Q(12), wd.human),
+        *(wd.alias(wd.Brazil, Text(f'B{i}', 'pt')) for i in range(3)),
+        wd.label(wd.Brazil, 'Brazil'),
+        wd.label(wd.Q(11), 'Q11'),
+        wd.country(wd.Q(1), wd.Brazil),
+        wd.country(wd.Q(2), wd.Q(11)))
+
+    filters = (
+        Filter(value=wd.human),
+        Filter(value=wd.country_),
+        Filter(wd.Brazil),
+        Filter(wd.Q(11)),
+        Filter(wd.Brazil, annotated=True),
+        Filter(wd.Q(1) | wd.Q(2), wd.country))
+
+    def source(self, **kwargs: Any) -> RDFLibSPARQL_Store:
+        kb = Store('wikidata-rdf', graph=self.graph, **kwargs)
+        assert isinstance(kb, MixerStore)
+        src = next(iter(kb.sources))
+        assert isinstance(src, RDFLibSPARQL_Store)
+        return src
+
+    def test_init(self) -> None:
+        self.assertEqual(self.source().compiled_filter_cache_size, 0)
+        kb = self.source(compiled_filter_cache_size=8)
+        self.assertEqual(kb.compiled_filter_cache_size, 8)
+        kb.compiled_filter_cache_size = None
+        self.assertEqual(kb.compiled_filter_cache_size, 0)
+        self.assertRaises(
+            TypeError, kb.set_compiled_filter_cache_size, 'abc')
+
+    def test_cache(self) -> None:
+        kb = self.source(compiled_filter_cache_size=2)
+        with mock.patch.object(
+                type(kb), '_compile_filter_tail',
+                autospec=True,
+                side_effect=type(kb)._compile_filter_tail) as tail:
+            for _ in range(3):
+                self.assertEqual(kb.count(value=wd.human), 6)
+                self.assertTrue(kb.ask(value=wd.human))
+            self.assertEqual(tail.call_count, 1)
+            ###
+            # Filters differing only in an item constant have the same
+            # shape and are compiled once.
+            ###
+            self.assertEqual(kb.count(value=wd.country_), 1)
+            self.assertEqual(kb.count(value=wd.Q(13)), 0)
+            self.assertEqual(tail.call_count, 1)
+            ###
+            # Property constants are part of the shape.
+            ###
+            self.assertEqual(kb.count(wd.Q(12), wd.subclass_of), 1)
+            self.assertEqual(tail.call_count, 2)
+            for filter in self.filters:
+                list(kb.filter(filter=filter))
+            self.assertEqual(len(kb._compiled_filter_cache), 2)
+            kb.compiled_filter_cache_size = 1
+            self.assertEqual(len(kb._compiled_filter_cache), 1)
+            kb.clear_compiled_filter_cache()
+            self.assertEqual(len(kb._compiled_filter_cache), 0)
+
+    def test_filter(self) -> None:
+        seq = self.source()
+        kb = self.source(compiled_filter_cache_size=8)
+        for filter in self.filters:
+            stmts = set(seq.filter(filter=filter))
+            self.assertTrue(stmts)
+            for _ in range(2):
+                with kb(page_size=2):
+                    self.assertEqual(set(kb.filter(filter=filter)), stmts)
+                    self.assertEqual(
+                        kb.count(filter=filter), seq.count(filter=filter))
+                    if not filter.annotated:
+                        self.assertTrue(kb.ask(filter=filter))
+
+    def test_afilter(self) -> None:
+        seq = self.source()
+        kb = self.source(compiled_filter_cache_size=8, concurrent=True)
+
+        async def afilter(filter: Filter) -> set[Any]:
+            return {stmt async for stmt in kb.afilter(filter=filter)}
+        for filter in self.filters:
+            self.assertEqual(
+                asyncio.run(afilter(filter)),
+                set(seq.filter(filter=filter)))
+
+    def test_shape(self) -> None:
+        kb = self.source(compiled_filter_cache_size=8)
+        projection = SPARQL_FilterCompiler.Projection.ALL
+        with kb() as options:
+            compiler, _, _, binding = kb._compile_filter(
+                Filter(wd.Brazil), options, projection)
+            other, _, _, other_binding = kb._compile_filter(
+                Filter(wd.Q(11)), options, projection)
+            self.assertIs(other, compiler)
+            assert binding is not None
+            assert other_binding is not None
+            self.assertEqual(set(binding.values.values()), {wd.Brazil})
+            self.assertEqual(set(other_binding.values.values()), {wd.Q(11)})
+            compiler, _, _, _ = kb._compile_filter(
+                Filter(subject=wd.country(wd.Brazil)), options, projection)
+            self.assertIs(kb._compile_filter(
+                Filter(subject=wd.country(wd.Q(11))), options,
+                projection)[0], compiler)
+            ###
+            # Constants whose IRIs do not end in a number are part of the
+            # shape.
+            ###
+            _, _, _, binding = kb._compile_filter(
+                Filter(wd.Q(0)), options, projection)
+            self.assertIsNone(binding)
+        self.assertEqual(
+            set(kb.filter_s(subject=wd.country(wd.Q(11)))), {wd.Q(2)})
+        ###
+        # Constants are not abstracted if the mapping has a class
+        # hierarchy cache.
+        ###
+        h = WikidataMapping.ClassHierarchy.from_edges(
+            [(wd.Q(12).iri.content, wd.human.iri.content)])
+        kb = self.source(compiled_filter_cache_size=8, class_hierarchy=h)
+        with kb() as options:
+            _, _, _, binding = kb._compile_filter(
+                Filter(value=wd.human), options, projection)
+            self.assertIsNone(binding)
+        self.assertEqual(kb.count(value=wd.human), 6)
+        self.assertEqual(kb.count(value=wd.country_), 1)
+
+    def test_templates(self) -> None:
+        kb = self.source(compiled_filter_cache_size=8)
+        projection = SPARQL_FilterCompiler.Projection.ALL
+        with kb() as options:
+            for filter in self.filters:
+                compiler, _, _, binding = kb._compile_filter(
+                    filter, options, projection)
+                self.assertIs(kb._compile_filter(
+                    filter, options, projection)[0], compiler)
+                for query in compiler.query_stack:
+                    ask = (None if query.where.subselect_blocks
+                           else str(query.ask()))
+                    for limit, offset in ((2, 0), (2, 2), (1, 5)):
+                        text = kb._build_filter_query_text(
+                            compiler, query, projection, True, limit, offset,
+                            binding)
+                        expected = str(compiler.build_query(
+                            query=query, projection=projection,
+                            distinct=True, limit=limit, offset=offset))
+                        if binding is not None:
+                            self.assertNotEqual(text, expected)
+                            expected = binding.bind_text(expected)
+                        self.assertEqual(text, expected)
+                        self.assertIsNone(
+                            kb._FilterBinding._re_number.search(text))
+                        ###
+                        # Preparing leaves the cached query untouched.
+                        ###
+                        kb._build_filter_query_text(
+                            compiler, query, projection, True, 3, 0)
+                        self.assertEqual(text, kb._build_filter_query_text(
+                            compiler, query, projection, True, limit, offset,
+                            binding))
+                    ###
+                    # Only first pages are prepared.
+                    ###
+                    keys = kb._filter_query_templates[query]
+                    self.assertIn((projection, True, 2), keys)
+                    self.assertIn((projection, True, 3), keys)
+                    self.assertNotIn((projection, True, 1), keys)
+                    ###
+                    # Count queries use a fixed variable and are prepared.
+                    ###
+                    count = kb._build_count_query_text(
+                        compiler, query, projection, binding)
+                    self.assertIn('(COUNT(*) AS ?_count)', count)
+                    self.assertEqual(kb._build_count_query_text(
+                        compiler, query, projection, binding), count)
+                    self.assertIn(
+                        (projection, True, None),
+                        kb._filter_query_templates[query])
+                    if ask is not None:
+                        self.assertEqual(str(query.ask()), ask)
+
+
+if __name__ == '__main__':
+    Test.main()
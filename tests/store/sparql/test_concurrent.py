@@ -0,0 +1,177 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest import mock
+
+import httpx
+
+from kif_lib import Filter, Graph, Statement, Store, Term, Text
+from kif_lib.store import RDFLibSPARQL_Store
+from kif_lib.typing import Any, AsyncIterator, Iterator
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    graph = Graph(
+        wd.instance_of(wd.Brazil, wd.country_),
+        wd.instance_of(wd.Argentina, wd.country_),
+        wd.instance_of(wd.Adam, wd.human),
+        wd.label(wd.Brazil, 'Brazil'),
+        wd.label(wd.Brazil, Text('Brasil', 'pt')),
+        wd.label(wd.Argentina, 'Argentina'),
+        wd.alias(wd.Brazil, 'Brasil'),
+        wd.description(wd.Brazil, 'country in South America'))
+
+    filters = [
+        Filter(wd.Brazil),
+        Filter(value=wd.country_),
+        Filter(value='Brasil'),
+        Filter(snak_mask=Filter.VALUE_SNAK),
+        Filter(wd.Q(1))]
+
+    def source(self, **kwargs: Any) -> RDFLibSPARQL_Store:
+        return self.sparql_local_store(self.graph, **kwargs)
+
+    def test_init(self) -> None:
+        self.assertFalse(self.source().concurrent)
+        kb = self.source(concurrent=True)
+        self.assertTrue(kb.concurrent)
+        kb.concurrent = None
+        self.assertFalse(kb.concurrent)
+
+    def test_filter_count(self) -> None:
+        seq, con = self.source(), self.source(concurrent=True)
+
+        async def afilter(kb: Store, filter: Filter) -> set[Term]:
+            return {t async for t in kb.afilter(filter=filter)}
+        for filter in self.filters:
+            stmts = set(seq.filter(filter=filter))
+            self.assertEqual(set(con.filter(filter=filter)), stmts)
+            self.assertEqual(asyncio.run(afilter(con, filter)), stmts)
+            self.assertEqual(
+                con.count(filter=filter), seq.count(filter=filter))
+            with con(page_size=1):
+                self.assertEqual(set(con.filter(filter=filter)), stmts)
+            with con(limit=2):
+                self.assertEqual(
+                    len(set(con.filter(filter=filter))), min(2, len(stmts)))
+
+    def test_slowest_branch(self) -> None:
+        source = self.source()
+        with source() as options:
+            self.assertGreater(len(list(
+                source._build_ask_query_stream_from_filter(
+                    source._check_filter(filter=Filter(wd.Brazil)),
+                    options))), 1)
+        ###
+        # Each request waits (up to a timeout) until another request is in
+        # flight; the maximum number of requests in flight shows whether
+        # the disjoint queries overlap.
+        ###
+        cond = threading.Condition()
+        in_flight, max_in_flight = 0, 0
+
+        def handler(request: httpx.Request, results: Any) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            with cond:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                cond.notify_all()
+                cond.wait_for(lambda: max_in_flight > 1, 5)
+                in_flight -= 1
+            return httpx.Response(200, json=results)
+
+        async def ahandler(
+                request: httpx.Request,
+                results: Any
+        ) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            for _ in range(500):
+                if max_in_flight > 1:
+                    break
+                await asyncio.sleep(.01)
+            in_flight -= 1
+            return httpx.Response(200, json=results)
+        kb, _ = self.sparql_mock_store(
+            self.graph, handler, ahandler, concurrent=True)
+
+        async def afilter() -> set[Statement]:
+            return {stmt async for stmt in kb.afilter(wd.Brazil)}
+        stmts = set(source.filter(wd.Brazil))
+        self.assertEqual(set(kb.filter(wd.Brazil)), stmts)
+        self.assertGreater(max_in_flight, 1)
+        max_in_flight = 0
+        self.assertEqual(asyncio.run(afilter()), stmts)
+        self.assertGreater(max_in_flight, 1)
+        max_in_flight = 0
+        self.assertEqual(kb.count(wd.Brazil), len(stmts))
+        self.assertGreater(max_in_flight, 1)
+
+    def test_close(self) -> None:
+        kb = self.source(concurrent=True)
+        lock = threading.Lock()
+        started, closed = 0, 0
+        streams: list[Any] = []  # keep streams from being collected
+
+        def pages(*args: Any) -> Iterator[Any]:
+            nonlocal started, closed
+            with lock:
+                started += 1
+            try:
+                yield from type(kb)._build_filter_pages(kb, *args)
+            finally:
+                with lock:
+                    closed += 1
+
+        async def apages(*args: Any) -> AsyncIterator[Any]:
+            nonlocal started, closed
+            started += 1
+            try:
+                async for batch in type(kb)._abuild_filter_pages(kb, *args):
+                    yield batch
+            finally:
+                closed += 1
+
+        def build_filter_pages(*args: Any) -> Iterator[Any]:
+            streams.append(pages(*args))
+            return streams[-1]
+
+        def abuild_filter_pages(*args: Any) -> AsyncIterator[Any]:
+            streams.append(apages(*args))
+            return streams[-1]
+
+        async def afilter() -> list[Statement]:
+            return [stmt async for stmt in kb.afilter(wd.Brazil, limit=1)]
+        ###
+        # Early stops close the page stream of every disjoint query.
+        ###
+        with mock.patch.object(
+                kb, '_build_filter_pages', build_filter_pages):
+            self.assertEqual(len(list(kb.filter(wd.Brazil, limit=1))), 1)
+            for _ in range(500):
+                with lock:
+                    if closed == started:
+                        break
+                time.sleep(.01)
+            self.assertGreater(started, 1)
+            self.assertEqual(closed, started)
+        started, closed = 0, 0
+        with mock.patch.object(
+                kb, '_abuild_filter_pages', abuild_filter_pages):
+            self.assertEqual(len(asyncio.run(afilter())), 1)
+            self.assertGreater(started, 1)
+            self.assertEqual(closed, started)
+
+
+if __name__ == '__main__':
+    Test.main()
@@ -0,0 +1,101 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import threading
+
+import httpx
+
+from kif_lib import Graph
+from kif_lib.typing import Any
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    graph = Graph(*(wd.instance_of(wd.Q(i), wd.human) for i in range(10)))
+
+    def test_prefetch(self) -> None:
+        cond = threading.Condition()
+        wait, requests, in_flight, max_in_flight = False, 0, 0, 0
+
+        def handler(request: httpx.Request, results: Any) -> httpx.Response:
+            nonlocal requests, in_flight, max_in_flight
+            with cond:
+                requests += 1
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                cond.notify_all()
+                if wait and requests > 1:
+                    ###
+                    # The first page is fetched alone; the others wait
+                    # (up to a timeout) for an overlap.
+                    ###
+                    cond.wait_for(lambda: max_in_flight > 1, 5)
+                in_flight -= 1
+                cond.notify_all()
+            return httpx.Response(200, json=results)
+
+        def drain() -> int:
+            with cond:
+                cond.wait_for(lambda: in_flight == 0, 5)
+                return requests
+        kb, source = self.sparql_mock_store(self.graph, handler)
+        stmts = set(source.filter(value=wd.human))
+        self.assertEqual(len(stmts), 10)
+        with kb(page_size=2, lookahead=1):
+            self.assertEqual(set(kb.filter(value=wd.human)), stmts)
+        self.assertEqual(max_in_flight, 1)
+        n = requests
+        ###
+        # Prefetching is disabled by default.
+        ###
+        self.assertFalse(kb.prefetch)
+        requests = 0
+        with kb(page_size=2, lookahead=4):
+            self.assertEqual(set(kb.filter(value=wd.human)), stmts)
+        self.assertEqual(max_in_flight, 1)
+        self.assertEqual(requests, n)
+        ###
+        # Prefetching yields the same results but overlaps the requests
+        # (at most lookahead of which are past the last page).
+        ###
+        kb.prefetch = True
+        wait, requests = True, 0
+        with kb(page_size=2, lookahead=4):
+            self.assertEqual(set(kb.filter(value=wd.human)), stmts)
+        self.assertGreater(max_in_flight, 1)
+        self.assertLessEqual(drain(), n + 4)
+        wait = False
+        ###
+        # Single pages are not prefetched.
+        ###
+        with kb(page_size=20, lookahead=1):
+            requests = 0
+            self.assertEqual(set(kb.filter(value=wd.human)), stmts)
+            n = requests
+        with kb(page_size=20, lookahead=4):
+            requests = 0
+            self.assertEqual(set(kb.filter(value=wd.human)), stmts)
+            self.assertEqual(requests, n)
+        ###
+        # Limit and early close stop prefetching.  Requests are counted
+        # once those still in flight are done.
+        ###
+        with kb(page_size=2, lookahead=2):
+            requests = 0
+            self.assertEqual(len(list(kb.filter(
+                value=wd.human, limit=3))), 3)
+            self.assertLessEqual(drain(), 4)
+            requests = 0
+            it = kb.filter(value=wd.human)
+            next(it)
+            del it
+            self.assertLessEqual(drain(), 3)
+
+
+if __name__ == '__main__':
+    Test.main()
@@ -0,0 +1,135 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import tempfile
+import time
+
+import httpx
+
+from kif_lib import Graph, Statement, Store
+from kif_lib.store import HttpxSPARQL_Store
+from kif_lib.store.sparql import SPARQL_QueryCache
+from kif_lib.typing import Any
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    graph = Graph(
+        wd.instance_of(wd.Brazil, wd.country_),
+        wd.instance_of(wd.Argentina, wd.country_),
+        wd.label(wd.Brazil, 'Brazil'))
+
+    def test_get_set(self) -> None:
+        with tempfile.TemporaryDirectory() as dir:
+            path = pathlib.Path(dir) / 'cache.db'
+            cache = SPARQL_QueryCache(path)
+            key = cache.key('http://x.org/sparql', 'ASK {}')
+            self.assertNotEqual(
+                key, cache.key('http://y.org/sparql', 'ASK {}'))
+            self.assertEqual(
+                cache.key('http://x.org/sparql', 'ASK { ?x ?y _:N1 }'),
+                cache.key('http://x.org/sparql', 'ASK { ?x ?y _:N2 }'))
+            self.assertIsNone(cache.get(key))
+            cache.set(key, {'head': {}, 'boolean': True})
+            self.assertEqual(cache.get(key), {'head': {}, 'boolean': True})
+            ###
+            # Entries are visible to other connections (processes).
+            ###
+            other = SPARQL_QueryCache(path)
+            self.assertEqual(other.get(key), {'head': {}, 'boolean': True})
+            self.assertEqual(len(other), 1)
+            other.clear()
+            self.assertIsNone(cache.get(key))
+            cache.close()
+            other.close()
+
+    def test_max_size_ttl(self) -> None:
+        with tempfile.TemporaryDirectory() as dir:
+            path = pathlib.Path(dir) / 'cache.db'
+            results = {'head': {'vars': ['x']}, 'results': {'bindings': []}}
+            cache = SPARQL_QueryCache(path, max_size=100)
+            for i in range(5):
+                cache.set(str(i), results)
+                time.sleep(.01)
+            self.assertLess(len(cache), 5)
+            self.assertIsNotNone(cache.get('4'))
+            self.assertIsNone(cache.get('0'))
+            cache.close()
+            cache = SPARQL_QueryCache(path, ttl=.05)
+            cache.set('x', results)
+            self.assertIsNotNone(cache.get('x'))
+            time.sleep(.1)
+            self.assertIsNone(cache.get('x'))
+            cache.close()
+        self.assert_raises_bad_argument(
+            TypeError, 2, 'max_size', 'expected int, got str',
+            SPARQL_QueryCache, 'cache.db', max_size='x')
+        self.assert_raises_bad_argument(
+            ValueError, 2, 'max_size', 'expected a non-negative int',
+            SPARQL_QueryCache, 'cache.db', max_size=-1)
+        self.assert_raises_bad_argument(
+            TypeError, 3, 'ttl', 'expected float or int, got str',
+            SPARQL_QueryCache, 'cache.db', ttl='x')
+        for ttl in (0, -1., float('nan')):
+            self.assert_raises_bad_argument(
+                ValueError, 3, 'ttl', 'expected a positive number',
+                SPARQL_QueryCache, 'cache.db', ttl=ttl)
+        self.assert_raises_bad_argument(
+            ValueError, 4, 'timeout', 'expected a non-negative number',
+            SPARQL_QueryCache, 'cache.db', timeout=float('nan'))
+
+    def test_store(self) -> None:
+        requests = 0
+
+        def handler(request: httpx.Request, results: Any) -> httpx.Response:
+            nonlocal requests
+            requests += 1
+            return httpx.Response(200, json=results)
+
+        def KB(path: pathlib.Path) -> HttpxSPARQL_Store:
+            return self.sparql_mock_store(
+                self.graph, handler, query_cache=path)[0]
+        source = self.sparql_local_store(self.graph)
+
+        async def afilter(kb: Store, **kwargs: Any) -> set[Statement]:
+            return {stmt async for stmt in kb.afilter(**kwargs)}
+        with tempfile.TemporaryDirectory() as dir:
+            path = pathlib.Path(dir) / 'cache.db'
+            kb = KB(path)
+            stmts = set(kb.filter(value=wd.country_))
+            self.assertEqual(stmts, set(source.filter(value=wd.country_)))
+            self.assertEqual(
+                asyncio.run(afilter(kb, value=wd.country_)), stmts)
+            self.assertTrue(kb.ask(subject=wd.Brazil))
+            self.assertTrue(asyncio.run(kb.aask(subject=wd.Brazil)))
+            self.assertEqual(kb.count(subject=wd.Brazil), 2)
+            n = requests
+            self.assertGreater(n, 0)
+            ###
+            # Re-runs hit the disk instead of the endpoint.
+            ###
+            other = KB(path)
+            self.assertEqual(set(other.filter(value=wd.country_)), stmts)
+            self.assertEqual(
+                asyncio.run(afilter(other, value=wd.country_)), stmts)
+            self.assertTrue(other.ask(subject=wd.Brazil))
+            self.assertTrue(asyncio.run(other.aask(subject=wd.Brazil)))
+            self.assertEqual(other.count(subject=wd.Brazil), 2)
+            self.assertEqual(requests, n)
+            self.assertIsNotNone(other.query_cache)
+            assert other.query_cache is not None
+            other.query_cache.close()
+            assert kb.query_cache is not None
+            kb.query_cache.close()
+        self.assertIsNone(source.query_cache)
+
+
+if __name__ == '__main__':
+    Test.main()
@@ -0,0 +1,99 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+import httpx
+
+from kif_lib import Graph, Store
+from kif_lib.store import HttpxSPARQL_Store
+from kif_lib.typing import Any, Iterator
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    graph = Graph(*(wd.instance_of(wd.Q(i), wd.human) for i in range(10)))
+
+    def test_init(self) -> None:
+        kb = Store('sparql-httpx', 'http://example.org/sparql')
+        assert isinstance(kb, HttpxSPARQL_Store)
+        self.assertFalse(kb.streaming)
+        kb = Store(
+            'sparql-httpx', 'http://example.org/sparql', streaming=True)
+        assert isinstance(kb, HttpxSPARQL_Store)
+        self.assertTrue(kb.streaming)
+        kb.streaming = None
+        self.assertFalse(kb.streaming)
+
+    def test_filter(self) -> None:
+        sent, total = 0, 0
+
+        def handler(request: httpx.Request, results: Any) -> httpx.Response:
+            nonlocal total
+            bindings = results['results']['bindings']
+            total += len(bindings) + 2
+
+            def content() -> Iterator[bytes]:
+                nonlocal sent
+                head = json.dumps(results['head'])
+                sent += 1
+                yield f'{{"head": {head}, "results": {{"bindings": ['.encode()
+                for i, binding in enumerate(bindings):
+                    sent += 1
+                    yield ((', ' if i else '') + json.dumps(binding)).encode()
+                sent += 1
+                yield b']}}'
+            return httpx.Response(200, content=content())
+        kb, source = self.sparql_mock_store(
+            self.graph, handler, streaming=True)
+        stmts = set(source.filter(value=wd.human))
+        self.assertEqual(len(stmts), 10)
+        with kb(page_size=3):
+            self.assertEqual(set(kb.filter(value=wd.human)), stmts)
+        with kb(page_size=100):
+            sent, total = 0, 0
+            it = kb.filter(value=wd.human)
+            self.assertIn(next(it), stmts)
+            ###
+            # The first statement is produced before the rest of the page
+            # is sent.
+            ###
+            self.assertLess(sent, total)
+            self.assertEqual(len(set(it)), 9)
+        ###
+        # Early stops release the response of the current page.
+        ###
+        opened, closed = 0, 0
+        streams: list[Iterator[str]] = []  # keep them from being collected
+        Backend = HttpxSPARQL_Store.HttpxBackend
+        post_stream = Backend._http_post_stream
+
+        def chunks(*args: Any) -> Iterator[str]:
+            nonlocal opened, closed
+            opened += 1
+            try:
+                yield from post_stream(*args)
+            finally:
+                closed += 1
+
+        def http_post_stream(*args: Any) -> Iterator[str]:
+            streams.append(chunks(*args))
+            return streams[-1]
+        with mock.patch.object(
+                Backend, '_http_post_stream', autospec=True,
+                side_effect=http_post_stream):
+            with kb(page_size=3):
+                self.assertEqual(len(list(kb.filter(
+                    value=wd.human, limit=4))), 4)
+                self.assertEqual(opened, 2)
+                self.assertEqual(closed, 2)
+
+
+if __name__ == '__main__':
+    Test.main()
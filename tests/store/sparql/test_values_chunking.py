@@ -0,0 +1,152 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+
+from kif_lib import Filter, Graph, Statement
+from kif_lib.compiler.sparql import SPARQL_FilterCompiler
+from kif_lib.model import OrFingerprint
+from kif_lib.store import RDFLibSPARQL_Store
+from kif_lib.typing import Any
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    graph = Graph(
+        *(wd.instance_of(wd.Q(i), wd.human) for i in range(1, 8)),
+        *(wd.instance_of(wd.Q(i), wd.country_) for i in range(8, 11)))
+
+    filters = (
+        Filter(OrFingerprint(*map(wd.Q, range(1, 11))), wd.instance_of),
+        Filter(OrFingerprint(*map(wd.Q, range(1, 11))),
+               value=wd.human | wd.country_))
+
+    def source(self, **kwargs: Any) -> RDFLibSPARQL_Store:
+        return self.sparql_local_store(self.graph, **kwargs)
+
+    def test_init(self) -> None:
+        self.assertEqual(self.source().values_chunk_size, 0)
+        kb = self.source(values_chunk_size=3)
+        self.assertEqual(kb.values_chunk_size, 3)
+        kb.values_chunk_size = None
+        self.assertEqual(kb.values_chunk_size, 0)
+        self.assertRaises(TypeError, kb.set_values_chunk_size, 'abc')
+
+    def test_split_filter_values(self) -> None:
+        P = SPARQL_FilterCompiler.Projection
+        kb = self.source(values_chunk_size=3)
+        filter = self.filters[1]
+        chunks = kb._split_filter_values(filter, P.ALL)
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(
+            [len(chunk.subject.args) for chunk in chunks], [3, 3, 3, 1])
+        self.assertTrue(all(
+            chunk.replace(subject=filter.subject) == filter
+            for chunk in chunks))
+        ###
+        # Disjunctions on positions not projected are not split.
+        ###
+        self.assertEqual(
+            kb._split_filter_values(filter, P.VALUE), (filter,))
+        ###
+        # Disjunctions of at most values_chunk_size values are not split.
+        ###
+        self.assertEqual(kb._split_filter_values(
+            filter.replace(wd.Q(1) | wd.Q(2)), P.ALL),
+            (filter.replace(wd.Q(1) | wd.Q(2)),))
+        kb.values_chunk_size = None
+        self.assertEqual(kb._split_filter_values(filter, P.ALL), (filter,))
+
+    def test_chunks(self) -> None:
+        kb = self.source(values_chunk_size=3)
+        with mock.patch.object(
+                type(kb), '_compile_filter_tail',
+                autospec=True,
+                side_effect=type(kb)._compile_filter_tail) as tail:
+            self.assertEqual(len(list(kb.filter(filter=self.filters[0]))), 10)
+            self.assertEqual(tail.call_count, 4)
+            kb.values_chunk_size = 5
+            self.assertEqual(kb.count(filter=self.filters[0]), 10)
+            self.assertEqual(tail.call_count, 6)
+
+    def test_filter(self) -> None:
+        seq = self.source()
+        for concurrent in (False, True):
+            kb = self.source(values_chunk_size=3, concurrent=concurrent)
+            for filter in self.filters:
+                stmts = set(seq.filter(filter=filter))
+                self.assertEqual(len(stmts), 10)
+                with kb(page_size=2):
+                    self.assertEqual(set(kb.filter(filter=filter)), stmts)
+                    self.assertEqual(
+                        set(kb.filter_s(filter=filter)),
+                        set(seq.filter_s(filter=filter)))
+                    self.assertEqual(
+                        set(kb.filter_v(filter=filter)),
+                        set(seq.filter_v(filter=filter)))
+                    self.assertEqual(len(list(kb.filter(
+                        filter=filter, limit=4))), 4)
+                    self.assertEqual(kb.count(filter=filter), 10)
+                    self.assertEqual(
+                        kb.count_v(filter=filter), seq.count_v(filter=filter))
+                    self.assertTrue(kb.ask(filter=filter))
+                    self.assertFalse(kb.ask(filter=filter.replace(
+                        property=wd.part_of)))
+
+    def test_concurrent(self) -> None:
+        ###
+        # Chunks are evaluated in the thread pool of store even if the
+        # concurrent flag is not set.
+        ###
+        kb = self.source(values_chunk_size=3)
+        self.assertFalse(kb.concurrent)
+        with mock.patch.object(
+                type(kb), '_get_thread_pool',
+                autospec=True,
+                side_effect=type(kb)._get_thread_pool) as pool:
+            with mock.patch.object(
+                    type(kb), '_filter_with_projection_concurrent',
+                    autospec=True,
+                    side_effect=type(
+                        kb)._filter_with_projection_concurrent) as conc:
+                with kb(page_size=2):
+                    self.assertEqual(
+                        len(list(kb.filter(filter=self.filters[0]))), 10)
+                    self.assertEqual(conc.call_count, 1)
+                    self.assertEqual(kb.count(filter=self.filters[0]), 10)
+                    n = pool.call_count
+                    self.assertGreater(n, 0)
+                    kb.values_chunk_size = None
+                    self.assertEqual(
+                        len(list(kb.filter(filter=self.filters[0]))), 10)
+                    self.assertEqual(kb.count(filter=self.filters[0]), 10)
+                    self.assertEqual(conc.call_count, 1)
+                    self.assertEqual(pool.call_count, n)
+
+    def test_afilter(self) -> None:
+        seq = self.source()
+
+        async def afilter(
+                kb: RDFLibSPARQL_Store,
+                filter: Filter
+        ) -> tuple[set[Statement], int, bool]:
+            return ({stmt async for stmt in kb.afilter(filter=filter)},
+                    await kb.acount(filter=filter),
+                    await kb.aask(filter=filter))
+        for concurrent in (False, True):
+            kb = self.source(values_chunk_size=3, concurrent=concurrent)
+            for filter in self.filters:
+                stmts = set(seq.filter(filter=filter))
+                with kb(page_size=2):
+                    self.assertEqual(
+                        asyncio.run(afilter(kb, filter)), (stmts, 10, True))
+
+
+if __name__ == '__main__':
+    Test.main()
@@ -0,0 +1,55 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+
+from kif_lib import Store, Time
+from kif_lib.typing import Sequence
+from kif_lib.vocabulary import wd
+
+from ..tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    stmts = [
+        wd.instance_of(wd.Brazil, wd.country_),
+        wd.instance_of(wd.Argentina, wd.country_),
+        wd.label(wd.Brazil, 'Brazil'),
+        wd.instance_of(wd.Adam, wd.human),
+        wd.family_name.some_value(wd.Adam),
+        wd.date_of_birth(wd.Adam, Time('1900-01-01'))]
+
+    queries = stmts + [
+        wd.instance_of(wd.Brazil, wd.human),
+        wd.instance_of(wd.Adam, wd.country_),
+        wd.label(wd.Brazil, 'Brasil'),
+        wd.family_name.no_value(wd.Adam),
+        wd.family_name.some_value(wd.Brazil),
+        wd.date_of_birth(wd.Adam, Time('1901-01-01'))]
+
+    def KBs(self) -> Sequence[Store]:
+        return (
+            Store('memory', *self.stmts),
+            Store('wikidata-rdf', graph=self.stmts),
+            Store('mixer', [Store('memory', *self.stmts)]))
+
+    def test_contains_many(self) -> None:
+        expected = [True] * len(self.stmts) + [False] * (
+            len(self.queries) - len(self.stmts))
+        for kb in self.KBs():
+            self.assertEqual(
+                kb.contains_many(self.queries),
+                [kb.contains(stmt) for stmt in self.queries])
+            self.assertEqual(kb.contains_many(self.queries), expected)
+            self.assertEqual(kb.contains_many([]), [])
+            with kb(page_size=2):
+                self.assertEqual(kb.contains_many(self.queries), expected)
+
+    def test_acontains_many(self) -> None:
+        for kb in self.KBs():
+            self.assertEqual(
+                asyncio.run(kb.acontains_many(self.queries)),
+                kb.contains_many(self.queries))
@@ -0,0 +1,127 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+
+from kif_lib import Filter, Statement, Store, Text
+from kif_lib.typing import Sequence
+from kif_lib.vocabulary import wd
+
+from ..tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    stmts = [
+        wd.instance_of(wd.Brazil, wd.country_),
+        wd.instance_of(wd.Argentina, wd.country_),
+        wd.instance_of(wd.Adam, wd.human),
+        wd.label(wd.Brazil, 'Brazil'),
+        wd.label(wd.Brazil, Text('Brasil', 'pt'))]
+
+    filters = [
+        Filter(wd.Brazil, wd.instance_of),
+        Filter(wd.Argentina, wd.instance_of),
+        Filter(wd.Adam, wd.instance_of),
+        Filter(wd.Brazil, wd.instance_of),
+        Filter(wd.Q(1), wd.instance_of),
+        Filter(wd.Brazil),
+        Filter(property=wd.instance_of, value=wd.human),
+        Filter(snak_mask=Filter.SnakMask(0))]
+
+    def KBs(self) -> Sequence[Store]:
+        return (
+            Store('memory', *self.stmts),
+            Store('wikidata-rdf', graph=self.stmts))
+
+    def expected(self, kb: Store) -> list[set[Statement]]:
+        return [set(kb.filter(filter=f)) for f in self.filters]
+
+    def test_filter_many(self) -> None:
+        for kb in self.KBs():
+            expected = self.expected(kb)
+            got: list[set[Statement]] = [set() for _ in self.filters]
+            for filter, stmt in kb.filter_many(self.filters):
+                got[next(i for i, f in enumerate(self.filters)
+                         if f is filter)].add(stmt)
+            self.assertEqual(got, expected)
+            self.assertEqual(
+                len(list(kb.filter_many(self.filters[:2], limit=1))), 2)
+            ###
+            # Filters with the same subject are merged.
+            ###
+            batches = list(kb._filter_many_batches(
+                [kb._check_filter(filter=f) for f in self.filters],
+                kb.options))
+            self.assertEqual(len(batches), 3)
+            self.assertEqual(batches[0][1], 'subject')
+
+    def test_filter_many_max_limit(self) -> None:
+        filters = [Filter(wd.Brazil), Filter(wd.Adam), Filter(wd.Argentina)]
+        for kb in self.KBs():
+            full = [set(kb.filter(filter=f)) for f in filters]
+            kb.options.max_limit = 1
+            got: list[set[Statement]] = [set() for _ in filters]
+            for filter, stmt in kb.filter_many(filters):
+                got[filters.index(filter)].add(stmt)
+            self.assertEqual(list(map(len, got)), [1, 1, 1])
+            self.assertTrue(all(g <= f for g, f in zip(got, full)))
+
+    def test_afilter_many(self) -> None:
+        async def afilter_many(kb: Store) -> set[tuple[Filter, Statement]]:
+            return {t async for t in kb.afilter_many(
+                self.filters, lookahead=2)}
+        for kb in self.KBs():
+            self.assertEqual(
+                asyncio.run(afilter_many(kb)),
+                set(kb.filter_many(self.filters)))
+
+    def test_count_many(self) -> None:
+        for kb in self.KBs():
+            counts = [1, 1, 1, 1, 0, 3, 1, 0]
+            self.assertEqual(kb.count_many(self.filters), counts)
+            self.assertEqual(
+                asyncio.run(kb.acount_many(self.filters, lookahead=3)),
+                counts)
+
+    def test_count_many_merged(self) -> None:
+        filters = [
+            Filter(x, p) for x in (wd.Brazil, wd.Argentina, wd.Q(1))
+            for p in (wd.instance_of, wd.label)]
+        filters.append(Filter(property=wd.instance_of, value=wd.human))
+        filters.append(Filter(property=wd.instance_of, value=wd.country_))
+        for kb in self.KBs():
+            counts = [kb.count(filter=f) for f in filters]
+            ###
+            # Merged filters are counted by grouping their statements,
+            # unless these do not fit in page_size per filter.
+            ###
+            with mock.patch.object(
+                    kb, '_count', side_effect=AssertionError):
+                self.assertEqual(kb.count_many(filters), counts)
+            for page_size in (1, 2):
+                for lookahead in (1, 3):
+                    self.assertEqual(kb.count_many(
+                        filters, page_size=page_size, lookahead=lookahead),
+                        counts)
+                    self.assertEqual(asyncio.run(kb.acount_many(
+                        filters, page_size=page_size, lookahead=lookahead)),
+                        counts)
+
+    def test_ask_many(self) -> None:
+        for kb in self.KBs():
+            status = [True, True, True, True, False, True, True, False]
+            self.assertEqual(kb.ask_many(self.filters), status)
+            self.assertEqual(
+                asyncio.run(kb.aask_many(self.filters, lookahead=3)),
+                status)
+        self.assert_raises_bad_argument(
+            TypeError, 1, 'filters', 'cannot coerce int into Filter',
+            Store('empty').ask_many, [0])
+
+
+if __name__ == '__main__':
+    Test.main()
@@ -0,0 +1,95 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from kif_lib import Filter, Graph, Store
+from kif_lib.compiler.sparql import SPARQL_FilterCompiler
+from kif_lib.compiler.sparql.mapping.wikidata import WikidataMapping
+from kif_lib.vocabulary import wd
+
+from ....tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+    """Snak fingerprints with the same property (aggregated)."""
+
+    graph = Graph(
+        wd.instance_of(wd.Q(1), wd.human),
+        wd.instance_of(wd.Q(1), wd.country_),
+        wd.instance_of(wd.Q(2), wd.human),
+        wd.instance_of(wd.Q(3), wd.country_),
+        wd.part_of(wd.Q(3), wd.Latin_America),
+        wd.instance_of(wd.Q(4), wd.human),
+        wd.instance_of(wd.Q(4), wd.country_),
+        wd.instance_of(wd.Q(4), wd.Q(100)),
+        wd.part_of(wd.Q(4), wd.Latin_America))
+
+    @classmethod
+    def KB(cls) -> Store:
+        return Store('wikidata-rdf', graph=cls.graph)
+
+    def compile(self, filter: Filter) -> str:
+        c = SPARQL_FilterCompiler(filter.normalize(), WikidataMapping())
+        c.compile()
+        return '\n'.join(map(str, map(c.build_query, c.query_stack)))
+
+    def test_or(self) -> None:
+        xf, F = self.store_xfilter_assertion(self.KB())
+        xf(F(wd.instance_of(wd.country_)
+             | wd.instance_of(wd.Q(100))
+             | wd.instance_of(wd.Q(101)),
+             wd.part_of),
+           {wd.part_of(wd.Q(3), wd.Latin_America),
+            wd.part_of(wd.Q(4), wd.Latin_America)})
+        xf(F(wd.instance_of(wd.human)
+             | wd.part_of(wd.Latin_America)
+             | wd.instance_of(wd.Q(100)),
+             wd.part_of),
+           {wd.part_of(wd.Q(3), wd.Latin_America),
+            wd.part_of(wd.Q(4), wd.Latin_America)})
+
+    def test_and(self) -> None:
+        xf, F = self.store_xfilter_assertion(self.KB())
+        xf(F(wd.instance_of(wd.human) & wd.instance_of(wd.country_),
+             wd.instance_of, wd.human),
+           {wd.instance_of(wd.Q(1), wd.human),
+            wd.instance_of(wd.Q(4), wd.human)})
+        xf(F(wd.instance_of(wd.human)
+             & wd.instance_of(wd.country_)
+             & wd.instance_of(wd.Q(100)),
+             wd.instance_of, wd.human),
+           {wd.instance_of(wd.Q(4), wd.human)})
+        xf(F(wd.instance_of(wd.human)
+             & wd.instance_of(wd.country_)
+             & wd.part_of(wd.Latin_America),
+             wd.part_of),
+           {wd.part_of(wd.Q(4), wd.Latin_America)})
+        xf(F(wd.instance_of(wd.human) & wd.instance_of(wd.Q(101)),
+             wd.instance_of), set())
+        xf(F(wd.instance_of(wd.human) & wd.instance_of(wd.country_)
+             & (wd.part_of(wd.Latin_America) | wd.instance_of(wd.Q(100))),
+             wd.instance_of, wd.human),
+           {wd.instance_of(wd.Q(4), wd.human)})
+
+    def test_and_query(self) -> None:
+        F = Filter
+        ###
+        # Each group becomes a single statement pattern nested in two
+        # FILTER NOT EXISTS clauses.
+        ###
+        text = self.compile(F(
+            wd.instance_of(wd.human) & wd.instance_of(wd.country_),
+            wd.instance_of))
+        n = text.count('FILTER NOT EXISTS')
+        self.assertGreater(n, 0)
+        self.assertEqual(n % 2, 0)
+        self.assertEqual(text.count(wd.country_.iri.content), n // 2)
+        text = self.compile(F(
+            wd.instance_of(wd.human) & wd.part_of(wd.Latin_America),
+            wd.instance_of))
+        self.assertNotIn('FILTER NOT EXISTS', text)
+
+
+if __name__ == '__main__':
+    Test.main()
@@ -0,0 +1,194 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import time
+
+from kif_lib import Filter, Graph, Item, Store
+from kif_lib.compiler.sparql import SPARQL_FilterCompiler
+from kif_lib.compiler.sparql.mapping.factgrid import FactGridMapping
+from kif_lib.compiler.sparql.mapping.wikidata import WikidataMapping
+from kif_lib.namespace.factgrid import FactGrid
+from kif_lib.rdflib import URIRef
+from kif_lib.typing import Any, Iterable, Sequence
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+ClassHierarchy = WikidataMapping.ClassHierarchy
+
+
+class Test(StoreTestCase):
+
+    graph = Graph(
+        wd.instance_of(wd.Brazil, wd.country_),
+        wd.instance_of(wd.Q(3), wd.Q(2)),
+        wd.instance_of(wd.Q(4), wd.Q(5)),
+        wd.subclass_of(wd.country_, wd.Q(1)),
+        wd.subclass_of(wd.Q(1), wd.Q(2)),
+        wd.subclass_of(wd.Q(2), wd.Q(1)))  # cycle
+
+    @classmethod
+    def uri(cls, item: Item) -> URIRef:
+        return URIRef(item.iri.content)
+
+    def test_closure(self) -> None:
+        edges = [(wd.Q(2).iri.content, wd.Q(1).iri.content),
+                 (wd.Q(3).iri.content, wd.Q(2).iri.content),
+                 (wd.Q(4).iri.content, wd.Q(2).iri.content)]
+        h = ClassHierarchy.from_edges(edges)
+        self.assertEqual(
+            h.get(self.uri(wd.Q(1))),
+            set(map(self.uri, (wd.Q(1), wd.Q(2), wd.Q(3), wd.Q(4)))))
+        self.assertEqual(h.get(self.uri(wd.Q(3))), {self.uri(wd.Q(3))})
+        self.assertEqual(len(h), 5)
+        h.clear()
+        self.assertEqual(len(h), 0)
+        ###
+        # Closures larger than max_closure_size are not used.
+        ###
+        h = ClassHierarchy.from_edges(edges, max_closure_size=3)
+        self.assertIsNone(h.get(self.uri(wd.Q(1))))
+        self.assertIsNotNone(h.get(self.uri(wd.Q(2))))
+        ###
+        # Least-recently used closures are evicted first.
+        ###
+        h = ClassHierarchy.from_edges(edges, max_size=4)
+        h.get(self.uri(wd.Q(2)))
+        h.get(self.uri(wd.Q(3)))
+        self.assertEqual(set(h._cache), {self.uri(wd.Q(2)), self.uri(wd.Q(3))})
+        h.get(self.uri(wd.Q(1)))
+        self.assertEqual(set(h._cache), {self.uri(wd.Q(1))})
+
+    def test_ttl(self) -> None:
+        calls = 0
+
+        def subclasses(batch: Sequence[URIRef]) -> Iterable[URIRef]:
+            nonlocal calls
+            calls += 1
+            return ()
+        h = ClassHierarchy(subclasses, ttl=.05)
+        h.get(self.uri(wd.Q(1)))
+        h.get(self.uri(wd.Q(1)))
+        self.assertEqual(calls, 1)
+        time.sleep(.1)
+        h.get(self.uri(wd.Q(1)))
+        self.assertEqual(calls, 2)
+        self.assertEqual(len(h), 1)
+
+    def test_filter(self) -> None:
+        kb = Store('wikidata-rdf', graph=self.graph)
+        h = ClassHierarchy.from_store(kb, batch_size=1)
+        other = Store('wikidata-rdf', graph=self.graph, class_hierarchy=h)
+        tests: list[dict[str, Any]] = [
+            {'property': wd.type, 'value': wd.Q(1)},
+            {'property': wd.type, 'value': wd.Q(5)},
+            {'subject': wd.Brazil, 'property': wd.type},
+            {'property': wd.subtype, 'value': wd.Q(1)},
+            {'property': wd.subtype, 'value': wd.country_},
+            {'subject': wd.Q(1), 'property': wd.subtype},
+        ]
+        for kwargs in tests:
+            self.assertEqual(
+                set(other.filter(**kwargs)), set(kb.filter(**kwargs)),
+                kwargs)
+        self.assertEqual(
+            set(other.filter_s(property=wd.type, value=wd.Q(2))),
+            {wd.Brazil, wd.Q(3)})
+        self.assertEqual(
+            set(other.filter_s(property=wd.subtype, value=wd.Q(2))),
+            {wd.country_, wd.Q(1), wd.Q(2)})
+        self.assertEqual(h.get(self.uri(wd.Q(2))), set(map(
+            self.uri, (wd.country_, wd.Q(1), wd.Q(2)))))
+
+    def compile(self, filter: Filter, mapping: WikidataMapping) -> str:
+        compiler = SPARQL_FilterCompiler(filter.normalize(), mapping)
+        compiler.compile()
+        return '\n'.join(map(str, compiler.query_stack))
+
+    def assert_equivalent(
+            self,
+            kb: Store,
+            other: Store,
+            classes: Iterable[Item],
+            subjects: Iterable[Item]
+    ) -> None:
+        filters = [Filter(property=wd.type), Filter(property=wd.subtype)]
+        for x in classes:
+            filters.append(Filter(property=wd.type, value=x))
+            filters.append(Filter(property=wd.subtype, value=x))
+            filters.append(Filter(x | wd.Brazil, wd.type | wd.subtype))
+        for x in subjects:
+            filters.append(Filter(x, wd.type))
+            filters.append(Filter(x, wd.subtype))
+        for filter in filters:
+            self.assertEqual(
+                set(other.filter(filter=filter)),
+                set(kb.filter(filter=filter)), filter)
+            self.assertEqual(
+                set(other.filter_s(filter=filter)),
+                set(kb.filter_s(filter=filter)), filter)
+            self.assertEqual(
+                set(other.filter_v(filter=filter)),
+                set(kb.filter_v(filter=filter)), filter)
+            self.assertEqual(
+                other.count(filter=filter), kb.count(filter=filter), filter)
+
+    def test_equivalence(self) -> None:
+        kb = Store('wikidata-rdf', graph=self.graph)
+        h = ClassHierarchy.from_store(kb)
+        other = Store('wikidata-rdf', graph=self.graph, class_hierarchy=h)
+        items = (wd.Brazil, wd.country_, *map(wd.Q, range(1, 6)))
+        self.assert_equivalent(kb, other, items, items)
+        ###
+        # The closure is used only for constant values.
+        ###
+        mapping = WikidataMapping(class_hierarchy=h)
+        for property in (wd.type, wd.subtype):
+            filter = Filter(property=property, value=wd.Q(1))
+            self.assertNotIn('VALUES', self.compile(filter, WikidataMapping()))
+            self.assertIn('VALUES', self.compile(filter, mapping))
+            self.assertNotIn('VALUES', self.compile(
+                Filter(wd.Brazil, property), mapping))
+
+    def test_factgrid(self) -> None:
+        WD, WDT = FactGrid.WD, FactGrid.WDT
+        data = f'''
+@prefix wd: <{WD}> .
+@prefix wdt: <{WDT}> .
+@prefix wikibase: <http://wikiba.se/ontology#> .
+wd:Q10 wdt:P2 wd:Q20 ; wikibase:sitelinks 0 .
+wd:Q11 wdt:P2 wd:Q21 ; wikibase:sitelinks 0 .
+wd:Q12 wdt:P2 wd:Q23 ; wikibase:sitelinks 0 .
+wd:Q20 wdt:P420 wd:Q21 ; wikibase:sitelinks 0 .
+wd:Q21 wdt:P420 wd:Q22 ; wikibase:sitelinks 0 .
+wd:Q22 wdt:P420 wd:Q21 ; wikibase:sitelinks 0 .
+wd:Q23 wikibase:sitelinks 0 .
+'''
+        kb = Store('rdf', data=data, format='ttl', mapping=FactGridMapping())
+        h = ClassHierarchy.from_edges([
+            (WD.Q20, WD.Q21), (WD.Q21, WD.Q22), (WD.Q22, WD.Q21)])
+        other = Store(
+            'rdf', data=data, format='ttl',
+            mapping=FactGridMapping(class_hierarchy=h))
+        items = [Item(WD[f'Q{i}']) for i in (10, 11, 12, 20, 21, 22, 23)]
+        self.assert_equivalent(kb, other, items[3:], items)
+        self.assertEqual(
+            set(other.filter_s(property=wd.type, value=items[5])),
+            set(items[:2]))
+        self.assertEqual(h.get(URIRef(WD.Q22)), set(map(
+            URIRef, (WD.Q20, WD.Q21, WD.Q22))))
+        ###
+        # The closure is matched against the FactGrid edges (P2 and P420).
+        ###
+        mapping = FactGridMapping(class_hierarchy=h)
+        for property, edge in ((wd.type, WDT.P2), (wd.subtype, WDT.P420)):
+            text = self.compile(Filter(
+                property=property, value=items[5]), mapping)
+            self.assertIn('VALUES', text)
+            self.assertIn(f'<{edge}>', text)
+
+
+if __name__ == '__main__':
+    Test.main()
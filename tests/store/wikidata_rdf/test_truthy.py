@@ -0,0 +1,93 @@
+# Copyright (C) 2025 IBM Corp.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from kif_lib import ExternalId, Filter, Graph, IRI, Quantity, Store, Text, Time
+from kif_lib.compiler.sparql import SPARQL_FilterCompiler
+from kif_lib.compiler.sparql.mapping.wikidata import WikidataMapping
+from kif_lib.typing import Any
+from kif_lib.vocabulary import wd
+
+from ...tests import StoreTestCase
+
+
+class Test(StoreTestCase):
+
+    graph = Graph(
+        wd.instance_of(wd.Brazil, wd.country_),
+        wd.official_website(wd.Brazil, IRI('https://www.gov.br')),
+        wd.official_name(wd.Brazil, Text('Brasil', 'pt')),
+        wd.PubChem_CID(wd.benzene, ExternalId('241')),
+        wd.mass(wd.benzene, Quantity('78.046950192', wd.dalton)),
+        wd.inception(wd.Brazil, Time('1822-09-07')),
+        wd.instance_of.some_value(wd.Adam),
+        wd.date_of_death.no_value(wd.Brazil))
+
+    filters = (
+        Filter(),
+        Filter(wd.Brazil),
+        Filter(wd.benzene),
+        Filter(property=wd.instance_of),
+        Filter(value=wd.country_),
+        Filter(snak_mask=Filter.SOME_VALUE_SNAK),
+        Filter(snak_mask=Filter.NO_VALUE_SNAK),
+        Filter(value_mask=Filter.QUANTITY | Filter.TIME))
+
+    def KB(self, **kwargs: Any) -> Store:
+        return Store('wikidata-rdf', graph=self.graph, **kwargs)
+
+    def compile(self, filter: Filter, **kwargs: Any) -> str:
+        compiler = SPARQL_FilterCompiler(
+            filter.normalize(), WikidataMapping(**kwargs))
+        compiler.compile()
+        return '\n'.join(map(str, compiler.query_stack))
+
+    def test_filter(self) -> None:
+        kb = self.KB()
+        truthy = self.KB(truthy=Filter.VALUE)
+        for filter in self.filters:
+            stmts = set(kb.filter(filter=filter))
+            self.assertEqual(set(truthy.filter(filter=filter)), stmts)
+            self.assertEqual(truthy.count(filter=filter), len(stmts))
+            self.assertEqual(
+                set(truthy.filter_v(filter=filter)),
+                set(kb.filter_v(filter=filter)))
+        self.assertEqual(
+            set(truthy.filter_annotated(wd.Brazil)),
+            set(kb.filter_annotated(wd.Brazil)))
+        filter = Filter(wd.Brazil, best_ranked=False)
+        self.assertEqual(
+            set(truthy.filter(filter=filter)), set(kb.filter(filter=filter)))
+
+    def test_compile(self) -> None:
+        wdt = wd.instance_of.iri.content.replace('/entity/', '/prop/direct/')
+        ps = wd.instance_of.iri.content.replace('/entity/', '/prop/statement/')
+        filter = Filter(wd.Brazil, wd.instance_of, snak_mask=Filter.VALUE_SNAK)
+        text = self.compile(filter)
+        self.assertNotIn(wdt, text)
+        self.assertIn(ps, text)
+        for truthy in (Filter.ITEM, Filter.VALUE):
+            text = self.compile(filter, truthy=truthy)
+            self.assertIn(wdt, text)
+            self.assertNotIn(ps, text)
+        ###
+        # Only the datatypes in the truthy mask use the fast path.
+        ###
+        self.assertNotIn(wdt, self.compile(filter, truthy=Filter.TEXT))
+        self.assertNotIn(wdt, self.compile(
+            filter.replace(value_mask=Filter.QUANTITY), truthy=Filter.VALUE))
+        ###
+        # Annotated filters, filters which are not best-ranked, and
+        # filters restricted to some ranks do not use the fast path.
+        ###
+        self.assertNotIn(wdt, self.compile(
+            filter.replace(annotated=True), truthy=Filter.VALUE))
+        self.assertNotIn(wdt, self.compile(
+            filter.replace(best_ranked=False), truthy=Filter.VALUE))
+        self.assertNotIn(wdt, self.compile(
+            filter.replace(rank_mask=Filter.PREFERRED), truthy=Filter.VALUE))
+
+
+if __name__ == '__main__':
+    Test.main()
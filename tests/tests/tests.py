@@ -10,8 +10,11 @@ import logging
 import os
 import pathlib
 import re
+import threading
 import unittest
 
+import httpx
+
 from kif_lib import (
     AliasProperty,
     AnnotatedStatement,
@@ -88,6 +91,7 @@ from kif_lib import (
     ValueSnak,
     Variable,
 )
+from kif_lib.compiler.sparql.results import SPARQL_Results
 from kif_lib.context import Section
 from kif_lib.model import (
     AndFingerprint,
@@ -161,8 +165,10 @@ from kif_lib.model.value.quantity import VTQuantityContent
 from kif_lib.model.value.string import VTStringContent
 from kif_lib.model.value.time import VTTimeContent
 from kif_lib.namespace import XSD
+from kif_lib.store import HttpxSPARQL_Store, MixerStore, RDFLibSPARQL_Store
 from kif_lib.typing import (
     Any,
+    Awaitable,
     Callable,
     cast,
     ClassVar,
@@ -1609,6 +1615,89 @@ class StoreTestCase(TestCase):
                 self.assertEqual(
                     getattr(store, 'get_' + name)(output), output)
 
+    #: Alias for the type of mock SPARQL endpoint handlers.
+    _TSPARQL_MockHandler: TypeAlias = Callable[
+        [httpx.Request, SPARQL_Results], httpx.Response]
+
+    #: Alias for the type of async mock SPARQL endpoint handlers.
+    _TSPARQL_MockAsyncHandler: TypeAlias = Callable[
+        [httpx.Request, SPARQL_Results], Awaitable[httpx.Response]]
+
+    def sparql_local_store(
+            self,
+            graph: Graph,
+            **kwargs: Any
+    ) -> RDFLibSPARQL_Store:
+        """Constructs a local Wikidata SPARQL store over `graph`.
+
+        Parameters:
+           graph: Graph.
+           kwargs: Other keyword arguments.
+
+        Returns:
+           RDFLib SPARQL store.
+        """
+        kb = Store('wikidata-rdf', graph=graph, **kwargs)
+        assert isinstance(kb, MixerStore)
+        source = next(iter(kb.sources))
+        assert isinstance(source, RDFLibSPARQL_Store)
+        return source
+
+    def sparql_mock_store(
+            self,
+            graph: Graph,
+            handler: _TSPARQL_MockHandler | None = None,
+            ahandler: _TSPARQL_MockAsyncHandler | None = None,
+            **kwargs: Any
+    ) -> tuple[HttpxSPARQL_Store, RDFLibSPARQL_Store]:
+        """Constructs an httpx SPARQL store backed by a mock endpoint.
+
+        The mock endpoint evaluates each query it receives over a local
+        Wikidata SPARQL store over `graph` and passes the request and its
+        results to `handler` (or to `ahandler`, if given, in the case of
+        async requests), which constructs the response.
+
+        Parameters:
+           graph: Graph.
+           handler: Request handler.
+           ahandler: Async request handler.
+           kwargs: Other keyword arguments (passed to the httpx store).
+
+        Returns:
+           The httpx SPARQL store and the local SPARQL store.
+        """
+        source = self.sparql_local_store(graph)
+        lock = threading.Lock()
+
+        def select(request: httpx.Request) -> SPARQL_Results:
+            with lock:
+                return source.backend._select(
+                    request.content.decode('utf-8'))
+
+        def default_handler(
+                request: httpx.Request,
+                results: SPARQL_Results
+        ) -> httpx.Response:
+            return httpx.Response(200, json=results)
+        sync_handler = handler if handler is not None else default_handler
+
+        def mock_handler(request: httpx.Request) -> httpx.Response:
+            return sync_handler(request, select(request))
+
+        async def mock_ahandler(request: httpx.Request) -> httpx.Response:
+            results = await asyncio.to_thread(select, request)
+            if ahandler is None:
+                return sync_handler(request, results)
+            return await ahandler(request, results)
+        kb = Store('sparql-httpx', 'http://example.org/sparql', **kwargs)
+        assert isinstance(kb, HttpxSPARQL_Store)
+        assert isinstance(kb.backend, HttpxSPARQL_Store.HttpxBackend)
+        kb.backend._client = httpx.Client(
+            transport=httpx.MockTransport(mock_handler))
+        kb.backend._aclient = httpx.AsyncClient(
+            transport=httpx.MockTransport(mock_ahandler))
+        return kb, source
+
     def store_ask_assertion(
             self,
             store: Store